@@ -0,0 +1,85 @@
+"""
+benchmarks/bench_propagation.py
+Counts and times the model calls made when a change of stored data is propagated through the related models
+Every model defined in the models subpackage that loads is used, restore_stored is called with propagateup from each
+of them, and with propagatedown from each meta model whose whole dependency tree loads
+Run from the repository root:
+python benchmarks/bench_propagation.py [--repeat N] [--passes N] [--source path]
+To compare against an older tree, check it out with git worktree and pass its root with --source
+"""
+
+import argparse
+import os
+import sys
+import time
+
+
+def load_models(models):
+    """Load every model defined in the models subpackage and return the ones that load"""
+    loaded = []
+    for name, qsar in list(vars(models).items()):
+        if isinstance(qsar, (models.QSARModel, models.METAQSARModel)):
+            try:
+                qsar.load()
+            except Exception:
+                # models with data modules missing from the tree are left out
+                continue
+            loaded.append(qsar)
+    return loaded
+
+
+def count_calls(models, calls):
+    """Wrap restore_stored of both model classes to count every call, including the propagated ones"""
+    for modelclass in (models.QSARModel, models.METAQSARModel):
+        def counted(self, *args, _restore_stored=modelclass.restore_stored, **kwargs):
+            calls[0] += 1
+            return _restore_stored(self, *args, **kwargs)
+        modelclass.restore_stored = counted
+
+
+def tree_loads(qsar):
+    """Return True if restore_stored can be propagated through the whole dependency tree of the model"""
+    try:
+        qsar.restore_stored(propagatedown=True)
+    except Exception:
+        return False
+    return True
+
+
+def main():
+    argparser = argparse.ArgumentParser(description='Benchmark propagation of stored data changes between models')
+    argparser.add_argument('--repeat', type=int, default=5, help='number of timed runs per case, default = 5')
+    argparser.add_argument('--passes', type=int, default=100, help='number of passes per timed run, default = 100')
+    argparser.add_argument('--source', type=str, default=None,
+                           help='root of the source tree to import, default = this repository')
+    args = argparser.parse_args()
+    # import the package from the chosen source tree
+    source = args.source
+    if source is None:
+        source = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, os.path.abspath(source))
+    from ifsqsar import models
+    loaded = load_models(models)
+    calls = [0]
+    count_calls(models, calls)
+    metas = [qsar for qsar in loaded if isinstance(qsar, models.METAQSARModel) and tree_loads(qsar)]
+    cases = [('up', loaded, {'propagateup': True}),
+             ('down', metas, {'propagatedown': True}),
+             ]
+    print('{:<16}{:>10}{:>10}{:>14}'.format('case', 'models', 'calls', 'best (ms)'))
+    for name, qsars, kwargs in cases:
+        best = None
+        for r in range(args.repeat):
+            calls[0] = 0
+            start = time.perf_counter()
+            for p in range(args.passes):
+                for qsar in qsars:
+                    qsar.restore_stored(**kwargs)
+            timing = (time.perf_counter() - start) / args.passes * 1000
+            if best is None or timing < best:
+                best = timing
+        print('{:<16}{:>10}{:>10}{:>14.3f}'.format(name, len(qsars), calls[0] // args.passes, best))
+
+
+if __name__ == '__main__':
+    main()
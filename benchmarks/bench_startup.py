@@ -0,0 +1,76 @@
+"""
+benchmarks/bench_startup.py
+Times the start up of the ifsqsar CLI for the common invocations, each run in a fresh interpreter
+Run from the repository root:
+python benchmarks/bench_startup.py [--repeat N] [--save results.json] [--baseline results.json]
+With --baseline the script exits with status 1 if any case is slower than the baseline by more than --tolerance
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+# the invocations that are timed, as lists of arguments passed to python -m ifsqsar
+cases = [('help', ['--help']),
+         ('docs', ['--docs']),
+         ('single smiles', ['-s', 'CCO', '-q', 'fhlb']),
+         ('default list', ['-s', 'CCO']),
+         ]
+
+
+def time_case(arguments, repeat):
+    """Run one CLI invocation repeat times and return the timings and the return code of the last run"""
+    timings = []
+    returncode = 0
+    for r in range(repeat):
+        start = time.perf_counter()
+        process = subprocess.run([sys.executable, '-m', 'ifsqsar'] + arguments,
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+        returncode = process.returncode
+    return timings, returncode
+
+
+def main():
+    argparser = argparse.ArgumentParser(description='Benchmark start up time of the ifsqsar CLI')
+    argparser.add_argument('--repeat', type=int, default=5, help='number of runs per case, default = 5')
+    argparser.add_argument('--save', type=str, default=None, help='write the best times to this json file')
+    argparser.add_argument('--baseline', type=str, default=None, help='compare against best times in this json file')
+    argparser.add_argument('--tolerance', type=float, default=1.25,
+                           help='allowed slowdown relative to the baseline, default = 1.25')
+    args = argparser.parse_args()
+    # run from the repository root so that the source tree is the package that gets imported
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    baseline = {}
+    if args.baseline is not None:
+        with open(args.baseline, 'r') as baselinefile:
+            baseline = json.load(baselinefile)
+    results = {}
+    regressions = []
+    print('{:<16}{:>10}{:>10}{:>10}  {}'.format('case', 'best (s)', 'median', 'baseline', 'status'))
+    for name, arguments in cases:
+        timings, returncode = time_case(arguments, args.repeat)
+        timings.sort()
+        best = timings[0]
+        median = timings[len(timings) // 2]
+        results[name] = best
+        status = 'ok' if returncode == 0 else 'exit code {}'.format(returncode)
+        if name in baseline:
+            if best > baseline[name] * args.tolerance:
+                status = 'REGRESSION' if returncode == 0 else status
+                regressions.append(name)
+            print('{:<16}{:>10.3f}{:>10.3f}{:>10.3f}  {}'.format(name, best, median, baseline[name], status))
+        else:
+            print('{:<16}{:>10.3f}{:>10.3f}{:>10}  {}'.format(name, best, median, '', status))
+    if args.save is not None:
+        with open(args.save, 'w') as savefile:
+            json.dump(results, savefile, indent=1)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
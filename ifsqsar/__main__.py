@@ -5,8 +5,8 @@ Implements a command line interface (CLI) that accesses the functionality of the
 """
 
 if __name__ == "__main__":
-    from . import ifsqsar
-    from .. import models
+    # only the lightweight modules are imported here, the API and the models are imported
+    # after the options are parsed so that --help and --docs return without loading them
     import argparse
     import os
 
@@ -21,6 +21,11 @@ if __name__ == "__main__":
                            '--docs',
                            action='store_true',
                            help='Prints the full documentation to standard output')
+    # list available QSARs
+    argparser.add_argument('-l',
+                           '--listqsars',
+                           action='store_true',
+                           help='Prints the name, version, units and endpoint of all available QSARs')
     # input must be either from file OR from a list of SMILES
     inputgroup = argparser.add_mutually_exclusive_group()
     inputgroup.add_argument('-s',
@@ -73,6 +78,12 @@ if __name__ == "__main__":
                            type=str,
                            default='\n',
                            help='Input file format: character used to separate rows, default = \\n (newline)')
+    argparser.add_argument('-g',
+                           '--inquoting',
+                           action='store_true',
+                           default=False,
+                           help='Input file format: parse double quoted fields, which may contain the separator, '
+                                'default = quotes are kept as they are in the fields')
     # output
     argparser.add_argument('-o',
                            '--outfile',
@@ -100,6 +111,7 @@ if __name__ == "__main__":
                            type=str,
                            default='rows',
                            help='Output format: chemical structures in rows, or in columns, '
+                                'or parquet to write typed columns to a Parquet file (needs pyarrow and an outfile), '
                                 'default = rows')
     argparser.add_argument('-m',
                            '--outseparator',
@@ -153,17 +165,62 @@ if __name__ == "__main__":
                            help='Comma-separated list of values to return. Full list: '
                                  'insmi, normsmi, sminote, eendpoint, units, qsarpred, UL, ULnote, error, citation. See full docs for explanation'
                            )
+    # persistent prediction cache
+    argparser.add_argument('-k',
+                           '--cachefile',
+                           metavar='cachefile',
+                           action='store',
+                           type=str,
+                           default=None,
+                           help='SQLite file that stores predictions and normalized SMILES between runs, created if it does not exist, '
+                                'default = no persistent cache')
+    # parallel batch processing
+    argparser.add_argument('-j',
+                           '--jobs',
+                           metavar='jobs',
+                           action='store',
+                           type=int,
+                           default=1,
+                           help='Number of worker processes that apply the QSARs, 0 uses one per CPU, '
+                                'default = 1')
+    # summary of the run
+    argparser.add_argument('-y',
+                           '--summary',
+                           action='store_true',
+                           default=False,
+                           help='Prints the number of rows, unique SMILES, chemicals the QSARs were applied to and '
+                                'the dedup ratio to standard error after the run')
     # parse the options passed then decide actions
     args = argparser.parse_args()
     # no input specified, start the GUI
     if args.docs:
-        with open(os.path.join(thispath, 'README.md'), 'r') as readmefile:
+        readmepath = os.path.join(thispath, 'README.md')
+        # when running from a source checkout the README is one level up from the package
+        if not os.path.exists(readmepath):
+            readmepath = os.path.join(os.path.dirname(thispath), 'README.md')
+        with open(readmepath, 'r') as readmefile:
             infostring = readmefile.read()
         infostring = infostring.replace('<pre>', '').replace('</pre>', '').replace('\[', '[')
         print(infostring)
+    elif args.listqsars:
+        # metadata is read from the manifest so the models are not loaded
+        from . import models
+        for metadata in models.get_qsar_metadata():
+            print('\t'.join([metadata['model_name'], str(metadata['version']), metadata['units'],
+                             metadata['endpoint']]))
     elif args.infile is None and args.smiles is None:
+        from . import ifsqsar
         ifsqsar.main()
     else:
+        from . import ifsqsar
+        from . import models
+        # Parquet output is only available with pyarrow and is always written to a file
+        if args.outformat == 'parquet':
+            import importlib.util
+            if importlib.util.find_spec('pyarrow') is None:
+                argparser.error('Parquet output needs pyarrow, which is not installed')
+            if args.outfile is None:
+                argparser.error('Parquet output needs an output file, pass -o')
         # load QSARs
         if args.qsars == '':
             qsarmodels = []
@@ -207,6 +264,11 @@ if __name__ == "__main__":
         else:
             smiles = ''
             filename = ''
+        # predictions and normalized SMILES from previous runs are read from and new ones written to the cache file
+        if args.cachefile is not None:
+            from ifsqsar import smiles_norm
+            models.open_prediction_store(args.cachefile)
+            smiles_norm.open_normalization_store(args.cachefile)
         # apply models
         if args.outseparator == '':
             outsep = '<nosep>'
@@ -224,6 +286,7 @@ if __name__ == "__main__":
                                                       inheadersmiles=args.inheadersmiles,
                                                       inseparator=args.inseparator,
                                                       inendline=args.inendline,
+                                                      inquoting=args.inquoting,
                                                       values=values,
                                                       outfilename=args.outfile,
                                                       outkeepdata=args.outtossdata,
@@ -231,6 +294,7 @@ if __name__ == "__main__":
                                                       outformat=args.outformat,
                                                       outseparator=outsep,
                                                       outendline=outend,
+                                                      n_jobs=args.jobs,
                                                       )
         # print to screen if no outfile
         if args.outfile is None:
@@ -239,5 +303,12 @@ if __name__ == "__main__":
             if args.outendline == '':
                 result = result.replace('<noend>', '')
             print(result, end='')
+        if args.summary:
+            import sys
+            for key, value in ifsqsar.get_run_summary().items():
+                print('\t'.join([key, str(value)]), file=sys.stderr)
+        if args.cachefile is not None:
+            models.close_prediction_store()
+            smiles_norm.close_normalization_store()
 
 
@@ -5,9 +5,9 @@ Implements a python API for applying IFS QSARs and a simple GUI that built on to
 The primary elements of the API are the functions apply_qsars_to_molecule and apply_qsars_to_molecule_list
 """
 
-from openbabel import openbabel as ob
+import io
+import itertools
 import numpy as np
-from . import smiles_norm
 import re
 
 chargedatom = re.compile('[\[].+?[-+][\]]')
@@ -32,6 +32,7 @@ def apply_qsars_to_molecule(qsarlist,
                             header=True,  # True or False
                             separator='\t',  # any string
                             endline='\n',  # any string
+                            plan=None,  # QSARExecutionPlan
                             ):
     """Apply a list of QSARs to a molecule as a SMILES and return formatted output.
 
@@ -57,8 +58,12 @@ def apply_qsars_to_molecule(qsarlist,
         header -- include header line in formatted text output, default=True
         separator -- column separator for formatted text output, default="\\t" (tab)
         endline -- row separator for formatted text output, default="\\n" (newline)
+        plan -- QSARExecutionPlan of qsarlist from the models subpackage, saves sorting the dependencies if passed
 
     """
+    # openbabel and the smarts in smiles_norm are imported on first use to keep the package import light
+    from openbabel import openbabel as ob
+    from . import smiles_norm
     # initialize results dict from values iterable
     result = {'SMILES success': True, 'QSAR list': []}
     for val in ('insmi', 'normsmi', 'sminote'):
@@ -241,8 +246,14 @@ def apply_qsars_to_molecule(qsarlist,
             qsarpredmixcolumns.append('qsarpred component {}'.format(mc+1))
             ULmixcolumns.append('UL component {}'.format(mc+1))
             errormixcolumns.append('error component {}'.format(mc+1))
-    # parse through the list of QSARs applying each to the molecule
-    for qsar in qsarlist:
+    # apply all QSARs and their dependencies once each in dependency order
+    if plan is None:
+        from . import models
+        plan = models.QSARExecutionPlan(qsarlist)
+    if result['SMILES success']:
+        predictions = plan.apply(solutes=solutelist, solvents=solventlist, components=componentlist, solutef=solutef, solventf=solventf, componentf=componentf)
+    # parse through the list of QSARs and store the results for each
+    for q, qsar in enumerate(qsarlist):
         # load the model
         qsar.load()
         # initialize dict of calculated results
@@ -277,8 +288,8 @@ def apply_qsars_to_molecule(qsarlist,
         # continue if SMILES was not successfully converted
         if not result['SMILES success']:
             continue
-        # apply model and store output
-        qsar_prediction, uncertainty_level, error, note, citation, units, endpoint = qsar.apply_model(solutes=solutelist, solvents=solventlist, components=componentlist, solutef=solutef, solventf=solventf, componentf=componentf)
+        # store output
+        qsar_prediction, uncertainty_level, error, note, citation, units, endpoint = predictions[q]
         if 'endpoint' in values:
             result[qsar.model_name]['endpoint'] = endpoint
         if 'units' in values:
@@ -341,170 +352,958 @@ def apply_qsars_to_molecule(qsarlist,
         return result
     # return output as a string where the output values are in rows and the chemical is in the column
     elif outformat == 'columns':
-        outstring = ''
+        outpieces = []
         for val in values:
             if val in ('insmi', 'normsmi', 'sminote'):
                 if header:
-                    outstring = ''.join([outstring, val, separator, result[val], endline])
+                    outpieces.extend([val, separator, result[val], endline])
                 else:
-                    outstring = ''.join([outstring, result[val], endline])
+                    outpieces.extend([result[val], endline])
         for qsar in result['QSAR list']:
             for val in values:
                 if val in ('endpoint', 'units', 'ULnote', 'citation'):
                     if header:
-                        outstring = ''.join([outstring, qsar, ' ', val, separator, str(result[qsar][val]), endline])
+                        outpieces.extend([qsar, ' ', val, separator, str(result[qsar][val]), endline])
                     else:
-                        outstring = ''.join([outstring, str(result[qsar][val]), endline])
+                        outpieces.extend([str(result[qsar][val]), endline])
                 if val in ('qsarpred', 'UL', 'error'):
                     if val in result[qsar]:
                         if header:
                             if type(result[qsar][val]) != str and np.isnan(result[qsar][val]):
-                                outstring = ''.join([outstring, qsar, ' ', val, separator, '', endline])
+                                outpieces.extend([qsar, ' ', val, separator, '', endline])
                             else:
-                                outstring = ''.join([outstring, qsar, ' ', val, separator, str(result[qsar][val]), endline])
+                                outpieces.extend([qsar, ' ', val, separator, str(result[qsar][val]), endline])
                         else:
                             if type(result[qsar][val]) != str and np.isnan(result[qsar][val]):
-                                outstring = ''.join([outstring, '', endline])
+                                outpieces.extend(['', endline])
                             else:
-                                outstring = ''.join([outstring, str(result[qsar][val]), endline])
+                                outpieces.extend([str(result[qsar][val]), endline])
                     for s in range(1, 201):
                         localval = ' '.join([val, 'solute', str(s)])
                         if localval not in result[qsar]:
                             break
                         if header:
                             if type(result[qsar][localval]) != str and np.isnan(result[qsar][localval]):
-                                outstring = ''.join([outstring, qsar, ' ', localval, separator, '', endline])
+                                outpieces.extend([qsar, ' ', localval, separator, '', endline])
                             else:
-                                outstring = ''.join([outstring, qsar, ' ', localval, separator, str(result[qsar][localval]), endline])
+                                outpieces.extend([qsar, ' ', localval, separator, str(result[qsar][localval]), endline])
                         else:
                             if type(result[qsar][localval]) != str and np.isnan(result[qsar][localval]):
-                                outstring = ''.join([outstring, '', endline])
+                                outpieces.extend(['', endline])
                             else:
-                                outstring = ''.join([outstring, str(result[qsar][localval]), endline])
+                                outpieces.extend([str(result[qsar][localval]), endline])
                     for c in range(1, 201):
                         localval = ' '.join([val, 'component', str(c)])
                         if localval not in result[qsar]:
                             break
                         if header:
                             if type(result[qsar][localval]) != str and np.isnan(result[qsar][localval]):
-                                outstring = ''.join([outstring, qsar, ' ', localval, separator, '', endline])
+                                outpieces.extend([qsar, ' ', localval, separator, '', endline])
                             else:
-                                outstring = ''.join([outstring, qsar, ' ', localval, separator, str(result[qsar][localval]), endline])
+                                outpieces.extend([qsar, ' ', localval, separator, str(result[qsar][localval]), endline])
                         else:
                             if type(result[qsar][localval]) != str and np.isnan(result[qsar][localval]):
-                                outstring = ''.join([outstring, '', endline])
+                                outpieces.extend(['', endline])
                             else:
-                                outstring = ''.join([outstring, str(result[qsar][localval]), endline])
-        return outstring
+                                outpieces.extend([str(result[qsar][localval]), endline])
+        return ''.join(outpieces)
     # return output as a string where the output values are in columns and the chemical is in the row
     elif outformat == 'rows':
-        outstring = ''
+        outpieces = []
         # header
         if header:
             first = True
             for val in values:
                 if val in ('insmi', 'normsmi', 'sminote'):
                     if first:
-                        outstring = ''.join([outstring, val])
+                        outpieces.extend([val])
                         first = False
                     else:
-                        outstring = ''.join([outstring, separator, val])
+                        outpieces.extend([separator, val])
             for qsar in result['QSAR list']:
                 for val in values:
                     if val in ('endpoint', 'units', 'ULnote', 'citation'):
                         if first:
-                            outstring = ''.join([outstring, qsar, ' ', val])
+                            outpieces.extend([qsar, ' ', val])
                             first = False
                         else:
-                            outstring = ''.join([outstring, separator, qsar, ' ', val])
+                            outpieces.extend([separator, qsar, ' ', val])
                     if val in ('qsarpred', 'UL', 'error'):
                         if val in result[qsar]:
                             if first:
-                                outstring = ''.join([outstring, qsar, ' ', val])
+                                outpieces.extend([qsar, ' ', val])
                                 first = False
                             else:
-                                outstring = ''.join([outstring, separator, qsar, ' ', val])
+                                outpieces.extend([separator, qsar, ' ', val])
                         for s in range(1, 201):
                             localval = ' '.join([val, 'solute', str(s)])
                             if localval not in result[qsar]:
                                 break
                             if first:
-                                outstring = ''.join([outstring, qsar, ' ', localval])
+                                outpieces.extend([qsar, ' ', localval])
                                 first = False
                             else:
-                                outstring = ''.join([outstring, separator, qsar, ' ', localval])
+                                outpieces.extend([separator, qsar, ' ', localval])
                         for c in range(1, 201):
                             localval = ' '.join([val, 'component', str(c)])
                             if localval not in result[qsar]:
                                 break
                             if first:
-                                outstring = ''.join([outstring, qsar, ' ', localval])
+                                outpieces.extend([qsar, ' ', localval])
                                 first = False
                             else:
-                                outstring = ''.join([outstring, separator, qsar, ' ', localval])
-            outstring = ''.join([outstring, endline])
+                                outpieces.extend([separator, qsar, ' ', localval])
+            outpieces.extend([endline])
         # output values
         first = True
         for val in values:
             if val in ('insmi', 'normsmi', 'sminote'):
                 if first:
-                    outstring = ''.join([outstring, result[val]])
+                    outpieces.extend([result[val]])
                     first = False
                 else:
-                    outstring = ''.join([outstring, separator, result[val]])
+                    outpieces.extend([separator, result[val]])
         for qsar in result['QSAR list']:
             for val in values:
                 if val in ('endpoint', 'units', 'ULnote', 'citation'):
                     if first:
-                        outstring = ''.join([outstring, str(result[qsar][val])])
+                        outpieces.extend([str(result[qsar][val])])
                         first = False
                     else:
-                        outstring = ''.join([outstring, separator, str(result[qsar][val])])
+                        outpieces.extend([separator, str(result[qsar][val])])
                 if val in ('qsarpred', 'UL', 'error'):
                     if val in result[qsar]:
                         if first:
                             if type(result[qsar][val]) != str and np.isnan(result[qsar][val]):
-                                outstring = ''.join([outstring, ''])
+                                outpieces.extend([''])
                             else:
-                                outstring = ''.join([outstring, str(result[qsar][val])])
+                                outpieces.extend([str(result[qsar][val])])
                             first = False
                         else:
                             if type(result[qsar][val]) != str and np.isnan(result[qsar][val]):
-                                outstring = ''.join([outstring, separator, ''])
+                                outpieces.extend([separator, ''])
                             else:
-                                outstring = ''.join([outstring, separator, str(result[qsar][val])])
+                                outpieces.extend([separator, str(result[qsar][val])])
                     for s in range(1, 201):
                         localval = ' '.join([val, 'solute', str(s)])
                         if localval not in result[qsar]:
                             break
                         if first:
                             if type(result[qsar][localval]) != str and np.isnan(result[qsar][localval]):
-                                outstring = ''.join([outstring, ''])
+                                outpieces.extend([''])
                             else:
-                                outstring = ''.join([outstring, str(result[qsar][localval])])
+                                outpieces.extend([str(result[qsar][localval])])
                             first = False
                         else:
                             if type(result[qsar][localval]) != str and np.isnan(result[qsar][localval]):
-                                outstring = ''.join([outstring, separator, ''])
+                                outpieces.extend([separator, ''])
                             else:
-                                outstring = ''.join([outstring, separator, str(result[qsar][localval])])
+                                outpieces.extend([separator, str(result[qsar][localval])])
                     for c in range(1, 201):
                         localval = ' '.join([val, 'component', str(c)])
                         if localval not in result[qsar]:
                             break
                         if first:
                             if type(result[qsar][localval]) != str and np.isnan(result[qsar][localval]):
-                                outstring = ''.join([outstring, ''])
+                                outpieces.extend([''])
                             else:
-                                outstring = ''.join([outstring, str(result[qsar][localval])])
+                                outpieces.extend([str(result[qsar][localval])])
                             first = False
                         else:
                             if type(result[qsar][localval]) != str and np.isnan(result[qsar][localval]):
-                                outstring = ''.join([outstring, separator, ''])
+                                outpieces.extend([separator, ''])
                             else:
-                                outstring = ''.join([outstring, separator, str(result[qsar][localval])])
-        outstring = ''.join([outstring, endline])
-        return outstring
+                                outpieces.extend([separator, str(result[qsar][localval])])
+        outpieces.extend([endline])
+        return ''.join(outpieces)
+
+
+# maximum number of results kept to deduplicate repeated SMILES in a batch run, 0 turns deduplication off
+dedup_size = 10000
+
+# counts of the last batch run of iter_apply_qsars, see get_run_summary
+_run_summary = {'rows': 0, 'unique SMILES': 0, 'chemicals applied': 0}
+
+
+def get_run_summary():
+    """Return the number of rows, of unique SMILES and of chemicals the QSARs were applied to in the last batch run,
+    and the dedup ratio of rows to chemicals applied"""
+    summary = dict(_run_summary)
+    if summary['chemicals applied'] > 0:
+        summary['dedup ratio'] = summary['rows'] / summary['chemicals applied']
+    else:
+        summary['dedup ratio'] = np.nan
+    return summary
+
+
+def _copy_record(record):
+    """Copy a result dict of apply_qsars_to_molecule so it can be returned for another row"""
+    from . import smiles_norm
+    newrecord = dict(record)
+    newrecord['QSAR list'] = list(record['QSAR list'])
+    for qsar in record['QSAR list']:
+        newrecord[qsar] = dict(record[qsar])
+    if newrecord.get('OBMol') is not None:
+        newrecord['OBMol'] = smiles_norm.IFSMol(newrecord['OBMol'])
+    return newrecord
+
+
+class _BatchDeduplicator:
+    """Results of a batch run kept by input SMILES and by normalized SMILES, least recently used first,
+    so that QSARs are applied once to repeated chemicals"""
+
+    def __init__(self, qsarlist, converter, values, separator, endline, plan):
+        """Keep the arguments passed to apply_qsars_to_molecule"""
+        from collections import OrderedDict
+        from . import models
+        self.qsarlist = qsarlist
+        self.converter = converter
+        self.values = values
+        self.separator = separator
+        self.endline = endline
+        self.plan = plan
+        # the SMILES values of a row are found with an empty plan when the predictions are copied
+        self.emptyplan = models.QSARExecutionPlan([])
+        self.records = OrderedDict()
+        self.applied = 0
+
+    def lookup(self, smiles):
+        """Return a copy of the result of an input SMILES already applied or None"""
+        record = self.records.get(('smiles', smiles))
+        if record is None:
+            return None
+        self.records.move_to_end(('smiles', smiles))
+        return _copy_record(record)
+
+    def add(self, key, record):
+        """Keep a copy of a result by ('smiles', SMILES) or ('normsmiles', normalized SMILES)"""
+        if dedup_size == 0:
+            return
+        self.records[key] = _copy_record(record)
+        self.records.move_to_end(key)
+        while len(self.records) > dedup_size:
+            self.records.popitem(last=False)
+
+    def apply(self, smiles):
+        """Return the result of an input SMILES, the QSARs are only applied to new normalized SMILES"""
+        from . import smiles_norm
+        record = self.lookup(smiles)
+        if record is not None:
+            return record
+        # mixtures and SMILES that cannot be normalized are only deduplicated by the input SMILES, the normalization
+        # is memoized so it is not repeated when the QSARs are applied
+        normsmiles = ''
+        if re.search(mixturespec, smiles) is None and smiles_norm.memo_size != 0:
+            normsmiles = smiles_norm.convertsmiles(smiles, self.converter)[1]
+        if normsmiles != '' and ('normsmiles', normsmiles) in self.records:
+            # another SMILES of the same chemical, the SMILES values are for this row and the predictions are copied
+            self.records.move_to_end(('normsmiles', normsmiles))
+            predictions = self.records[('normsmiles', normsmiles)]
+            record = apply_qsars_to_molecule([],
+                                             smiles,
+                                             converter=self.converter,
+                                             values=self.values,
+                                             outformat='dict',
+                                             separator=self.separator,
+                                             endline=self.endline,
+                                             plan=self.emptyplan,
+                                             )
+            record['QSAR list'] = list(predictions['QSAR list'])
+            for qsar in predictions['QSAR list']:
+                record[qsar] = dict(predictions[qsar])
+        else:
+            record = apply_qsars_to_molecule(self.qsarlist,
+                                             smiles,
+                                             converter=self.converter,
+                                             values=self.values,
+                                             outformat='dict',
+                                             separator=self.separator,
+                                             endline=self.endline,
+                                             plan=self.plan,
+                                             )
+            self.applied += 1
+            if normsmiles != '':
+                self.add(('normsmiles', normsmiles), record)
+        self.add(('smiles', smiles), record)
+        return record
+
+
+# state of a worker process of iter_apply_qsars, set by _init_worker
+_worker_state = {}
+
+
+def _init_worker(modelspecs, values, separator, endline, predictionstore, normalizationstore, dedupsize):
+    """Load the QSARs and open the persistent stores once in a worker process of iter_apply_qsars"""
+    global dedup_size
+    from openbabel import openbabel as ob
+    from . import models
+    from . import smiles_norm
+    # each worker opens its own connection to the stores, SQLite connections cannot be used across a fork so the
+    # stores inherited from the main process are dropped without being flushed or closed, and are kept referenced
+    # so they are not closed when collected either
+    _worker_state['inherited stores'] = (models._prediction_store, smiles_norm._normalization_store)
+    models._prediction_store = None
+    smiles_norm._normalization_store = None
+    if predictionstore is not None:
+        models.open_prediction_store(predictionstore)
+    if normalizationstore is not None:
+        smiles_norm.open_normalization_store(normalizationstore)
+    # find the same QSAR versions that were passed to iter_apply_qsars and load them
+    qsarlist = [models.get_qsar_list(qsarlist=[name], versionlist=[version])[0] for name, version in modelspecs]
+    converter = ob.OBConversion()
+    converter.SetInAndOutFormats('smi', 'can')
+    # repeats within the chunks of a worker are deduplicated the same as in the main process
+    dedup_size = dedupsize
+    _worker_state['dedup'] = _BatchDeduplicator(qsarlist, converter, values, separator, endline,
+                                                models.QSARExecutionPlan(qsarlist))
+
+
+def _apply_chunk(smileschunk):
+    """Apply the QSARs of a worker process to a chunk of SMILES and return the list of result dicts and the
+    number of chemicals the QSARs were applied to"""
+    from . import models
+    from . import smiles_norm
+    dedup = _worker_state['dedup']
+    applied = dedup.applied
+    results = []
+    for smiles in smileschunk:
+        record = dedup.apply(smiles)
+        # OBMols cannot be pickled, send what is needed to rebuild them instead
+        if record.get('OBMol') is not None:
+            mol = record['OBMol']
+            record['OBMol'] = (mol.normsmiles, mol.sminote, mol.neutralize, mol.filtertype)
+        results.append(record)
+    # write new predictions and normalizations so they are not lost when the worker is stopped
+    if models._prediction_store is not None:
+        models._prediction_store.flush()
+    if smiles_norm._normalization_store is not None:
+        smiles_norm._normalization_store.flush()
+    return results, dedup.applied - applied
+
+
+def iter_apply_qsars(qsarlist,
+                     source,  # iterable of SMILES as strings or of rows
+                     smilesindex=0,  # index or key of the SMILES in each row
+                     converter=None,  # OBConversion
+                     values=('insmi',
+                             'normsmi',
+                             'sminote',
+                             'OBMol',
+                             'endpoint',
+                             'units',
+                             'qsarpred',
+                             'UL',
+                             'error',
+                             'ULnote',
+                             'citation'
+                             ),  # iterable of values to be output
+                     separator='\t',  # any string
+                     endline='\n',  # any string
+                     n_jobs=1,  # number of worker processes
+                     chunksize=100,  # SMILES per chunk sent to a worker
+                     dedup=True,  # apply QSARs once to repeated chemicals
+                     ):
+    """Apply a list of QSARs to each SMILES from an iterable and yield the result for each chemical as a dict.
+
+    SMILES are read from the source one at a time and each result is yielded before the next SMILES is read,
+    so memory does not grow with the size of the input, e.g. a generator over the lines of a large file.
+
+    Required Arguments:
+        qsarlist -- list of QSARs obtained from get_qsar_list function of the models subpackage
+        source -- iterable of SMILES strings, or of rows (lists, tuples or dicts) that contain a SMILES
+
+    Optional Arguments:
+        smilesindex -- index or key of the SMILES in each row, default=0
+        converter -- openbabel OBConversion instance, saves a little load time if passed
+        values -- tuple of outputs to be returned, see apply_qsars_to_molecule, all are included by default
+        separator -- separator removed from the SMILES notes, default="\\t" (tab)
+        endline -- endline removed from the SMILES notes, default="\\n" (newline)
+        n_jobs -- number of worker processes, default=1 applies the QSARs in this process,
+                  0 or less uses one worker per CPU
+        chunksize -- number of SMILES sent to a worker at a time, default=100
+        dedup -- apply the QSARs once to repeated SMILES and to SMILES with the same normalized SMILES and copy
+                 the results to each row, up to dedup_size results are kept, default=True
+
+    Each yielded dict is the same as the dict format of apply_qsars_to_molecule, if the source contains rows
+    the row is also included as "row". With more than one worker, chunks of SMILES are applied in parallel and
+    the results are still yielded in the order of the source. Workers are forked where the platform allows it,
+    so that they start with the loaded models and any values stored in this session. The counts of the run,
+    including the dedup ratio, are returned by get_run_summary.
+    """
+    # instantiate a converter if needed
+    if converter is None:
+        from openbabel import openbabel as ob
+        converter = ob.OBConversion()
+        converter.SetInAndOutFormats('smi', 'can')
+    # sort the QSARs and their dependencies once for the whole source, this also loads them before workers start
+    from . import models
+    plan = models.QSARExecutionPlan(qsarlist)
+    if n_jobs is None or n_jobs < 1:
+        import os
+        n_jobs = os.cpu_count() or 1
+    # reset the counts of the run
+    _run_summary['rows'] = 0
+    _run_summary['unique SMILES'] = 0
+    _run_summary['chemicals applied'] = 0
+    deduplicator = None
+    if dedup and dedup_size != 0:
+        deduplicator = _BatchDeduplicator(qsarlist, converter, values, separator, endline, plan)
+    # apply QSARs in this process
+    if n_jobs == 1:
+        for item in source:
+            if isinstance(item, str):
+                smiles = item
+            else:
+                smiles = item[smilesindex]
+            if deduplicator is None:
+                record = apply_qsars_to_molecule(qsarlist,
+                                                 smiles,
+                                                 converter=converter,
+                                                 values=values,
+                                                 outformat='dict',
+                                                 separator=separator,
+                                                 endline=endline,
+                                                 plan=plan,
+                                                 )
+                _run_summary['unique SMILES'] += 1
+                _run_summary['chemicals applied'] += 1
+            else:
+                record = deduplicator.lookup(smiles)
+                if record is None:
+                    record = deduplicator.apply(smiles)
+                    _run_summary['unique SMILES'] += 1
+                    _run_summary['chemicals applied'] = deduplicator.applied
+            _run_summary['rows'] += 1
+            if not isinstance(item, str):
+                record['row'] = item
+            yield record
+        return
+    # apply QSARs in a pool of worker processes
+    import collections
+    import multiprocessing
+    from . import smiles_norm
+    # workers read what this process has stored so far from the persistent stores
+    predictionstore = None
+    if models._prediction_store is not None:
+        models._prediction_store.flush()
+        predictionstore = models._prediction_store.filename
+    normalizationstore = None
+    if smiles_norm._normalization_store is not None:
+        smiles_norm._normalization_store.flush()
+        normalizationstore = smiles_norm._normalization_store.filename
+    if 'fork' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('fork')
+    else:
+        context = multiprocessing.get_context()
+    modelspecs = [(qsar.model_name, qsar.version) for qsar in qsarlist]
+    with context.Pool(n_jobs,
+                      initializer=_init_worker,
+                      initargs=(modelspecs, tuple(values), separator, endline, predictionstore, normalizationstore,
+                                dedup_size if deduplicator is not None else 0),
+                      ) as pool:
+        # a few chunks per worker are queued at a time so the source is not read ahead of the results
+        pending = collections.deque()
+        # repeated SMILES are not sent to the workers, their results are copied when the first one is yielded
+        inflight = collections.Counter()
+        source = iter(source)
+        while True:
+            items = list(itertools.islice(source, chunksize))
+            if len(items) > 0:
+                smileschunk = []
+                repeats = []
+                for item in items:
+                    smiles = item if isinstance(item, str) else item[smilesindex]
+                    repeat = deduplicator is not None and (inflight[smiles] > 0 or ('smiles', smiles) in deduplicator.records)
+                    if not repeat:
+                        smileschunk.append(smiles)
+                        inflight[smiles] += 1
+                    repeats.append(repeat)
+                pending.append((items, repeats, pool.apply_async(_apply_chunk, (smileschunk,))))
+            if len(pending) == 0:
+                break
+            if len(items) > 0 and len(pending) < 2 * n_jobs:
+                continue
+            # yield the oldest chunk so results come out in the order of the source
+            items, repeats, asyncresult = pending.popleft()
+            records, applied = asyncresult.get()
+            records = iter(records)
+            _run_summary['chemicals applied'] += applied
+            for item, repeat in zip(items, repeats):
+                smiles = item if isinstance(item, str) else item[smilesindex]
+                record = None
+                if repeat:
+                    record = deduplicator.lookup(smiles)
+                    # the first result was dropped from a small dedup_size before it was needed, apply again
+                    if record is None:
+                        record = deduplicator.apply(smiles)
+                        _run_summary['chemicals applied'] += 1
+                if record is None:
+                    record = next(records)
+                    if record.get('OBMol') is not None:
+                        record['OBMol'] = smiles_norm._rebuild_mol(*record['OBMol'], converter)
+                    _run_summary['unique SMILES'] += 1
+                    if deduplicator is not None:
+                        inflight[smiles] -= 1
+                        if inflight[smiles] == 0:
+                            del inflight[smiles]
+                        deduplicator.add(('smiles', smiles), record)
+                _run_summary['rows'] += 1
+                if not isinstance(item, str):
+                    record['row'] = item
+                yield record
+
+
+def _read_lines(infile, inendline, chunksize=1048576):
+    """Yield the non-empty lines of an open text file split by inendline, reading chunksize characters at a time"""
+    tail = ''
+    while True:
+        chunk = infile.read(chunksize)
+        if chunk == '':
+            break
+        lines = ''.join([tail, chunk]).split(inendline)
+        # the last piece may continue in the next chunk
+        tail = lines.pop()
+        for line in lines:
+            if line != '':
+                yield line
+    if tail != '':
+        yield tail
+
+
+def _quoted_rows(lines, inseparator, infilename):
+    """Yield the list of fields of each row of an iterable of lines parsed by the csv module, quoted fields may
+    contain the separator or an endline and quoting that is not closed or not followed by a separator is an error"""
+    import csv
+    reader = csv.reader(lines, delimiter=inseparator, strict=True)
+    r = 0
+    while True:
+        try:
+            fields = next(reader, None)
+        except csv.Error as error:
+            raise ValueError('Quoting error in row {} of {}: {}'.format(r + 1, infilename, error))
+        if fields is None:
+            return
+        r += 1
+        yield fields
+
+
+def _read_rows(infilename, inseparator='\t', inendline='\n', inquoting=False):
+    """Yield the text and the list of fields of each non-empty row of a delimited file, one row at a time.
+
+    Each line is one row split by the separator. With inquoting single character separators are parsed by the csv
+    module so quoted fields may contain the separator, the text of a row with a quoted endline spans the lines it
+    was read from."""
+    with open(infilename, 'r') as infile:
+        lines = _read_lines(infile, inendline)
+        if len(inseparator) != 1 or not inquoting:
+            for line in lines:
+                yield line, line.split(inseparator)
+            return
+        # keep the lines the csv reader takes for each row, the reader does not read ahead of the row it returns
+        consumed = []
+
+        def recordlines():
+            for line in lines:
+                consumed.append(line)
+                yield line
+
+        for fields in _quoted_rows(recordlines(), inseparator, infilename):
+            text = inendline.join(consumed)
+            consumed.clear()
+            yield text, fields
+
+
+def _format_field(value):
+    """Return the text of an output value, NaN is written as an empty field"""
+    if type(value) != str and np.isnan(value):
+        return ''
+    return str(value)
+
+
+def _file_source(infilename, inseparator, inendline, inheaderrows, smiles_index, inquoting):
+    """Yield the text, the SMILES and the fields of each row after the header rows of a delimited file"""
+    rows = _read_rows(infilename, inseparator, inendline, inquoting)
+    for r, (line, splitline) in enumerate(rows):
+        if r >= inheaderrows:
+            yield line, splitline[smiles_index], splitline
+
+
+def _smiles_column(infilename, inseparator, inendline, inheaderrows, smiles_index, inquoting):
+    """Yield the SMILES of each row after the header rows of a delimited file, the text of the rows is not kept"""
+    with open(infilename, 'r') as infile:
+        lines = _read_lines(infile, inendline)
+        if len(inseparator) != 1 or not inquoting:
+            rows = (line.split(inseparator) for line in lines)
+        else:
+            rows = _quoted_rows(lines, inseparator, infilename)
+        for r, fields in enumerate(rows):
+            if r >= inheaderrows:
+                yield fields[smiles_index]
+
+
+def _peek(iterable, size):
+    """Return a list of the first size items of an iterable and an iterator over all of its items"""
+    iterator = iter(iterable)
+    head = list(itertools.islice(iterator, size))
+    return head, itertools.chain(head, iterator)
+
+
+def _mixture_counts(smiles):
+    """Return the number of solutes and of components in a mixture SMILES, or None if it is not a mixture,
+    counted the same as apply_qsars_to_molecule"""
+    if re.search(mixturespec, smiles) is None:
+        return None
+    counts = [0, 0, 0]
+    nextchem = None
+    for ms in re.split(mixturespec, smiles):
+        if ms == '':
+            continue
+        # the piece after a component type flag is the SMILES of that type
+        if nextchem is not None:
+            counts[nextchem] += 1
+            nextchem = None
+        else:
+            splitms = ms.lstrip('{').rstrip('}').split(',')
+            if splitms[0] in ('solute', 'solvent', 'component'):
+                nextchem = ('solute', 'solvent', 'component').index(splitms[0])
+    return counts[0], counts[2]
+
+
+def _add_row_columns(columns, qsarnames, ismixture, values, counts):
+    """Add the output columns of one chemical with the mixture counts to the ordered list of columns"""
+    for val in values:
+        if val in ('insmi', 'normsmi', 'sminote', 'OBMol'):
+            if val not in columns:
+                columns.append(val)
+    for qsar, mixture in zip(qsarnames, ismixture):
+        for val in values:
+            if val in ('endpoint', 'units', 'ULnote', 'citation'):
+                if (qsar, val) not in columns:
+                    columns.append((qsar, val))
+                # citations move to the end each time a chemical is added
+                elif val == 'citation':
+                    columns.remove((qsar, val))
+                    columns.append((qsar, val))
+            if val in ('qsarpred', 'UL', 'error'):
+                if mixture and counts is not None:
+                    keys = [' '.join([val, 'solute', str(s)]) for s in range(1, min(counts[0], 200)+1)]
+                    keys.extend([' '.join([val, 'component', str(c)]) for c in range(1, min(counts[1], 200)+1)])
+                else:
+                    keys = [val]
+                for key in keys:
+                    if (qsar, key) not in columns:
+                        columns.append((qsar, key))
+
+
+def _output_schema(qsarlist, values, smilesiterable):
+    """Return the ordered output columns of apply_qsars_to_molecule_list and the number of SMILES.
+
+    Columns are added in the order the chemicals add them: the SMILES values, then the values of each QSAR,
+    mixture columns when a mixture with more solutes or components is found. Only the chemicals that can change
+    the order are added, chemicals with the same mixture counts as one already added only move the citations
+    to the end, which does not change the order a second time in a row."""
+    qsarnames = []
+    ismixture = []
+    for qsar in qsarlist:
+        qsar.load()
+        qsarnames.append(qsar.model_name)
+        ismixture.append(bool(qsar.ismixture))
+    columns = []
+    count = 0
+    seen = set()
+    repeated = False
+    for smiles in smilesiterable:
+        count += 1
+        # mixture counts only change the columns of Meta QSARs with mixture input
+        counts = None
+        if any(ismixture):
+            counts = _mixture_counts(smiles)
+        if counts not in seen:
+            seen.add(counts)
+            repeated = False
+        elif repeated:
+            continue
+        else:
+            repeated = True
+        _add_row_columns(columns, qsarnames, ismixture, values, counts)
+    return columns, count
+
+
+def _write_rows(outfile,
+                records,  # iterable of result dicts from iter_apply_qsars
+                columns,  # ordered columns of the output
+                header=True,  # True or False
+                separator='\t',  # any string
+                endline='\n',  # any string
+                headerlines=None,  # header rows of the input file
+                inheadtrgtrow=1,  # header row the output header is added to
+                keepseparator='\t',  # separator between the input rows and the output
+                keependline='\n',  # endline between the input rows
+                ):
+    """Write the results of apply_qsars_to_molecule_list in rows to an open file as each chemical is applied.
+
+    If headerlines are passed the input file is kept, each output row is written after the input row it came from,
+    which is the first item of the row of each record, and the rows are joined by keependline without an endline
+    after the last row."""
+    # names and keys of the columns in output order, OBMol is only in the dict format
+    columns = [column for column in columns if column != 'OBMol']
+    names = [column if type(column) == str else ' '.join(column) for column in columns]
+    keys = [(None, column) if type(column) == str else column for column in columns]
+    headerline = separator.join(names)
+    if headerlines is None:
+        if header:
+            outfile.write(''.join([headerline, endline]))
+        for record in records:
+            outline = separator.join([_format_field(record[key]) if qsar is None else _format_field(record[qsar].get(key, np.nan))
+                                      for qsar, key in keys])
+            outfile.write(''.join([outline, endline]))
+        return
+    # output with data from input file
+    for i, line in enumerate(headerlines):
+        if i > 0:
+            outfile.write(keependline)
+        if not header:
+            outfile.write(line)
+        # append output header row to target row from input file
+        elif i == inheadtrgtrow-1:
+            outfile.write(keepseparator.join([line, headerline]))
+        # if there are more input header rows add empty output fields
+        else:
+            outfile.write(keepseparator.join([line, keepseparator * headerline.count(keepseparator)]))
+    for r, record in enumerate(records):
+        if r > 0 or len(headerlines) > 0:
+            outfile.write(keependline)
+        outline = separator.join([_format_field(record[key]) if qsar is None else _format_field(record[qsar].get(key, np.nan))
+                                  for qsar, key in keys])
+        outfile.write(keepseparator.join([record['row'][0], outline]))
+
+
+def _ul_code(value):
+    """Return the int8 code of a UL, the number of the UL or 7 if it has none plus 8 for "E" and 16 for "U",
+    -1 if the UL is empty. ULs are read the same as user-defined ULs, so the order of E, U and the number is lost."""
+    from . import models
+    if isinstance(value, float) and np.isnan(value):
+        return -1
+    if isinstance(value, np.integer):
+        value = int(value)
+    try:
+        number, experimental, user = models._parse_ul(value)
+    except ValueError:
+        raise ValueError(''.join(['UL cannot be stored as a UL code: ', repr(value)]))
+    if number is None:
+        number = 7
+    code = number + 8 * experimental + 16 * user
+    # an empty string is an empty UL
+    if code == 7:
+        return -1
+    return code
+
+
+def _ul_from_code(code):
+    """Return the UL of an int8 UL code, numbers are ints and strings are "E" then "U" then the number"""
+    if code == -1:
+        return np.nan
+    if code < 7:
+        return int(code)
+    return ''.join(['E' if code & 8 else '', 'U' if code & 16 else '', str(code & 7) if code & 7 != 7 else ''])
+
+
+class ColumnarResult:
+    """Results of apply_qsars_to_molecule_list stored as one numpy array per output column
+
+    Predictions and errors are float64 arrays, ULs are int8 arrays of UL codes where the number of the UL, or 7 if it
+    has none, is added to 8 for experimental "E" and 16 for user "U" values and empty ULs are -1, and the text columns
+    (notes, endpoints, units and citations) are integer codes into the list of categories of the column, -1 if the
+    value is missing. Input and normalized SMILES are object arrays. Column names are the same as the header of the
+    rows format.
+    """
+
+    # value of each kind of column for a chemical with no output
+    empty = {'float': np.nan, 'UL': -1, 'object': '', 'text': -1}
+
+    def __init__(self, columns, count):
+        """Allocate an array for each of the ordered output columns of count chemicals"""
+        self.columns = []
+        self.arrays = {}
+        self.categories = {}
+        self.count = count
+        # name, qsar, key, kind and array of each column, in the order the columns are filled
+        self.targets = []
+        self.codes = {}
+        for column in columns:
+            if column == 'OBMol':
+                continue
+            if type(column) == str:
+                name, qsar, key = column, None, column
+            else:
+                name, qsar, key = ' '.join(column), column[0], column[1]
+            field = key.split(' ')[0]
+            if field in ('qsarpred', 'error'):
+                kind = 'float'
+                array = np.full(count, self.empty[kind])
+            elif field == 'UL':
+                kind = 'UL'
+                array = np.full(count, self.empty[kind], dtype=np.int8)
+            elif field in ('insmi', 'normsmi'):
+                kind = 'object'
+                array = np.full(count, self.empty[kind], dtype=object)
+            else:
+                kind = 'text'
+                array = np.full(count, self.empty[kind], dtype=np.int32)
+                self.categories[name] = []
+                self.codes[name] = {}
+            self.columns.append(name)
+            self.arrays[name] = array
+            self.targets.append((name, qsar, key, kind, array))
+
+    def __len__(self):
+        """Number of chemicals"""
+        return self.count
+
+    def resize(self, count):
+        """Change the number of chemicals, chemicals added at the end are empty"""
+        targets = []
+        for name, qsar, key, kind, array in self.targets:
+            resized = np.full(count, self.empty[kind], dtype=array.dtype)
+            resized[:min(count, self.count)] = array[:count]
+            self.arrays[name] = resized
+            targets.append((name, qsar, key, kind, resized))
+        self.targets = targets
+        self.count = count
+
+    def set_row(self, chem, record):
+        """Write the values of one chemical from a result dict of apply_qsars_to_molecule"""
+        for name, qsar, key, kind, array in self.targets:
+            if qsar is None:
+                value = record[key]
+            else:
+                value = record[qsar].get(key, np.nan)
+            if kind == 'float':
+                array[chem] = value
+            elif kind == 'UL':
+                array[chem] = _ul_code(value)
+            elif kind == 'text':
+                # missing values have no category
+                if type(value) != str:
+                    array[chem] = -1
+                    continue
+                codes = self.codes[name]
+                code = codes.get(value)
+                if code is None:
+                    code = len(codes)
+                    codes[value] = code
+                    self.categories[name].append(value)
+                array[chem] = code
+            else:
+                array[chem] = value
+
+    def finish(self):
+        """Store the codes of each text column in the smallest integer type that holds them, the same type that
+        pandas uses for the codes of a categorical, then drop the lookups used while filling"""
+        for name, categories in self.categories.items():
+            if len(categories) < 127:
+                self.arrays[name] = self.arrays[name].astype(np.int8)
+            elif len(categories) < 32767:
+                self.arrays[name] = self.arrays[name].astype(np.int16)
+        self.targets = []
+        self.codes = {}
+
+    def decode(self, name):
+        """Return the values of a column as a list, in the same form as the dict format"""
+        array = self.arrays[name]
+        if name in self.categories:
+            categories = self.categories[name]
+            return [categories[code] if code != -1 else np.nan for code in array]
+        if array.dtype == np.int8:
+            return [_ul_from_code(code) for code in array]
+        return list(array)
+
+    def to_dataframe(self):
+        """Return a pandas DataFrame of the columns, text columns are categoricals and the arrays are not copied,
+        missing text values are NaN"""
+        # pandas is only needed for this conversion
+        import pandas as pd
+        data = {}
+        for name in self.columns:
+            if name in self.categories:
+                data[name] = pd.Categorical.from_codes(self.arrays[name], self.categories[name])
+            else:
+                data[name] = self.arrays[name]
+        return pd.DataFrame(data, copy=False)
+
+    def to_arrow(self, length=None):
+        """Return a pyarrow RecordBatch of the first length chemicals, all by default.
+
+        Text columns and ULs are strings, combined ULs as "E" then "U" then the number, and missing values are
+        null."""
+        # pyarrow is only needed for this conversion
+        import pyarrow as pa
+        arrays = []
+        for name in self.columns:
+            array = self.arrays[name][:length]
+            if name in self.categories:
+                indices = pa.array(array, mask=array == -1)
+                arrays.append(pa.array(self.categories[name], type=pa.string()).take(indices))
+            elif array.dtype == object:
+                arrays.append(pa.array(array, type=pa.string()))
+            elif array.dtype == np.int8:
+                arrays.append(pa.array([str(_ul_from_code(code)) if code != -1 else None for code in array],
+                                       type=pa.string()))
+            else:
+                arrays.append(pa.array(array, mask=np.isnan(array)))
+        return pa.RecordBatch.from_arrays(arrays, names=self.columns)
+
+
+def _write_parquet(outfilename,
+                   records,  # iterable of result dicts from iter_apply_qsars
+                   columns,  # ordered columns of the output
+                   inputnames=None,  # names of the input file columns to keep
+                   batchsize=65536,  # chemicals per record batch
+                   ):
+    """Write the results of apply_qsars_to_molecule_list to a Parquet file one record batch at a time.
+
+    Each batch is filled as a ColumnarResult, predictions and errors are float64, ULs are strings with combined
+    ULs as "E" then "U" then the number, the SMILES and text columns are strings and missing values are null. If inputnames are
+    passed the fields of the input row, which are the third item of the row of each record, are written first as
+    string columns."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError('Parquet output needs pyarrow to be installed')
+    writer = None
+    batch = ColumnarResult(columns, batchsize)
+    inputrows = []
+    chem = 0
+    records = iter(records)
+    try:
+        while True:
+            record = next(records, None)
+            if record is not None:
+                batch.set_row(chem, record)
+                if inputnames is not None:
+                    inputrows.append(record['row'][2])
+                chem += 1
+            # write a full batch, or the last one
+            if chem == batchsize or (record is None and (chem > 0 or writer is None)):
+                recordbatch = batch.to_arrow(chem)
+                if inputnames is not None:
+                    inputarrays = [pa.array([row[i] if i < len(row) else None for row in inputrows], type=pa.string())
+                                   for i in range(len(inputnames))]
+                    recordbatch = pa.RecordBatch.from_arrays(inputarrays + recordbatch.columns,
+                                                             names=list(inputnames) + batch.columns)
+                if writer is None:
+                    writer = pq.ParquetWriter(outfilename, recordbatch.schema)
+                writer.write_batch(recordbatch)
+                batch = ColumnarResult(columns, batchsize)
+                inputrows = []
+                chem = 0
+            if record is None:
+                break
+    finally:
+        # close the file even if applying the QSARs fails, what was written so far stays readable
+        if writer is not None:
+            writer.close()
 
 
 def apply_qsars_to_molecule_list(qsarlist,
@@ -515,6 +1314,7 @@ def apply_qsars_to_molecule_list(qsarlist,
                                  inheadersmiles='smiles',  # header value indicating SMILES
                                  inseparator='\t',  # any string
                                  inendline='\n',  # any string
+                                 inquoting=False,  # True or False
                                  converter=None,  # OBConversion
                                  values=('insmi',
                                          'normsmi',
@@ -530,10 +1330,12 @@ def apply_qsars_to_molecule_list(qsarlist,
                                          ),  # iterable of values to be output
                                  outfilename=None,  # output file name
                                  outkeepdata=True,  # also output all of the input file contents
-                                 outformat='rows',  # 'dict', 'columns', 'rows'
+                                 outformat='rows',  # 'dict', 'columns', 'rows', 'arrays', 'parquet'
                                  outheader=True,  # True or False
                                  outseparator='\t',  # any string
                                  outendline='\n',  # any string
+                                 n_jobs=1,  # number of worker processes
+                                 dedup=True,  # apply QSARs once to repeated chemicals
                                  ):
     """Apply a list of QSARs to a list of SMILES, pass them to apply_qsars_to_molecule, then concatenate the results.
 
@@ -550,6 +1352,8 @@ def apply_qsars_to_molecule_list(qsarlist,
                           (not case sensitive)
         inseparator -- column separator for input file, default="\\t" (tab)
         inendline -- row separator for input file, default="\\n" (newline)
+        inquoting -- parse double quoted fields of the input file, which may contain the separator or an endline,
+                     default=False which keeps quotes as they are in the fields
         converter -- openbabel OBConversion instance, saves a little load time if passed
         values -- tuple of outputs to be returned, all are included by default:
             "insmi" -- input SMILES
@@ -564,231 +1368,374 @@ def apply_qsars_to_molecule_list(qsarlist,
             "ULnote" -- applicability domain warnings
             "citation" -- literature to cite for the predicted value
         outfilename -- output file name, default=None which returns concatenated output
-        outkeepdata -- include all of the input file contents in formatted text output, default=True
-        outformat -- "rows" (default) or "columns" for formatted text output, or "dict" for a dict
+        outkeepdata -- include all of the input file contents in formatted text or Parquet output, default=True
+        outformat -- "rows" (default) or "columns" for formatted text output, "dict" for a dict,
+                     "arrays" for a ColumnarResult of numpy arrays, or "parquet" to write a Parquet file
+                     of typed columns to outfilename, which needs pyarrow
         outheader -- include header line in formatted text output, default=True
         outseparator -- column separator for formatted text output, default="\\t" (tab)
         outendline -- row separator for formatted text output, default="\\n" (newline)
+        n_jobs -- number of worker processes that apply the QSARs, default=1, 0 or less uses one per CPU
+        dedup -- apply the QSARs once to repeated SMILES and to SMILES with the same normalized SMILES, default=True
         """
-    # load data from file
-    filelines = None
+    # find the column with SMILES in the header of the input file, the rows are read as they are applied
+    headerlines = None
+    headerfields = None
     if infilename is not None:
-        filetext = ''
-        with open(infilename, 'r') as infile:
-            filetext = infile.read()
-        filelines = filetext.split(inendline)
-        # remove empty lines
-        while '' in filelines:
-            filelines.remove('')
-        # find the index of the column with SMILES
+        headerlines = []
         smiles_index = 0
-        splitline = filelines[inheadtrgtrow-1].split(inseparator)
-        for s in range(len(splitline)):
-            if splitline[s].lower().strip().rstrip() == inheadersmiles.lower():
-                smiles_index = s
+        for r, (line, splitline) in enumerate(_read_rows(infilename, inseparator, inendline, inquoting)):
+            if r >= inheaderrows and r >= inheadtrgtrow:
                 break
-        # extract SMILES into smileslist
-        smileslist = []
-        for i in range(inheaderrows, len(filelines)):
-            splitline = filelines[i].split(inseparator)
-            smileslist.append(splitline[smiles_index])
-    # instantiate a converter if needed
-    if converter is None:
-        converter = ob.OBConversion()
-        converter.SetInAndOutFormats('smi', 'can')
-    # initialize dict to store output
-    result = {'QSAR list':[]}
+            if r == inheadtrgtrow-1:
+                headerfields = splitline
+                for s in range(len(splitline)):
+                    if splitline[s].lower().strip().rstrip() == inheadersmiles.lower():
+                        smiles_index = s
+                        break
+            if r < inheaderrows:
+                headerlines.append(line)
+    # parse through structures
+    if infilename is not None:
+        source = _file_source(infilename, inseparator, inendline, inheaderrows, smiles_index, inquoting)
+        smilesindex = 1
+    else:
+        source = smileslist
+        smilesindex = 0
+    # the number of chemicals is only known in advance for lists
+    count = None
+    if type(source) in (list, tuple):
+        count = len(source)
+    # derive the output columns once from the QSARs, and from the mixtures in the input for mixture QSARs
+    for qsar in qsarlist:
+        qsar.load()
+    if not any([qsar.ismixture for qsar in qsarlist]):
+        # without mixture QSARs the columns only depend on whether there are one or more chemicals
+        if count is None:
+            head, source = _peek(source, 2)
+        else:
+            head = source[:2]
+        schemasource = [row[smilesindex] if smilesindex else row for row in head]
+        orderedcolumnlist = _output_schema(qsarlist, values, schemasource)[0]
+    elif infilename is not None:
+        # only the SMILES column is read ahead to count the solutes and components of the mixtures
+        schemasource = _smiles_column(infilename, inseparator, inendline, inheaderrows, smiles_index, inquoting)
+        orderedcolumnlist, count = _output_schema(qsarlist, values, schemasource)
+    else:
+        # SMILES from an iterator are kept to be read a second time
+        if count is None:
+            source = list(source)
+        orderedcolumnlist, count = _output_schema(qsarlist, values, source)
+    records = iter_apply_qsars(qsarlist,
+                               source,
+                               smilesindex=smilesindex,
+                               converter=converter,
+                               values=values,
+                               separator=outseparator,
+                               endline=outendline,
+                               n_jobs=n_jobs,
+                               dedup=dedup,
+                               )
+    # create rows output, each row is written as it is applied
+    if outformat == 'rows':
+        # if not outputting to file return result
+        if outfilename is None:
+            outfile = io.StringIO()
+            _write_rows(outfile, records, orderedcolumnlist, header=outheader, separator=outseparator, endline=outendline)
+            return outfile.getvalue()
+        # replace tokens for empty delimiters
+        separator = outseparator
+        if outseparator == '<nosep>':
+            separator = ''
+        endline = outendline
+        if outendline == '<noend>':
+            endline = ''
+        with open(outfilename, 'w') as outfile:
+            if outkeepdata and headerlines is not None:
+                _write_rows(outfile, records, orderedcolumnlist, header=outheader, separator=separator, endline=endline,
+                            headerlines=headerlines, inheadtrgtrow=inheadtrgtrow,
+                            keepseparator=outseparator, keependline=outendline)
+            else:
+                _write_rows(outfile, records, orderedcolumnlist, header=outheader, separator=separator, endline=endline)
+        return
+    # write record batches of typed columns to a Parquet file
+    if outformat == 'parquet':
+        if outfilename is None:
+            raise ValueError('Parquet output needs an output file name')
+        inputnames = None
+        if outkeepdata and headerfields is not None:
+            inputnames = [name.strip() for name in headerfields]
+        _write_parquet(outfilename, records, orderedcolumnlist, inputnames=inputnames)
+        return
+    # fill a numpy array for each output column
+    if outformat == 'arrays':
+        # only rows are written to file
+        assert outfilename is None
+        # the arrays are doubled in size as needed if the number of chemicals is not known
+        arrays = ColumnarResult(orderedcolumnlist, count if count is not None else 1024)
+        chem = 0
+        for chem, singleresult in enumerate(records, 1):
+            if chem > len(arrays):
+                arrays.resize(2 * len(arrays))
+            arrays.set_row(chem - 1, singleresult)
+        if chem != len(arrays):
+            arrays.resize(chem)
+        arrays.finish()
+        return arrays
+    # initialize dict to store output with a full column for each output column
+    result = {'QSAR list': []}
     for val in ('insmi', 'normsmi', 'sminote', 'OBMol'):
         if val in values:
             result[val] = []
     for qsar in qsarlist:
-        # initialize dict of calculated results
         result['QSAR list'].append(qsar.model_name)
         result[qsar.model_name] = {} # type: ignore
         for val in values:
             if val in ('endpoint', 'units', 'ULnote', 'citation'):
                 result[qsar.model_name][val] = [] # type: ignore
-    # parse through structures
-    orderedcolumnlist = []
-    for smiles in range(len(smileslist)): # type: ignore
-        # apply qsars to this structure
-        singleresult = apply_qsars_to_molecule(qsarlist,
-                                               smileslist[smiles], # type: ignore
-                                               converter=converter,
-                                               values=values,
-                                               outformat='dict',
-                                               separator=outseparator,
-                                               endline=outendline,
-                                               )
-        # concatenate to output dict
-        for val in values:
-            if val in ('insmi', 'normsmi', 'sminote', 'OBMol'):
-                if val not in orderedcolumnlist:
-                    orderedcolumnlist.append(val)
-                result[val].append(singleresult[val])
-        for qsar in result['QSAR list']:
-            for val in values:
-                if val in ('endpoint', 'units', 'ULnote', 'citation'):
-                    if (qsar, val) not in orderedcolumnlist:
-                        orderedcolumnlist.append((qsar, val))
-                    elif val == 'citation' and (qsar, val) in orderedcolumnlist:
-                        orderedcolumnlist.remove((qsar, val))
-                        orderedcolumnlist.append((qsar, val))
-                    result[qsar][val].append(singleresult[qsar][val]) # type: ignore
-                if val in ('qsarpred', 'UL', 'error'):
-                    if val in singleresult[qsar]:
-                        if val not in result[qsar]:
-                            orderedcolumnlist.append((qsar, val))
-                            result[qsar][val] = [] # type: ignore
-                            for i in range(smiles):
-                                result[qsar][val].append(np.nan) # type: ignore
-                        result[qsar][val].append(singleresult[qsar][val]) # type: ignore
-                    for s in range(1, 201):
-                        localval = ' '.join([val, 'solute', str(s)])
-                        if localval not in singleresult[qsar]:
-                            break
-                        if localval not in result[qsar]:
-                            orderedcolumnlist.append((qsar, localval))
-                            result[qsar][localval] = [] # type: ignore
-                            for i in range(smiles):
-                                result[qsar][localval].append(np.nan) # type: ignore
-                        result[qsar][localval].append(singleresult[qsar][localval]) # type: ignore
-                    for c in range(1, 201):
-                        localval = ' '.join([val, 'component', str(c)])
-                        if localval not in singleresult[qsar]:
-                            break
-                        if localval not in result[qsar]:
-                            orderedcolumnlist.append((qsar, localval))
-                            result[qsar][localval] = [] # type: ignore
-                            for i in range(smiles):
-                                result[qsar][localval].append(np.nan) # type: ignore
-                        result[qsar][localval].append(singleresult[qsar][localval]) # type: ignore
-        # top up any result lists that aren't full
-        for qsar in result['QSAR list']:
-            for val in ('qsarpred', 'UL', 'error'):
-                if val in values:
-                    if val in result[qsar]:
-                        for i in range(1+smiles-len(result[qsar][val])): # type: ignore
-                            result[qsar][val].append(np.nan) # type: ignore
-                    for s in range(1, 201):
-                        localval = ' '.join([val, 'solute', str(s)])
-                        if localval not in result[qsar]:
-                            break
-                        for i in range(1+smiles-len(result[qsar][localval])): # type: ignore
-                            result[qsar][localval].append(np.nan) # type: ignore
-                    for c in range(1, 201):
-                        localval = ' '.join([val, 'component', str(c)])
-                        if localval not in result[qsar]:
-                            break
-                        for i in range(1+smiles-len(result[qsar][localval])): # type: ignore
-                            result[qsar][localval].append(np.nan) # type: ignore
+    targets = []
+    for column in orderedcolumnlist:
+        if type(column) == str:
+            targets.append((None, column, result[column]))
+        else:
+            if column[1] not in result[column[0]]:
+                result[column[0]][column[1]] = [] # type: ignore
+            targets.append((column[0], column[1], result[column[0]][column[1]]))
+    # values missing from a chemical, e.g. mixture columns of a pure chemical, are NaN
+    for singleresult in records:
+        for qsar, val, columnvalues in targets:
+            if qsar is None:
+                columnvalues.append(singleresult[val])
+            else:
+                columnvalues.append(singleresult[qsar].get(val, np.nan))
     # return results dict if outformat is dict
-    outline = ''
     if outformat == 'dict':
         return result
     # create column output
     elif outformat == 'columns':
-        for column in orderedcolumnlist:
-            if column == 'OBMol':
+        # only rows are written to file
+        assert outfilename is None
+        outpieces = []
+        for qsar, val, columnvalues in targets:
+            if val == 'OBMol':
                 continue
-            if type(column) == str:
-                if outheader:
-                    outline = ''.join([outline, column])
-                for chem in result[column]:
-                    if type(chem) != str and np.isnan(chem):
-                        outline = outseparator.join([outline, ''])
-                    else:
-                        outline = outseparator.join([outline, str(chem)])
-                outline = ''.join([outline, outendline])
-            elif type(column) == tuple:
-                if outheader:
-                    outline = ''.join([outline, ' '.join([column[0], column[1]])])
-                for chem in result[column[0]][column[1]]:
-                    if type(chem) != str and np.isnan(chem):
-                        outline = outseparator.join([outline, ''])
-                    else:
-                        outline = outseparator.join([outline, str(chem)])
-                outline = ''.join([outline, outendline])
-    # create rows output
-    elif outformat == 'rows':
-        if outheader:
-            first = True
-            for column in orderedcolumnlist:
-                if column == 'OBMol':
-                    continue
-                if type(column) == str:
-                    if first:
-                        outline = column
-                        first = False
-                    else:
-                        outline = outseparator.join([outline, column])
-                elif type(column) == tuple:
-                    if first:
-                        outline = ' '.join([column[0], column[1]])
-                        first = False
-                    else:
-                        outline = outseparator.join([outline, ' '.join([column[0], column[1]])])
-            outline = ''.join([outline, outendline])
-        for chem in range(len(smileslist)): # type: ignore
-            first = True
-            for column in orderedcolumnlist:
-                if column == 'OBMol':
-                    continue
-                if type(column) == str:
-                    if first:
-                        outline = ''.join([outline, str(result[column][chem])])
-                        first = False
-                    else:
-                        outline = outseparator.join([outline, str(result[column][chem])])
-                elif type(column) == tuple:
-                    if first:
-                        if type(result[column[0]][column[1]][chem]) != str and np.isnan(result[column[0]][column[1]][chem]):
-                            outline = ''.join([outline, ''])
-                        else:
-                            outline = ''.join([outline, str(result[column[0]][column[1]][chem])])
-                        first = False
-                    else:
-                        if type(result[column[0]][column[1]][chem]) != str and np.isnan(result[column[0]][column[1]][chem]):
-                            outline = outseparator.join([outline, ''])
-                        else:
-                            outline = outseparator.join([outline, str(result[column[0]][column[1]][chem])])
-            outline = ''.join([outline, outendline])
-    # if not outputting to file return result
-    if outfilename is None:
-        if outformat == 'dict:':
-            return result
-        else:
-            return outline
-    else:
-        assert outformat == 'rows'
-        # replace tokens for empty delimiters
-        if outseparator == '<nosep>':
-            outline = outline.replace('<nosep>', '')
-        if outendline == '<noend>':
-            outline = outline.replace('<noend>', '')
-        # output with data from input file
-        if outkeepdata and filelines is not None:
-            resultlines = outline.split(outendline)
-            # first append header line if kept
-            infileoffset = inheaderrows
-            resultoffset = 0
             if outheader:
-                resultoffset = 1
-                # append output header row to target row from input file
-                filelines[inheadtrgtrow-1] = outseparator.join([filelines[inheadtrgtrow-1], resultlines[0]])
-                # if there are more input header rows add empty output lines
-                for i in range(infileoffset):
-                    if i == inheadtrgtrow-1:
-                        continue
-                    filelines[i] = outseparator.join([filelines[i], outseparator * resultlines[0].count(outseparator)])
-            for i in range(infileoffset, len(filelines)):
-                filelines[i] = outseparator.join([filelines[i], resultlines[i-infileoffset+resultoffset]])
-            with open(outfilename, 'w') as outfile:
-                outfile.write(outendline.join(filelines))
-        # output result without input data
-        else:
-            with open(outfilename, 'w') as outfile:
-                outfile.write(outline)
+                if qsar is None:
+                    outpieces.append(val)
+                else:
+                    outpieces.append(' '.join([qsar, val]))
+            for chem in columnvalues:
+                outpieces.extend([outseparator, _format_field(chem)])
+            outpieces.append(outendline)
+        return ''.join(outpieces)
+    else:
+        assert outfilename is None
+        return ''
+
+
+def apply_qsar_to_solute_solvent_matrix(qsar,
+                                        solutelist,  # list of solute SMILES as strings
+                                        solventlist,  # list of solvent SMILES as strings
+                                        converter=None,  # OBConversion
+                                        ):
+    """Apply a solute-solvent QSAR to every pair of a list of solutes and a list of solvents and return a dict.
+
+    Each solute and solvent is normalized and its dependencies are predicted once, the QSAR is then evaluated
+    as an outer product of the solute descriptors and the solvent system parameters. This replaces applying
+    the QSAR to one {solute}...{solvent}... mixture SMILES for each pair.
+
+    Required Arguments:
+        qsar -- solute-solvent QSAR obtained from get_qsar_list function of the models subpackage,
+                logKsa is evaluated as an outer product, other QSARs one pair at a time
+        solutelist -- a list of solute SMILES
+        solventlist -- a list of solvent SMILES
+
+    Optional Arguments:
+        converter -- openbabel OBConversion instance, saves a little load time if passed
+
+    The returned dict contains:
+        "solute insmi", "solute normsmi", "solute sminote" -- lists of input and normalized solute SMILES and notes
+        "solvent insmi", "solvent normsmi", "solvent sminote" -- the same for the solvents
+        "qsarpred", "UL", "error", "ULnote" -- 2D numpy arrays with solutes in rows and solvents in columns,
+                                                pairs with a SMILES that could not be normalized are empty
+        "endpoint", "units", "citation" -- descriptions of the predicted values
+    """
+    # openbabel and the smarts in smiles_norm are imported on first use to keep the package import light
+    from openbabel import openbabel as ob
+    from . import smiles_norm
+    from . import models
+    qsar.load()
+    if type(qsar) is not models.METAQSARModel or qsar.check_inputs((None,), (None,)) is not None:
+        raise ValueError(''.join(['QSAR ', qsar.model_name, ' does not take one solute and one solvent']))
+    if converter is None:
+        converter = ob.OBConversion()
+        converter.SetInAndOutFormats('smi', 'can')
+    result = {}
+    dependencies = {}
+    valid = {}
+    # normalize each solute and solvent once and apply its dependency models in dependency order
+    for role, smileslist, dependencymodels, chemicalf in \
+            (('solute', solutelist, qsar.model_namespace.solutedependencymodels, ('u', '0')),
+             ('solvent', solventlist, qsar.model_namespace.solventdependencymodels, ('u', '1'))):
+        plan = models.QSARExecutionPlan(list(dependencymodels.values()))
+        result[' '.join([role, 'insmi'])] = list(smileslist)
+        result[' '.join([role, 'normsmi'])] = []
+        result[' '.join([role, 'sminote'])] = []
+        dependencies[role] = []
+        valid[role] = []
+        molecules = []
+        for i in range(len(smileslist)):
+            molecule, normsmiles, conversionnote = smiles_norm.convertsmiles(smileslist[i], converter)
+            result[' '.join([role, 'normsmi'])].append(normsmiles)
+            result[' '.join([role, 'sminote'])].append(conversionnote)
+            molecules.append(molecule)
+        # predictions from previous sessions are loaded for the whole list at once if a store is open
+        plan.prefetch(result[' '.join([role, 'normsmi'])])
+        for i in range(len(smileslist)):
+            if result[' '.join([role, 'normsmi'])][i] == '':
+                continue
+            predictions = plan.apply(solutes=(molecules[i],), solutef=(chemicalf,))
+            dependencies[role].append(dict(zip(dependencymodels.keys(), predictions)))
+            valid[role].append(i)
+    # calculate the matrix for the chemicals that were normalized, the others are left empty
+    shape = (len(solutelist), len(solventlist))
+    result['qsarpred'] = np.full(shape, np.nan)
+    result['UL'] = np.full(shape, np.nan, dtype=object)
+    result['error'] = np.full(shape, np.nan)
+    result['ULnote'] = np.full(shape, '', dtype=object)
+    result['endpoint'] = qsar.model_namespace.endpoint
+    result['units'] = qsar.model_namespace.units
+    result['citation'] = qsar.model_namespace.citation
+    if len(valid['solute']) and len(valid['solvent']):
+        prediction, ul, error, note, citation, units, endpoint = qsar.calculate_matrix(dependencies['solute'], dependencies['solvent'])
+        pairs = np.ix_(valid['solute'], valid['solvent'])
+        result['qsarpred'][pairs] = prediction
+        result['UL'][pairs] = ul
+        result['error'][pairs] = error
+        result['ULnote'][pairs] = note
+    return result
+
+
+def import_stored_values(qsarlist,
+                         smiles=None,  # list of SMILES as strings
+                         qsars=None,  # list of QSAR names or a single name
+                         values=None,  # list of values
+                         uls='U',  # list of ULs or a single UL
+                         errors=np.nan,  # list of errors or a single error
+                         ulnotes='user value',  # list of notes or a single note
+                         citations='user value',  # list of citations or a single citation
+                         infilename=None,  # string
+                         inseparator='\t',  # any string
+                         inquoting=False,  # True or False
+                         propagate=False,  # True or False
+                         converter=None,  # OBConversion
+                         ):
+    """Add user-entered or experimental values to the stored values of several QSARs at once and return a summary dict.
+
+    The SMILES are normalized the same way as for predictions, each distinct SMILES once, and the values are
+    checked and added to each QSAR in one pass. Values can be passed as lists or read from a file.
+
+    Required Arguments:
+        qsarlist -- list of QSAR objects obtained from get_qsar_list function of the models subpackage
+
+    Optional Arguments:
+        smiles -- list of SMILES of the chemicals
+        qsars -- list of the names of the QSAR each value is for, or one name for all of them
+        values -- list of values
+        uls -- list of Uncertainty Levels, or one UL for all values, "E" for experimental and "U" for user values,
+               default="U"
+        errors -- list of errors, or one error for all values, default=nan
+        ulnotes -- list of UL notes, or one note for all values, default="user value"
+        citations -- list of citations, or one citation for all values, default="user value"
+        infilename -- name of a file with a header row naming the columns "smiles", "qsar" and "value", and
+                      optionally "UL", "error", "ULnote" and "citation", read instead of the lists
+        inseparator -- column separator of the file, default="\\t" (tab)
+        inquoting -- parse double quoted fields of the file, default=False which keeps quotes as they are
+        propagate -- remove the stored predictions of QSARs that depend on the QSARs given values, default=False
+        converter -- openbabel OBConversion instance, saves a little load time if passed
+
+    The returned dict contains:
+        "imported" -- dict of the number of values added to each QSAR
+        "failed" -- list of (row index, SMILES, note) for SMILES that could not be normalized
+    """
+    # openbabel and the smarts in smiles_norm are imported on first use to keep the package import light
+    from openbabel import openbabel as ob
+    from . import smiles_norm
+    from . import models
+    import csv
+    if converter is None:
+        converter = ob.OBConversion()
+        converter.SetInAndOutFormats('smi', 'can')
+    # read the columns from the file if one is passed
+    if infilename is not None:
+        with open(infilename, 'r', newline='') as infile:
+            if inquoting:
+                rows = list(_quoted_rows(infile, inseparator, infilename))
+            else:
+                rows = list(csv.reader(infile, delimiter=inseparator, quoting=csv.QUOTE_NONE))
+        header = rows.pop(0)
+        while len(rows) and len(rows[-1]) == 0:
+            rows.pop(-1)
+        for r, row in enumerate(rows):
+            if len(row) < len(header):
+                raise ValueError('Row {} of {} has {} fields, the header has {}'.format(r + 2, infilename, len(row),
+                                                                                      len(header)))
+        columns = dict([(header[c].strip(), [row[c] for row in rows]) for c in range(len(header))])
+        smiles = columns['smiles']
+        qsars = columns['qsar']
+        values = columns['value']
+        if 'UL' in columns:
+            # single digit ULs are read as int, the same as predicted ULs
+            uls = [int(ul) if ul.isdigit() and len(ul) == 1 else ul for ul in columns['UL']]
+        if 'error' in columns:
+            errors = [float(error) if error != '' else np.nan for error in columns['error']]
+        if 'ULnote' in columns:
+            ulnotes = columns['ULnote']
+        if 'citation' in columns:
+            citations = columns['citation']
+    count = len(smiles)
+    # broadcast single entries to every row
+    qsars = models._broadcast(qsars, count)
+    records = models._stored_records(count, values, uls, errors, ulnotes, citations, None, None)
+    qsardict = dict([(qsar.model_name, qsar) for qsar in qsarlist])
+    for name in set(qsars):
+        if name not in qsardict:
+            raise ValueError(''.join(['QSAR not in qsarlist: ', str(name)]))
+        # user-entered data is not allowed for mixtures
+        if qsardict[name].get_metadata()['chemical_inputs']['total max'] > 1:
+            raise ValueError(''.join(['Stored values cannot be added to the mixture QSAR ', str(name)]))
+    # check every UL before any value is added so that a bad row leaves every QSAR unchanged,
+    # Meta QSARs allow empty ULs the same as in set_stored_list
+    ulsbyqsar = {}
+    for i in range(count):
+        ulsbyqsar.setdefault(qsars[i], []).append(records[i][1])
+    for name, qsaruls in ulsbyqsar.items():
+        models._check_uls(qsaruls, allownan=type(qsardict[name]) is models.METAQSARModel)
+    # normalize each distinct SMILES once
+    normalized = {}
+    for smi in set(smiles):
+        molecule, normsmiles, conversionnote = smiles_norm.convertsmiles(smi, converter)
+        normalized[smi] = (normsmiles, conversionnote)
+    # group the rows by QSAR
+    rowsbyqsar = {}
+    result = {'imported': {}, 'failed': []}
+    for i in range(count):
+        normsmiles, conversionnote = normalized[smiles[i]]
+        if normsmiles == '':
+            result['failed'].append((i, smiles[i], conversionnote))
+            continue
+        rowsbyqsar.setdefault(qsars[i], []).append(i)
+    # add the values to each QSAR at once
+    for name, rows in rowsbyqsar.items():
+        qsardict[name].set_stored_list([normalized[smiles[i]][0] for i in rows],
+                                       [records[i][0] for i in rows],
+                                       uls=[records[i][1] for i in rows],
+                                       errors=[records[i][2] for i in rows],
+                                       ulnotes=[records[i][3] for i in rows],
+                                       citations=[records[i][4] for i in rows],
+                                       propagateup=propagate)
+        result['imported'][name] = len(rows)
+    return result
 
 
 class IFSGUIClass:
@@ -847,6 +1794,7 @@ class IFSGUIClass:
                                                               's', 'a', 'b', 'v', 'l', 'c'])
         self.mixture_qsarmodels = models.get_qsar_list(qsarlist=['logKsa'])
         # setup openbabel converter
+        from openbabel import openbabel as ob
         self.obcon = ob.OBConversion()
         self.obcon.SetInAndOutFormats('smi', 'can')
         # set to single mode
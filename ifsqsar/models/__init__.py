@@ -4,9 +4,13 @@ developed by Trevor N. Brown
 Stores all data and model-specific code for QSARs as python modules and implements a generic API for accessing them
 """
 
-from openbabel import openbabel as ob
 import numpy as np
 import importlib
+import re
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import MutableMapping
 
 
 def _normcdfapprox(x):
@@ -57,6 +61,853 @@ def _calculate_fragment_similarity(counts_array_i, counts_array_j, stdev_array,
     return tanimoto
 
 
+# metadata of every QSAR module, read from the generated manifest module on first use
+_manifest = None
+
+
+def _get_manifest():
+    """Returns the dict of QSAR metadata from the manifest module, keyed by model module"""
+    global _manifest
+    if _manifest is None:
+        try:
+            from . import manifest
+            _manifest = manifest.manifest
+        except ImportError:
+            _manifest = {}
+    return _manifest
+
+
+def _collect_metadata(qsar):
+    """Read the metadata of a QSAR from its model namespace, this loads the model"""
+    qsar.load()
+    metadata = {'model_name': qsar.model_name,
+                'version': qsar.model_namespace.version,
+                'model_class': type(qsar).__name__,
+                'ismixture': qsar.model_namespace.chemical_inputs['total min'] > 1,
+                'value_names': tuple(qsar.model_namespace.value_names),
+                'endpoint': qsar.model_namespace.endpoint,
+                'units': qsar.model_namespace.units,
+                'citation': qsar.model_namespace.citation,
+                'chemical_inputs': dict(qsar.model_namespace.chemical_inputs),
+                }
+    if hasattr(qsar.model_namespace, 'model_type'):
+        metadata['model_type'] = qsar.model_namespace.model_type
+    for dependencies in ('solute_dependencies_list', 'solvent_dependencies_list', 'component_dependencies_list'):
+        if hasattr(qsar.model_namespace, dependencies):
+            metadata[dependencies] = list(getattr(qsar.model_namespace, dependencies))
+    if hasattr(qsar.model_namespace, 'dependency_reads'):
+        metadata['dependency_reads'] = dict(qsar.model_namespace.dependency_reads)
+    return metadata
+
+
+def _model_metadata(qsar):
+    """Returns the metadata of a QSAR from the manifest, falls back to loading the model if it is not listed"""
+    metadata = _get_manifest().get(qsar.model_module)
+    if metadata is None or metadata['version'] != qsar.version:
+        metadata = _collect_metadata(qsar)
+    return dict(metadata)
+
+
+def _dependency_ul_note(label, dependencies):
+    """Return the propagated domain note listing the ULs of the dependencies of one chemical"""
+    domainnotes = []
+    for k, v in dependencies.items():
+        if not type(v[1]) is str and np.isnan(v[1]):
+            continue
+        domainnotes.append(''.join([k, '=', str(v[1])]))
+    if len(domainnotes):
+        return ''.join([label, ' dependency ULs: ', ', '.join(domainnotes)])
+    return ''
+
+
+# matches the propagated domain note of one chemical in a mixture
+_dependencynote = re.compile('^(solute|component|solvent) ([0-9]+) dependency ULs: ')
+
+
+def _renumber_notes(note, numbering):
+    """Renumber the propagated domain notes of the chemicals in a mixture and sort them by their new numbers"""
+    segments = note.split('; ')
+    count = 0
+    while count < len(segments) and _dependencynote.match(segments[count]) is not None:
+        count += 1
+    renumbered = []
+    for segment in segments[:count]:
+        role, number = _dependencynote.match(segment).groups()
+        newnumber = numbering[(role, int(number))]
+        renumbered.append(((['solute', 'component', 'solvent'].index(role), newnumber),
+                           ''.join([role, ' ', str(newnumber), segment[len(role) + 1 + len(number):]])))
+    renumbered.sort()
+    return '; '.join([r[1] for r in renumbered] + segments[count:])
+
+
+def _permute_mixture_result(result, orders, restore=False):
+    """Reorder the outputs of a mixture result from input order to canonical order, or back if restore is True.
+
+    orders holds the canonical order of the input solutes, solvents and components. Outputs that are lists hold
+    one value for each solute followed by each component, and the propagated domain notes are renumbered.
+    """
+    soluteorder, solventorder, componentorder = orders
+    positions = list(soluteorder) + [len(soluteorder) + i for i in componentorder]
+    numbering = {}
+    for role, order in (('solute', soluteorder), ('solvent', solventorder), ('component', componentorder)):
+        for k in range(len(order)):
+            if restore:
+                numbering[(role, k + 1)] = order[k] + 1
+            else:
+                numbering[(role, order[k] + 1)] = k + 1
+    permuted = list(result)
+    for v in range(3):
+        if type(result[v]) is list and len(result[v]) == len(positions):
+            if restore:
+                permuted[v] = [None] * len(positions)
+                for k in range(len(positions)):
+                    permuted[v][positions[k]] = result[v][k]
+            else:
+                permuted[v] = [result[v][p] for p in positions]
+    if type(result[3]) is str:
+        permuted[3] = _renumber_notes(result[3], numbering)
+    return tuple(permuted)
+
+
+# ULs in the order of their integer codes for batch evaluation, nan is used for models without an AD
+_batch_ul_codes = (0, 1, 2, 3, 4, 5, 6, 'E', 'U', np.nan)
+
+
+def _encode_uls(uls):
+    """Convert an array of ULs to integer codes indexing _batch_ul_codes"""
+    uls = np.asarray(uls)
+    if uls.dtype.kind in 'iuf':
+        ulnum = uls.astype(float)
+        codes = np.full(uls.shape, 9)
+    else:
+        uls = uls.astype(object)
+        ule = uls == 'E'
+        ulu = uls == 'U'
+        ulnum = np.where(ule | ulu, np.nan, uls)
+        try:
+            ulnum = ulnum.astype(float)
+        except (TypeError, ValueError):
+            raise ValueError('ULs for batch evaluation must be E, U, int 0-6 or nan')
+        codes = np.where(ule, 7, np.where(ulu, 8, 9))
+    numeric = ~np.isnan(ulnum)
+    if np.any(numeric & ~np.isin(ulnum, (0, 1, 2, 3, 4, 5, 6))):
+        raise ValueError('ULs for batch evaluation must be E, U, int 0-6 or nan')
+    codes[numeric] = ulnum[numeric]
+    return codes
+
+
+# held while a model is loaded and linked to its dependencies, reentrant because dependencies are loaded while linking
+_load_lock = threading.RLock()
+
+
+# empirical training sets of meta QSARs, identical sets are shared between models, the inverted xtx matrices are
+# stacked to calculate the leverage of a descriptor vector vs. all sets at once, and leverages are kept for the
+# most recent vectors, which are the descriptors of the chemicals being applied
+_emptrainsets = []
+_emptrainxtxi = np.zeros((0, 0, 0))
+_emptrainindex = {}
+_emptrainleverages = OrderedDict()
+_emptrainlock = threading.Lock()
+
+# maximum number of descriptor vectors whose leverages are kept
+emptrain_leverage_size = 64
+
+
+def share_emptrainset(emptrainset):
+    """Return the shared copy of an empirical training set and its inverted xtx matrix, adding the set if it is new"""
+    global _emptrainxtxi
+    for i in range(len(_emptrainsets)):
+        if _emptrainsets[i].shape == emptrainset.shape and np.array_equal(_emptrainsets[i], emptrainset):
+            return _emptrainsets[i], _emptrainxtxi[i]
+    xtxi = np.linalg.inv(np.matmul(emptrainset.T, emptrainset))
+    if len(_emptrainsets) > 0 and xtxi.shape != _emptrainxtxi.shape[1:]:
+        raise ValueError('empirical training sets must all have the same number of descriptors')
+    # the shared sets are never freed, so their ids are not reused
+    _emptrainsets.append(emptrainset)
+    _emptrainxtxi = np.concatenate((_emptrainxtxi.reshape((-1,) + xtxi.shape), xtxi[np.newaxis]))
+    _emptrainindex[id(emptrainset)] = len(_emptrainsets) - 1
+    # leverages already calculated do not include the new set
+    with _emptrainlock:
+        _emptrainleverages.clear()
+    return emptrainset, _emptrainxtxi[-1]
+
+
+def empirical_leverage(x, emptrainset):
+    """Return the leverage of descriptor vector x vs. an empirical training set
+
+    The leverages vs. all shared training sets are calculated together the first time a vector is seen, so meta
+    QSARs built on the same descriptors of a chemical share the calculation.
+    """
+    index = _emptrainindex.get(id(emptrainset))
+    if index is None or _emptrainsets[index] is not emptrainset:
+        with _load_lock:
+            index = _emptrainindex[id(share_emptrainset(emptrainset)[0])]
+    key = tuple(x)
+    with _emptrainlock:
+        leverages = _emptrainleverages.get(key)
+        if leverages is not None:
+            _emptrainleverages.move_to_end(key)
+            return leverages[index]
+    leverages = np.matmul(np.matmul(x, _emptrainxtxi), x)
+    with _emptrainlock:
+        _emptrainleverages[key] = leverages
+        while len(_emptrainleverages) > emptrain_leverage_size:
+            _emptrainleverages.popitem(last=False)
+    return leverages[index]
+
+
+# maximum number of predictions kept by each model, None keeps all of them
+cache_size = 100000
+
+# look up default values by identity key when the normalized SMILES is not stored, see PredictionCache.get_stored
+identity_lookup = True
+
+# optional persistent store of predictions shared by all models, see open_prediction_store
+_prediction_store = None
+# seconds a connection to the store waits for the writes of other processes before failing
+store_timeout = 60.0
+
+
+class PredictionStore:
+    """SQLite file of predictions that persists between sessions
+
+    Predictions are keyed by model name, model version, the openbabel version and the normalized SMILES (or
+    mixture key), so a new version of a model or of openbabel does not return old predictions. New predictions
+    are written in batches of flushsize. Models only use the store while their results follow from the default
+    stored values, see PredictionCache.uses_store, so the predictions in the store are valid in every session
+    and are not removed when stored values are changed, reset or erased.
+    """
+
+    def __init__(self, filename, flushsize=1000):
+        """Open or create the SQLite file"""
+        # only needed when a persistent store is used
+        import sqlite3
+        import pickle
+        from openbabel import openbabel as ob
+        self.pickle = pickle
+        self.filename = filename
+        self.flushsize = flushsize
+        self.fingerprint = ''.join(['openbabel ', ob.OBReleaseVersion()])
+        self.pending = {}
+        self.lock = threading.Lock()
+        # worker processes of iter_apply_qsars write to the same file, wait for their writes instead of failing
+        self.connection = sqlite3.connect(filename, timeout=store_timeout, check_same_thread=False)
+        self.connection.execute('CREATE TABLE IF NOT EXISTS predictions (model TEXT, version INTEGER, fingerprint TEXT, '
+                                'key TEXT, result BLOB, PRIMARY KEY (model, version, fingerprint, key))')
+        self.connection.commit()
+
+    def get(self, model, version, key):
+        """Return the stored prediction or None"""
+        with self.lock:
+            if (model, version, key) in self.pending:
+                return self.pending[(model, version, key)]
+            row = self.connection.execute('SELECT result FROM predictions WHERE model=? AND version=? AND fingerprint=? AND key=?',
+                                          (model, version, self.fingerprint, key)).fetchone()
+        if row is None:
+            return None
+        return self.pickle.loads(row[0])
+
+    def get_many(self, model, version, keys):
+        """Return a dict of the stored predictions for a list of keys, keys without a prediction are left out"""
+        results = {}
+        keys = list(keys)
+        with self.lock:
+            # SQLite limits the number of parameters in one query
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i+500]
+                rows = self.connection.execute(''.join(['SELECT key, result FROM predictions WHERE model=? AND version=? AND fingerprint=? AND key IN (',
+                                                        ','.join(['?'] * len(chunk)), ')']),
+                                               [model, version, self.fingerprint] + chunk).fetchall()
+                for key, result in rows:
+                    results[key] = self.pickle.loads(result)
+            for key in keys:
+                if (model, version, key) in self.pending:
+                    results[key] = self.pending[(model, version, key)]
+        return results
+
+    def put(self, model, version, key, result):
+        """Add a prediction, it is written with the next flush"""
+        with self.lock:
+            self.pending[(model, version, key)] = result
+            if len(self.pending) >= self.flushsize:
+                self._flush()
+
+    def delete_many(self, model, version, keys):
+        """Remove the predictions of a list of keys"""
+        with self.lock:
+            for key in keys:
+                self.pending.pop((model, version, key), None)
+            self.connection.executemany('DELETE FROM predictions WHERE model=? AND version=? AND fingerprint=? AND key=?',
+                                        [(model, version, self.fingerprint, key) for key in keys])
+            self.connection.commit()
+
+    def delete_model(self, model, version):
+        """Remove all predictions of a model"""
+        with self.lock:
+            for pendingkey in list(self.pending.keys()):
+                if pendingkey[0] == model and pendingkey[1] == version:
+                    self.pending.pop(pendingkey)
+            self.connection.execute('DELETE FROM predictions WHERE model=? AND version=? AND fingerprint=?',
+                                    (model, version, self.fingerprint))
+            self.connection.commit()
+
+    def flush(self):
+        """Write all pending predictions to the file"""
+        with self.lock:
+            self._flush()
+
+    def _flush(self):
+        """Write all pending predictions, called while holding the lock"""
+        if len(self.pending) == 0:
+            return
+        self.connection.executemany('INSERT OR REPLACE INTO predictions VALUES (?, ?, ?, ?, ?)',
+                                    [(k[0], k[1], self.fingerprint, k[2], self.pickle.dumps(v, protocol=self.pickle.HIGHEST_PROTOCOL))
+                                     for k, v in self.pending.items()])
+        self.connection.commit()
+        self.pending = {}
+
+    def close(self):
+        """Flush and close the file"""
+        self.flush()
+        self.connection.close()
+
+    def prefetch(self, qsarlist, keys):
+        """Load the stored predictions of each QSAR for a batch of normalized SMILES in one query per QSAR"""
+        keys = list(keys)
+        for qsar in qsarlist:
+            if qsar.model_namespace is None:
+                qsar.load()
+            stored = qsar.model_namespace.stored
+            if not stored.uses_store():
+                continue
+            missing = [key for key in keys if key not in stored]
+            if len(missing) == 0:
+                continue
+            for key, result in self.get_many(qsar.model_name, qsar.version, missing).items():
+                stored.prefetched(key, result)
+
+
+def open_prediction_store(filename, flushsize=1000):
+    """Open a persistent store of predictions that all models read from and write to, and return it
+
+    Required Arguments:
+        filename -- name of the SQLite file, created if it does not exist
+
+    Optional Arguments:
+        flushsize -- number of new predictions written to the file at a time, default=1000
+    """
+    global _prediction_store
+    close_prediction_store()
+    _prediction_store = PredictionStore(filename, flushsize)
+    return _prediction_store
+
+
+def close_prediction_store():
+    """Write pending predictions and close the persistent store of predictions, if one is open"""
+    global _prediction_store
+    if _prediction_store is not None:
+        _prediction_store.close()
+        _prediction_store = None
+
+
+# classes of default values that are kept in separate layers, by UL
+_default_classes = ('E', 'U', '')
+
+
+def _default_class(value):
+    """Return the layer of a stored result by its UL: E for experimental, U for user and '' for all others"""
+    if type(value[1]) is str and value[1] in ('E', 'U'):
+        return value[1]
+    return ''
+
+
+def _identity_index(defaults):
+    """Return a dict of identity key to default key, keys shared by several default SMILES are left out"""
+    from ifsqsar import smiles_norm
+    index = {}
+    shared = set()
+    for c in _default_classes:
+        for key in defaults[c]:
+            identity = smiles_norm.identity_key(key)
+            if identity == '' or identity in shared:
+                continue
+            if identity in index and index[identity] != key:
+                shared.add(identity)
+                index.pop(identity)
+                continue
+            index[identity] = key
+    return index
+
+
+class PredictionCache(MutableMapping):
+    """Stored results of a QSAR, used like a dict keyed by normalized SMILES
+
+    Results are kept in layers, looked up in order: the default values of the model, split by UL into
+    experimental, user and other layers, then user values added in the session, then predictions. Default layers
+    are shared and never copied, so resetting, restoring and erasing them switches them on and off instead of
+    copying or scanning them, and overlay returns a new cache of the same defaults. Default values removed or
+    replaced in the session are tracked, so restoring them only visits those.
+
+    Default and user values are always kept, predictions are evicted least recently used first once there are
+    more than maxsize of them. Lookups and evictions are counted. If a persistent store is open, predictions not
+    in memory are looked up in the store and new ones are added to it, as long as the results of the model follow
+    from the default values of the model and of the models it depends on.
+
+    Session results with the citation, units and endpoint of the model are kept as compact records of value,
+    UL, error and an interned ULnote, the metadata is held once and added back when a result is read.
+
+    Default values can also be found by an identity key (a non-standard InChIKey) of the normalized SMILES, so a
+    chemical written differently by another SMILES writer still finds its experimental value. The index of the
+    default keys is built on the first lookup that needs it.
+    """
+
+    def __init__(self, stored=None, maxsize=None, model=None, version=None, metadata=None):
+        """Create the cache, the stored results passed are the default layers"""
+        self.maxsize = maxsize
+        self.model = model
+        self.version = version
+        self.metadata = metadata
+        self.defaults = {c: {} for c in _default_classes}
+        if stored is not None:
+            for key, value in stored.items():
+                self.defaults[_default_class(value)][key] = value
+        self.identities = None
+        self.active = {c: True for c in _default_classes}
+        self.hidden = set()
+        self.pinned = {}
+        self.predictions = OrderedDict()
+        self.flagged = {'E': set(), 'U': set()}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.storehits = 0
+        self.identityhits = 0
+        # called with the key of each evicted prediction while holding the lock
+        self.onevict = None
+        # returns the caches of the models this model depends on, which decide if the persistent store is used
+        self.dependencies = None
+        self.lock = threading.Lock()
+
+    def __getitem__(self, key):
+        with self.lock:
+            value = self._default(key)
+            if value is not None:
+                self.hits += 1
+                return value
+            if key in self.pinned:
+                self.hits += 1
+                return self._expand(self.pinned[key])
+            if key in self.predictions:
+                self.hits += 1
+                self.predictions.move_to_end(key)
+                return self._expand(self.predictions[key])
+        # predictions from previous sessions
+        store = _prediction_store
+        if store is not None and self.uses_store():
+            value = store.get(self.model, self.version, key)
+            if value is not None:
+                with self.lock:
+                    self.storehits += 1
+                    self._insert(key, value)
+                return value
+        with self.lock:
+            self.misses += 1
+        raise KeyError(key)
+
+    def get_stored(self, normsmiles):
+        """Return the stored result of a normalized SMILES, or the default result with the same identity key, or None"""
+        value = self.get(normsmiles)
+        if value is not None or not identity_lookup or normsmiles == '':
+            return value
+        if max([len(self.defaults[c]) for c in _default_classes]) == 0:
+            return None
+        # the index of the default keys is only built when needed, outside the lock because it is slow
+        from ifsqsar import smiles_norm
+        if self.identities is None:
+            self.identities = _identity_index(self.defaults)
+        key = self.identities.get(smiles_norm.identity_key(normsmiles))
+        if key is None or key == normsmiles:
+            return None
+        with self.lock:
+            value = self._default(key)
+            if value is not None:
+                self.identityhits += 1
+            return value
+
+    def __setitem__(self, key, value):
+        with self.lock:
+            self._hide(key)
+            self._unflag(key)
+            self.pinned.pop(key, None)
+            self._insert(key, value)
+        store = _prediction_store
+        if store is not None and self.uses_store():
+            store.put(self.model, self.version, key, value)
+
+    def __delitem__(self, key):
+        self.pop(key)
+
+    def __contains__(self, key):
+        with self.lock:
+            return self._default(key) is not None or key in self.pinned or key in self.predictions
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        with self.lock:
+            return self._count_defaults() + len(self.pinned) + len(self.predictions)
+
+    def keys(self):
+        """Return a list of the keys of all stored results"""
+        return [key for key, value in self.items()]
+
+    def items(self):
+        """Return a list of all stored results as (key, value) pairs, without counting them as lookups"""
+        with self.lock:
+            items = []
+            for c in _default_classes:
+                if self.active[c]:
+                    items.extend([(key, value) for key, value in self.defaults[c].items() if key not in self.hidden])
+            return items + [(key, self._expand(value)) for key, value in self.pinned.items()] + \
+                [(key, self._expand(value)) for key, value in self.predictions.items()]
+
+    def values(self):
+        """Return a list of all stored results, without counting them as lookups"""
+        return [value for key, value in self.items()]
+
+    def pop(self, key, *default):
+        """Remove and return a stored result, without counting it as a lookup"""
+        with self.lock:
+            value = self._default(key)
+            if value is not None:
+                self.hidden.add(key)
+                return value
+            self._unflag(key)
+            if key in self.pinned:
+                return self._expand(self.pinned.pop(key))
+            if key in self.predictions:
+                return self._expand(self.predictions.pop(key))
+            return self.predictions.pop(key, *default)
+
+    def clear(self):
+        """Remove all stored results, including the defaults, the counters are kept"""
+        self._drop_session(False)
+
+    def reset(self):
+        """Remove all results added in the session and restore the defaults, the counters are kept"""
+        self._drop_session(True)
+
+    def restore(self):
+        """Restore the defaults, keeping results added in the session for keys without a default value"""
+        with self.lock:
+            for key in self.hidden:
+                self._unflag(key)
+                self.pinned.pop(key, None)
+                self.predictions.pop(key, None)
+            self.hidden = set()
+            for c in _default_classes:
+                self.active[c] = True
+
+    def erase(self, ul):
+        """Remove all results with a UL of E or U, a default layer is switched off"""
+        with self.lock:
+            self.active[ul] = False
+            keys = self.flagged[ul]
+            self.flagged[ul] = set()
+            for key in keys:
+                self.pinned.pop(key, None)
+                self.predictions.pop(key, None)
+
+    def load_default(self, key):
+        """Restore the default result of one key, if it has one"""
+        with self.lock:
+            for c in _default_classes:
+                if key in self.defaults[c]:
+                    self._unflag(key)
+                    self.predictions.pop(key, None)
+                    if self.active[c]:
+                        self.pinned.pop(key, None)
+                        self.hidden.discard(key)
+                    else:
+                        self.hidden.add(key)
+                        self.pinned[key] = self.defaults[c][key]
+                        self._flag(key, self.pinned[key])
+
+    def overlay(self):
+        """Return an empty cache for a new session over the same default layers, which are not copied"""
+        cache = PredictionCache(None, self.maxsize, self.model, self.version, self.metadata)
+        cache.defaults = self.defaults
+        cache.identities = self.identities
+        return cache
+
+    def copy(self):
+        """Return a dict of all stored results"""
+        return dict(self.items())
+
+    def pin(self, key, value):
+        """Store a result that is never evicted"""
+        with self.lock:
+            self._hide(key)
+            self._unflag(key)
+            self.predictions.pop(key, None)
+            self.pinned[key] = self._compact(value)
+            self._flag(key, value)
+
+    def pin_many(self, items):
+        """Store a list of (key, value) results that are never evicted"""
+        with self.lock:
+            for key, value in items:
+                self._hide(key)
+                self._unflag(key)
+                self.predictions.pop(key, None)
+                self.pinned[key] = self._compact(value)
+                self._flag(key, value)
+
+    def discard_predictions(self, keys):
+        """Remove the predictions of a list of keys, default and user values are kept"""
+        with self.lock:
+            for key in keys:
+                if key in self.predictions:
+                    self._unflag(key)
+                    self.predictions.pop(key)
+
+    def modified(self):
+        """Return True if values were added in the session or default values were removed or switched off"""
+        with self.lock:
+            return len(self.pinned) > 0 or len(self.hidden) > 0 or not all(self.active.values())
+
+    def uses_store(self):
+        """Return True if predictions are read from and written to the persistent store.
+
+        Predictions in the store must be valid in every session, so it is only used while the default values of the
+        model are all visible, the identity lookup of default values is on and no model this model depends on has
+        values added or default values removed in the session.
+        """
+        if _prediction_store is None or self.model is None or not identity_lookup:
+            return False
+        with self.lock:
+            if len(self.hidden) > 0 or not all(self.active.values()):
+                return False
+        if self.dependencies is not None:
+            for cache in self.dependencies():
+                if cache.modified():
+                    return False
+        return True
+
+    def prefetched(self, key, value):
+        """Add a prediction read from the persistent store"""
+        with self.lock:
+            if self._default(key) is None and key not in self.pinned and key not in self.predictions:
+                self.storehits += 1
+                self._insert(key, value)
+
+    def _compact(self, value):
+        """Return the compact record of a result, or the result if its metadata is not the model metadata"""
+        if self.metadata is None or len(value) != 7 or value[4:] != self.metadata:
+            return value
+        ul = value[1]
+        note = value[3]
+        # equal notes share one string, and nan ULs the shared nan
+        if type(note) is str:
+            note = sys.intern(note)
+        if type(ul) is float and ul != ul:
+            ul = np.nan
+        return value[0], ul, value[2], note
+
+    def _expand(self, record):
+        """Return the result of a compact record"""
+        if len(record) == 4:
+            return record + self.metadata
+        return record
+
+    def _default(self, key):
+        """Return the visible default result of a key or None, called while holding the lock"""
+        if key in self.hidden:
+            return None
+        for c in _default_classes:
+            if self.active[c] and key in self.defaults[c]:
+                return self.defaults[c][key]
+        return None
+
+    def _count_defaults(self):
+        """Return the number of visible default results, called while holding the lock"""
+        count = 0
+        for c in _default_classes:
+            if self.active[c]:
+                count += len(self.defaults[c]) - len([key for key in self.hidden if key in self.defaults[c]])
+        return count
+
+    def _hide(self, key):
+        """Track a default key replaced in the session, called while holding the lock"""
+        for c in _default_classes:
+            if key in self.defaults[c]:
+                self.hidden.add(key)
+
+    def _flag(self, key, value):
+        """Track a session key with a UL of E or U, called while holding the lock"""
+        if type(value[1]) is str and value[1] in self.flagged:
+            self.flagged[value[1]].add(key)
+
+    def _unflag(self, key):
+        """Stop tracking the UL of a session key, called while holding the lock"""
+        for flagged in self.flagged.values():
+            flagged.discard(key)
+
+    def _drop_session(self, defaults):
+        """Remove all session results and switch the default layers on or off"""
+        with self.lock:
+            self.pinned = {}
+            self.predictions = OrderedDict()
+            self.flagged = {'E': set(), 'U': set()}
+            self.hidden = set()
+            for c in _default_classes:
+                self.active[c] = defaults
+
+    def _insert(self, key, value):
+        """Add a prediction and evict the least recently used ones, called while holding the lock"""
+        self.predictions.pop(key, None)
+        self.predictions[key] = self._compact(value)
+        self._flag(key, value)
+        self._evict()
+
+    def _evict(self):
+        """Evict the least recently used predictions beyond maxsize, called while holding the lock"""
+        if self.maxsize is not None:
+            while len(self.predictions) > self.maxsize:
+                key, value = self.predictions.popitem(last=False)
+                self._unflag(key)
+                self.evictions += 1
+                if self.onevict is not None:
+                    self.onevict(key)
+
+    def resize(self, maxsize):
+        """Change the maximum number of predictions, evicting the least recently used if there are too many"""
+        with self.lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def get_stats(self):
+        """Return a dict of the cache counters and sizes"""
+        with self.lock:
+            return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'store hits': self.storehits,
+                    'identity hits': self.identityhits,
+                    'pinned': self._count_defaults() + len(self.pinned), 'predictions': len(self.predictions),
+                    'maxsize': self.maxsize}
+
+
+# indices of all fields in a QSAR output: value, UL, error, ULnote, citation, units, endpoint
+_all_fields = frozenset(range(7))
+
+
+def _parse_ul(ul):
+    """Return the number of a UL or None if it has none, and if it contains "E" and "U".
+
+    A UL is an int 0-6 or a string of at most one each of E, U and a digit 0-6 in any order, anything else raises
+    a ValueError."""
+    if type(ul) is int and ul in (0, 1, 2, 3, 4, 5, 6):
+        return ul, False, False
+    if type(ul) is str:
+        digits = [c for c in ul if c in '0123456']
+        flags = (ul.count('E'), ul.count('U'))
+        if len(digits) <= 1 and max(flags) <= 1 and len(digits) + sum(flags) == len(ul):
+            return int(digits[0]) if digits else None, flags[0] == 1, flags[1] == 1
+    raise ValueError('User-defined UL must be E, U, int 0-6 or combination thereof')
+
+
+def _check_uls(uls, allownan=False):
+    """Raise a ValueError if any UL is not E, U, int 0-6 or a combination, each distinct UL is checked once"""
+    checked = set()
+    for ul in uls:
+        if allownan and isinstance(ul, float) and np.isnan(ul):
+            continue
+        if type(ul) is not int and type(ul) is not str:
+            raise ValueError('User-defined UL must be E, U, int 0-6 or combination thereof')
+        if ul in checked:
+            continue
+        _parse_ul(ul)
+        checked.add(ul)
+
+
+def _broadcast(field, count):
+    """Return a list of count copies of a single value, or the list of values if it has count of them"""
+    if isinstance(field, str) or not hasattr(field, '__len__'):
+        return [field] * count
+    if len(field) != count:
+        raise ValueError('Stored value lists must all be the same length as the SMILES list')
+    return field
+
+
+def _stored_records(count, values, uls, errors, ulnotes, citations, units, endpoint):
+    """Return a list of stored tuples from lists or single values broadcast to count records"""
+    fields = [_broadcast(field, count) for field in (values, uls, errors, ulnotes, citations)]
+    # numbers are converted as arrays, numpy integer ULs to int
+    values = np.asarray(fields[0], dtype=float).tolist()
+    errors = np.asarray(fields[2], dtype=float).tolist()
+    uls = [int(ul) if isinstance(ul, np.integer) else ul for ul in fields[1]]
+    return [(values[i], uls[i], errors[i], fields[3][i], fields[4][i], units, endpoint) for i in range(count)]
+
+
+def _discard_super_predictions(qsar, normsmileslist):
+    """Remove the predictions for a list of chemicals from every model that depends on the QSAR, each model once"""
+    for supermodel in _related_models(qsar, False, True):
+        keys = list(normsmileslist)
+        for normsmiles in normsmileslist:
+            keys.extend(supermodel.pop_mixture_keys(normsmiles))
+        supermodel.model_namespace.stored.discard_predictions(keys)
+
+
+# incremented whenever a model is linked to a dependency, so the cached related models are found again
+_graph_version = 0
+
+
+def _related_models(qsar, propagatedown, propagateup):
+    """Return the models the QSAR depends on and the models that depend on it, each once, in depth first order"""
+    if not propagatedown and not propagateup:
+        return []
+    # the dependency graph only changes when models are loaded, so the related models are cached
+    cached = qsar.related_models.get((propagatedown, propagateup))
+    if cached is not None and cached[0] == _graph_version:
+        return cached[1]
+    version = _graph_version
+    related = []
+    visited = set([id(qsar)])
+    if propagatedown:
+        for m in _dependency_models(qsar):
+            _visit_related(m, related, visited, _dependency_models)
+    if propagateup:
+        for m in qsar.super_models:
+            _visit_related(m, related, visited, _super_models)
+    qsar.related_models[(propagatedown, propagateup)] = (version, related)
+    return related
+
+
+def _visit_related(qsar, related, visited, neighbours):
+    """Depth first search of the dependency graph in one direction, appending each model once before its neighbours"""
+    if id(qsar) in visited:
+        return
+    visited.add(id(qsar))
+    related.append(qsar)
+    for m in neighbours(qsar):
+        _visit_related(m, related, visited, neighbours)
+
+
+def _dependency_models(qsar):
+    """Return the solute, component and solvent dependency models of a QSAR"""
+    if type(qsar) is not METAQSARModel:
+        return []
+    if qsar.model_namespace is None:
+        qsar.load()
+    return list(qsar.model_namespace.solutedependencymodels.values()) + \
+        list(qsar.model_namespace.componentdependencymodels.values()) + \
+        list(qsar.model_namespace.solventdependencymodels.values())
+
+
+def _super_models(qsar):
+    """Return the models that depend on a QSAR"""
+    return qsar.super_models
+
+
 class QSARModel:
     """Class that loads a QSAR stored as a python module and applies it
     to molecules passed to it as IFSMols (subclass of openbabel mols)"""
@@ -70,7 +921,11 @@ class QSARModel:
         self.model_name = model_name
         self.version = version
         self.super_models = []
+        # models reached when propagating stored data changes, cached by _related_models
+        self.related_models = {}
         self.default_stored = {}
+        # SMARTS patterns of the model are shared, so matching is done by one thread at a time
+        self.smarts_lock = threading.Lock()
 
     def __str__(self):
         return self.model_name
@@ -78,46 +933,78 @@ class QSARModel:
     def __repr__(self):
         return self.__str__()
 
+    def get_metadata(self):
+        """Return a dict of metadata and dependencies from the manifest, without loading the model"""
+        return _model_metadata(self)
+
+    def add_super_model(self, qsar):
+        """Record a model that depends on this one, once"""
+        global _graph_version
+        if qsar not in self.super_models:
+            self.super_models.append(qsar)
+            _graph_version += 1
+
+    def set_cache_size(self, maxsize):
+        """Set the maximum number of predictions stored, None for no limit"""
+        if self.model_namespace is None:
+            self.load()
+        self.model_namespace.stored.resize(maxsize)
+
+    def get_cache_stats(self):
+        """Return a dict of the hits, misses and evictions of the stored predictions"""
+        if self.model_namespace is None:
+            self.load()
+        return self.model_namespace.stored.get_stats()
+
     def load(self):
         """Import the QSAR python module"""
         if self.model_namespace is not None:
             return
-        self.model_namespace = importlib.import_module(self.model_module)
-        # check that self.version matches the version in self.model_namespace
-        try:
-            assert self.version == self.model_namespace.version
-        except AssertionError:
-            print('Model', self.model_name, 'version mismatch:', self.version, self.model_namespace.version)
-        self.model_namespace.smartslist = []
-        for smarts in self.model_namespace.fragmentlist['smarts']:
-            if smarts == b'intercept':
-                self.model_namespace.smartslist.append('intercept')
-            elif smarts == b'sssr':
-                self.model_namespace.smartslist.append('sssr')
-            elif smarts == b'MW':
-                self.model_namespace.smartslist.append('MW')
-            else:
-                pattern = ob.OBSmartsPattern()
-                pattern.Init(smarts.decode('utf-8'))
-                self.model_namespace.smartslist.append(pattern)
-        self.model_namespace.coefficientarray = np.mean(self.model_namespace.coefficientarrays, axis=1)
-        if self.model_namespace.domain:
-            if self.model_namespace.intercept:
-                self.model_namespace.xtxi = np.linalg.inv(
-                    np.matmul(self.model_namespace.train_counts[:, 1:].T, self.model_namespace.train_counts[:, 1:]))
-            else:
-                self.model_namespace.xtxi = np.linalg.inv(
-                    np.matmul(self.model_namespace.train_counts.T, self.model_namespace.train_counts))
-            self.model_namespace.neg_dom_check_init = []
-            for s in range(self.model_namespace.neg_dom_check.shape[0]):
-                smarts1, smarts2, description = self.model_namespace.neg_dom_check[s]
-                pattern1 = ob.OBSmartsPattern()
-                pattern1.Init(smarts1.decode('utf-8'))
-                pattern2 = ob.OBSmartsPattern()
-                pattern2.Init(smarts2.decode('utf-8'))
-                self.model_namespace.neg_dom_check_init.append((pattern1, pattern2, description.decode('utf-8')))
-        # backup the stored data for reset and restore
-        self.default_stored = self.model_namespace.stored.copy()
+        # models are loaded by one thread at a time, and are only visible to other threads once linked
+        with _load_lock:
+            if self.model_namespace is not None:
+                return
+            # openbabel is only needed once a model is actually loaded
+            from openbabel import openbabel as ob
+            namespace = importlib.import_module(self.model_module)
+            # check that self.version matches the version in the model module
+            try:
+                assert self.version == namespace.version
+            except AssertionError:
+                print('Model', self.model_name, 'version mismatch:', self.version, namespace.version)
+            namespace.smartslist = []
+            for smarts in namespace.fragmentlist['smarts']:
+                if smarts == b'intercept':
+                    namespace.smartslist.append('intercept')
+                elif smarts == b'sssr':
+                    namespace.smartslist.append('sssr')
+                elif smarts == b'MW':
+                    namespace.smartslist.append('MW')
+                else:
+                    pattern = ob.OBSmartsPattern()
+                    pattern.Init(smarts.decode('utf-8'))
+                    namespace.smartslist.append(pattern)
+            namespace.coefficientarray = np.mean(namespace.coefficientarrays, axis=1)
+            if namespace.domain:
+                if namespace.intercept:
+                    namespace.xtxi = np.linalg.inv(
+                        np.matmul(namespace.train_counts[:, 1:].T, namespace.train_counts[:, 1:]))
+                else:
+                    namespace.xtxi = np.linalg.inv(
+                        np.matmul(namespace.train_counts.T, namespace.train_counts))
+                namespace.neg_dom_check_init = []
+                for s in range(namespace.neg_dom_check.shape[0]):
+                    smarts1, smarts2, description = namespace.neg_dom_check[s]
+                    pattern1 = ob.OBSmartsPattern()
+                    pattern1.Init(smarts1.decode('utf-8'))
+                    pattern2 = ob.OBSmartsPattern()
+                    pattern2.Init(smarts2.decode('utf-8'))
+                    namespace.neg_dom_check_init.append((pattern1, pattern2, description.decode('utf-8')))
+            # backup the stored data for reset and restore
+            self.default_stored = dict(namespace.stored)
+            namespace.stored = PredictionCache(self.default_stored, cache_size, self.model_name, self.version,
+                                               (namespace.citation, namespace.units, namespace.endpoint))
+            self.model_namespace = namespace
 
     def set_stored(self, normsmiles, value, ul='U', error=np.nan, ulnote='user value', citation='user value', units=None, endpoint=None):
         """Add a stored value with user-entered data"""
@@ -125,110 +1012,114 @@ class QSARModel:
         if self.model_namespace is None:
             self.load()
         # check that UL is one of the permitted values
-        if type(ul) is not int and type(ul) is not str:
-            raise ValueError('User-defined UL must be E, U, int 0-6 or combination thereof')
-        elif type(ul) is int and ul not in [0, 1, 2, 3, 4, 5, 6]:
-            raise ValueError('User-defined UL must be E, U, int 0-6 or combination thereof')
-        elif type(ul) is str:
-            counts = []
-            for c in ['E', 'U', '0', '1', '2', '3', '4', '5', '6']:
-                counts.append(ul.count(c))
-                if counts[-1] > 1:
-                    raise ValueError('User-defined UL must be E, U, int 0-6 or combination thereof')
-            if len(ul) - sum(counts) > 0:
-                raise ValueError('User-defined UL must be E, U, int 0-6 or combination thereof')
+        _check_uls([ul])
         # set units and endpoint from model namespace if not provided with input
         if units is None:
             units = self.model_namespace.units
         if endpoint is None:
             endpoint = self.model_namespace.endpoint
-        # add user value to stored data
-        self.model_namespace.stored[normsmiles] = (value, ul, error, ulnote, citation, units, endpoint)
+        # add user value to stored data, it is never evicted
+        self.model_namespace.stored.pin(normsmiles, (value, ul, error, ulnote, citation, units, endpoint))
+
+    def set_stored_list(self, normsmileslist, values, uls='U', errors=np.nan, ulnotes='user value', citations='user value', units=None,
+                        endpoint=None, propagateup=False):
+        """Add a list of stored values with user-entered data, single values are used for every chemical"""
+        # check if model has been loaded
+        if self.model_namespace is None:
+            self.load()
+        # set units and endpoint from model namespace if not provided with input
+        if units is None:
+            units = self.model_namespace.units
+        if endpoint is None:
+            endpoint = self.model_namespace.endpoint
+        records = _stored_records(len(normsmileslist), values, uls, errors, ulnotes, citations, units, endpoint)
+        _check_uls([record[1] for record in records])
+        # add user values to stored data, they are never evicted
+        self.model_namespace.stored.pin_many(zip(normsmileslist, records))
+        # predictions of models that depend on this one are out of date
+        if propagateup:
+            _discard_super_predictions(self, normsmileslist)
 
     def load_stored(self, normsmiles, propagatedown=False, propagateup=False):
         """Remove a specific stored value"""
         # check if model has been loaded
         if self.model_namespace is None:
             self.load()
-        if normsmiles in self.default_stored:
-            self.model_namespace.stored[normsmiles] = self.default_stored[normsmiles]
-        if propagateup:
-            for qsar in self.super_models:
-                qsar.load_stored(normsmiles, propagateup=propagateup)
+        self.model_namespace.stored.load_default(normsmiles)
+        # apply to each related model once, a model can be reached through several dependencies
+        for qsar in _related_models(self, propagatedown, propagateup):
+            qsar.load_stored(normsmiles)
 
     def remove_stored(self, normsmiles, propagatedown=False, propagateup=False):
         """Remove a specific stored value"""
         # check if model has been loaded
         if self.model_namespace is None:
             self.load()
-        if normsmiles in self.model_namespace.stored:
-            self.model_namespace.stored.pop(normsmiles)
-        if propagateup:
-            for qsar in self.super_models:
-                qsar.remove_stored(normsmiles, propagateup=propagateup)
+        self.model_namespace.stored.pop(normsmiles, None)
+        # apply to each related model once, a model can be reached through several dependencies
+        for qsar in _related_models(self, propagatedown, propagateup):
+            qsar.remove_stored(normsmiles)
 
     def reset_stored(self, propagatedown=False, propagateup=False):
         """Reset the stored data to default, erasing all predicted and user data"""
         # check if model has been loaded
         if self.model_namespace is None:
             self.load()
-        self.model_namespace.stored = self.default_stored.copy()
-        if propagateup:
-            for qsar in self.super_models:
-                qsar.reset_stored(propagateup=propagateup)
+        self.model_namespace.stored.reset()
+        # apply to each related model once, a model can be reached through several dependencies
+        for qsar in _related_models(self, propagatedown, propagateup):
+            qsar.reset_stored()
 
     def restore_stored(self, propagatedown=False, propagateup=False):
         """Reset the stored data to default, preserving predicted and user data not in the default data"""
         # check if model has been loaded
         if self.model_namespace is None:
             self.load()
-        self.model_namespace.stored.update(self.default_stored)
-        if propagateup:
-            for qsar in self.super_models:
-                qsar.restore_stored(propagateup=propagateup)
+        self.model_namespace.stored.restore()
+        # apply to each related model once, a model can be reached through several dependencies
+        for qsar in _related_models(self, propagatedown, propagateup):
+            qsar.restore_stored()
 
     def erase_user_stored(self, propagatedown=False, propagateup=False):
         """Erase all stored data flagged as user ('U')"""
         # check if model has been loaded
         if self.model_namespace is None:
             self.load()
-        for key in list(self.model_namespace.stored.keys()):
-            if self.model_namespace.stored[key][1] == 'U':
-                self.model_namespace.stored.pop(key)
-        if propagateup:
-            for qsar in self.super_models:
-                qsar.erase_user_stored(propagateup=propagateup)
+        self.model_namespace.stored.erase('U')
+        # apply to each related model once, a model can be reached through several dependencies
+        for qsar in _related_models(self, propagatedown, propagateup):
+            qsar.erase_user_stored()
 
     def erase_experimental_stored(self, propagatedown=False, propagateup=False):
         """Erase all stored data flagged as experimental ('E')"""
         # check if model has been loaded
         if self.model_namespace is None:
             self.load()
-        for key in list(self.model_namespace.stored.keys()):
-            if self.model_namespace.stored[key][1] == 'E':
-                self.model_namespace.stored.pop(key)
-        if propagateup:
-            for qsar in self.super_models:
-                qsar.erase_experimental_stored(propagateup=propagateup)
+        self.model_namespace.stored.erase('E')
+        # apply to each related model once, a model can be reached through several dependencies
+        for qsar in _related_models(self, propagatedown, propagateup):
+            qsar.erase_experimental_stored()
 
     def erase_all_stored(self, propagatedown=False, propagateup=False):
         """Erase all stored data, so only predicted values are returned"""
         # check if model has been loaded
         if self.model_namespace is None:
             self.load()
-        self.model_namespace.stored = {}
-        if propagateup:
-            for qsar in self.super_models:
-                qsar.erase_all_stored(propagateup=propagateup)
+        self.model_namespace.stored.clear()
+        # apply to each related model once, a model can be reached through several dependencies
+        for qsar in _related_models(self, propagatedown, propagateup):
+            qsar.erase_all_stored()
 
-    def apply_model(self, solutes=tuple(), solvents=tuple(), components=tuple(), solutef=tuple(), solventf=tuple(), componentf=tuple()):
-        """Take openbabel mol in a list, apply the QSAR and return the results"""
+    def apply_model(self, solutes=tuple(), solvents=tuple(), components=tuple(), solutef=tuple(), solventf=tuple(), componentf=tuple(),
+                    prediction_only=False):
+        """Take openbabel mol in a list, apply the QSAR and return the results, without the AD if prediction_only"""
         # check if model has been loaded
         if self.model_namespace is None:
             self.load()
         # first test if this molecule is stored and pass stored results if so
-        if solutes[0].normsmiles in self.model_namespace.stored:
-            return self.model_namespace.stored[solutes[0].normsmiles]
+        stored = self.model_namespace.stored.get_stored(solutes[0].normsmiles)
+        if stored is not None:
+            return stored
         # assert that there is the correct number of solutes and solvents
         # current assumption for QSARs is that only one chemical is handled at a time,
         # designated as a solute regardless of property type
@@ -238,68 +1129,78 @@ class QSARModel:
                 len(solutes)+len(solvents)+len(components) < self.model_namespace.chemical_inputs['total min'] or \
                 len(solutes)+len(solvents)+len(components) > self.model_namespace.chemical_inputs['total max']:
             return np.nan, np.nan, np.nan, 'chemical input error: mixture specification not allowed', '', '', ''
-        # add or delete hydrogens depending on model
-        if self.model_namespace.molecule_format == 'old_format':
-            solutes[0].AddHydrogens()
-        else:
-            solutes[0].DeleteHydrogens()
-        # get fragment counts for MLR
-        fragment_counts = []
-        if self.model_namespace.model_type == 'MLR':
-            for smarts in self.model_namespace.smartslist:
-                if smarts == 'intercept':
-                    fragment_counts.append(1)
-                elif smarts == 'sssr':
-                    fragment_counts.append(len(solutes[0].GetSSSR()))
-                elif smarts == 'MW':
-                    fragment_counts.append(solutes[0].GetMolWt())
-                else:
-                    smarts.Match(solutes[0])
-                    fragment_counts.append(len(smarts.GetUMapList()))
-        # get fragment counts for MLRX
-        elif self.model_namespace.model_type == 'MLRX':
-            matchedatoms = set()
-            for smarts in self.model_namespace.smartslist:
-                if smarts == 'intercept':
-                    fragment_counts.append(1)
-                elif smarts == 'sssr':
-                    fragment_counts.append(len(solutes[0].GetSSSR()))
-                elif smarts == 'MW':
-                    fragment_counts.append(solutes[0].GetMolWt())
-                else:
-                    smarts.Match(solutes[0])
-                    matchlist = smarts.GetUMapList()
-                    matchcount = 0
-                    for match in matchlist:
-                        if len(set(match).intersection(matchedatoms)) == 0:
-                            matchcount += 1
-                            matchedatoms.update(set(match))
-                    fragment_counts.append(matchcount)
-        # get fragment counts for MLRA
-        elif self.model_namespace.model_type == 'MLRA':
-            for smarts in self.model_namespace.smartslist:
-                if smarts == 'intercept':
-                    fragment_counts.append(1)
-                elif smarts == 'sssr':
-                    if len(solutes[0].GetSSSR()) > 0:
+        # the SMARTS patterns keep the results of the last match, so one chemical is matched at a time
+        with self.smarts_lock:
+            # add or delete hydrogens depending on model
+            if self.model_namespace.molecule_format == 'old_format':
+                solutes[0].AddHydrogens()
+            else:
+                solutes[0].DeleteHydrogens()
+            # get fragment counts for MLR
+            fragment_counts = []
+            if self.model_namespace.model_type == 'MLR':
+                for smarts in self.model_namespace.smartslist:
+                    if smarts == 'intercept':
                         fragment_counts.append(1)
+                    elif smarts == 'sssr':
+                        fragment_counts.append(len(solutes[0].GetSSSR()))
+                    elif smarts == 'MW':
+                        fragment_counts.append(solutes[0].GetMolWt())
                     else:
-                        fragment_counts.append(0)
-                elif smarts == 'MW':
-                    fragment_counts.append(solutes[0].GetMolWt())
-                else:
-                    smarts.Match(solutes[0])
-                    if len(smarts.GetUMapList()) > 0:
+                        smarts.Match(solutes[0])
+                        fragment_counts.append(len(smarts.GetUMapList()))
+            # get fragment counts for MLRX
+            elif self.model_namespace.model_type == 'MLRX':
+                matchedatoms = set()
+                for smarts in self.model_namespace.smartslist:
+                    if smarts == 'intercept':
                         fragment_counts.append(1)
+                    elif smarts == 'sssr':
+                        fragment_counts.append(len(solutes[0].GetSSSR()))
+                    elif smarts == 'MW':
+                        fragment_counts.append(solutes[0].GetMolWt())
                     else:
-                        fragment_counts.append(0)
+                        smarts.Match(solutes[0])
+                        matchlist = smarts.GetUMapList()
+                        matchcount = 0
+                        for match in matchlist:
+                            if len(set(match).intersection(matchedatoms)) == 0:
+                                matchcount += 1
+                                matchedatoms.update(set(match))
+                        fragment_counts.append(matchcount)
+            # get fragment counts for MLRA
+            elif self.model_namespace.model_type == 'MLRA':
+                for smarts in self.model_namespace.smartslist:
+                    if smarts == 'intercept':
+                        fragment_counts.append(1)
+                    elif smarts == 'sssr':
+                        if len(solutes[0].GetSSSR()) > 0:
+                            fragment_counts.append(1)
+                        else:
+                            fragment_counts.append(0)
+                    elif smarts == 'MW':
+                        fragment_counts.append(solutes[0].GetMolWt())
+                    else:
+                        smarts.Match(solutes[0])
+                        if len(smarts.GetUMapList()) > 0:
+                            fragment_counts.append(1)
+                        else:
+                            fragment_counts.append(0)
         fragment_counts = np.array(fragment_counts)
         # apply multiple linear regression qsar
         if self.model_namespace.model_type in ('MLR', 'MLRX', 'MLRA'):
             # apply qsar
             prediction = (fragment_counts * self.model_namespace.coefficientarray).sum()
             error = np.nan
-            if self.model_namespace.domain:
+            # only the prediction is used, skip the AD but keep the bounds and do not store the incomplete result
+            if self.model_namespace.domain and prediction_only:
+                if self.model_namespace.lower_bound and prediction < self.model_namespace.min_train:
+                    prediction = self.model_namespace.min_train
+                if self.model_namespace.upper_bound and prediction > self.model_namespace.max_train:
+                    prediction = self.model_namespace.max_train
+                post_proc_prediction, post_proc_error = self.model_namespace.post_processing(prediction, error)
+                return post_proc_prediction, np.nan, post_proc_error, '', self.model_namespace.citation, self.model_namespace.units, self.model_namespace.endpoint
+            elif self.model_namespace.domain:
                 # calculate CSS
                 topn = 5
                 topgroup = []
@@ -362,11 +1263,12 @@ class QSARModel:
                         note.append('high leverage')
                 # negative domain check for atom type violations
                 violations = []
-                for pattern1, pattern2, description in self.model_namespace.neg_dom_check_init:
-                    pattern1.Match(solutes[0])
-                    pattern2.Match(solutes[0])
-                    if len(pattern1.GetUMapList()) != len(pattern2.GetUMapList()):
-                        violations.append(description)
+                with self.smarts_lock:
+                    for pattern1, pattern2, description in self.model_namespace.neg_dom_check_init:
+                        pattern1.Match(solutes[0])
+                        pattern2.Match(solutes[0])
+                        if len(pattern1.GetUMapList()) != len(pattern2.GetUMapList()):
+                            violations.append(description)
                 if len(violations) > 0:
                     ul = 5
                     error = self.model_namespace.warn_5_error
@@ -404,7 +1306,14 @@ class METAQSARModel:
         self.model_name = model_name
         self.version = version
         self.super_models = []
+        # models reached when propagating stored data changes, cached by _related_models
+        self.related_models = {}
         self.default_stored = {}
+        # keys of stored mixture results that contain each chemical, for removing them with the chemical
+        self.mixture_keys = {}
+        self.mixture_lock = threading.Lock()
+        # fields of the dependency outputs read by calculate, read from the manifest when first planned
+        self.dependency_reads = None
 
     def __str__(self):
         return self.model_name
@@ -412,235 +1321,309 @@ class METAQSARModel:
     def __repr__(self):
         return self.__str__()
 
+    def get_metadata(self):
+        """Return a dict of metadata and dependencies from the manifest, without loading the model"""
+        return _model_metadata(self)
+
+    def add_super_model(self, qsar):
+        """Record a model that depends on this one, once"""
+        global _graph_version
+        if qsar not in self.super_models:
+            self.super_models.append(qsar)
+            _graph_version += 1
+
+    def set_cache_size(self, maxsize):
+        """Set the maximum number of predictions stored, None for no limit"""
+        if self.model_namespace is None:
+            self.load()
+        self.model_namespace.stored.resize(maxsize)
+
+    def get_cache_stats(self):
+        """Return a dict of the hits, misses and evictions of the stored predictions"""
+        if self.model_namespace is None:
+            self.load()
+        return self.model_namespace.stored.get_stats()
+
+    def get_dependency_reads(self):
+        """Return the fields of each dependency output read by the model as a dict of dependency name to indices
+
+        The fields are declared by the dependency_reads dict of the model module and read from the manifest, '*'
+        stands for every dependency. Models that do not declare them are taken to read every field.
+        """
+        if self.dependency_reads is None:
+            reads = _model_metadata(self).get('dependency_reads', {'*': _all_fields})
+            self.dependency_reads = dict([(name, frozenset(fields)) for name, fields in reads.items()])
+        return self.dependency_reads
+
     def load(self):
         """Import the QSAR python module and link the QSAR dependencies"""
         # check if model has been linked
         if self.model_namespace is not None:
             return
-        # initiate model namespace
-        self.model_namespace = importlib.import_module(self.model_module)
-        # check that self.version matches the version in self.model_namespace
-        try:
-            assert self.version == self.model_namespace.version
-        except AssertionError:
-            print('Model', self.model_name, 'version mismatch:', self.version, self.model_namespace.version)
-        # check if model is a mixture or not to help format outputs
-        if self.model_namespace.chemical_inputs['total min'] <= 1:
-            self.ismixture = False
-        else:
-            self.ismixture = True
-        # link models which depend on this one
-        # link solute dependencies
-        self.model_namespace.solutedependencymodels = {}
-        solute_dependencies_list = []
-        solute_dependencies_version_list = []
-        for sd in self.model_namespace.solute_dependencies_list:
-            if type(sd) is tuple:
-                solute_dependencies_list.append(sd[0])
-                solute_dependencies_version_list.append(sd[1])
-            else:
-                solute_dependencies_list.append(sd)
-                solute_dependencies_version_list.append(None)
-        if solute_dependencies_version_list.count(None) == len(solute_dependencies_version_list):
-            solute_dependencies_version_list = None
-        solutedependencies = get_qsar_list(qsarlist=solute_dependencies_list, versionlist=solute_dependencies_version_list)
-        for qsar in solutedependencies:
-            self.model_namespace.solutedependencymodels[qsar.model_name] = qsar
-            self.model_namespace.solutedependencymodels[qsar.model_name].super_models.append(self)
-        # link solvent dependencies
-        self.model_namespace.solventdependencymodels = {}
-        solvent_dependencies_list = []
-        solvent_dependencies_version_list = []
-        for sd in self.model_namespace.solvent_dependencies_list:
-            if type(sd) is tuple:
-                solvent_dependencies_list.append(sd[0])
-                solvent_dependencies_version_list.append(sd[1])
-            else:
-                solvent_dependencies_list.append(sd)
-                solvent_dependencies_version_list.append(None)
-        if solvent_dependencies_version_list.count(None) == len(solvent_dependencies_version_list):
-            solvent_dependencies_version_list = None
-        solventdependencies = get_qsar_list(qsarlist=solvent_dependencies_list, versionlist=solvent_dependencies_version_list)
-        for qsar in solventdependencies:
-            self.model_namespace.solventdependencymodels[qsar.model_name] = qsar
-            self.model_namespace.solventdependencymodels[qsar.model_name].super_models.append(self)
-        # link component dependencies
-        self.model_namespace.componentdependencymodels = {}
-        component_dependencies_list = []
-        component_dependencies_version_list = []
-        for sd in self.model_namespace.component_dependencies_list:
-            if type(sd) is tuple:
-                component_dependencies_list.append(sd[0])
-                component_dependencies_version_list.append(sd[1])
+        # models are loaded by one thread at a time, and are only visible to other threads once linked
+        with _load_lock:
+            if self.model_namespace is not None:
+                return
+            # initiate model namespace
+            namespace = importlib.import_module(self.model_module)
+            # check that self.version matches the version in the model module
+            try:
+                assert self.version == namespace.version
+            except AssertionError:
+                print('Model', self.model_name, 'version mismatch:', self.version, namespace.version)
+            # share the empirical training set with other meta models using the same set
+            if hasattr(namespace, 'emptrainset'):
+                namespace.emptrainset, namespace.xtxi = share_emptrainset(namespace.emptrainset)
+            # check if model is a mixture or not to help format outputs
+            if namespace.chemical_inputs['total min'] <= 1:
+                self.ismixture = False
             else:
-                component_dependencies_list.append(sd)
-                component_dependencies_version_list.append(None)
-        if component_dependencies_version_list.count(None) == len(component_dependencies_version_list):
-            component_dependencies_version_list = None
-        componentdependencies = get_qsar_list(qsarlist=component_dependencies_list, versionlist=component_dependencies_version_list)
-        for qsar in componentdependencies:
-            self.model_namespace.componentdependencymodels[qsar.model_name] = qsar
-            self.model_namespace.componentdependencymodels[qsar.model_name].super_models.append(self)
-        # backup the stored data for reset and restore
-        self.default_stored = self.model_namespace.stored.copy()
+                self.ismixture = True
+            # link models which depend on this one
+            # link solute dependencies
+            namespace.solutedependencymodels = {}
+            solute_dependencies_list = []
+            solute_dependencies_version_list = []
+            for sd in namespace.solute_dependencies_list:
+                if type(sd) is tuple:
+                    solute_dependencies_list.append(sd[0])
+                    solute_dependencies_version_list.append(sd[1])
+                else:
+                    solute_dependencies_list.append(sd)
+                    solute_dependencies_version_list.append(None)
+            if solute_dependencies_version_list.count(None) == len(solute_dependencies_version_list):
+                solute_dependencies_version_list = None
+            solutedependencies = get_qsar_list(qsarlist=solute_dependencies_list, versionlist=solute_dependencies_version_list)
+            for qsar in solutedependencies:
+                namespace.solutedependencymodels[qsar.model_name] = qsar
+                namespace.solutedependencymodels[qsar.model_name].add_super_model(self)
+            # link solvent dependencies
+            namespace.solventdependencymodels = {}
+            solvent_dependencies_list = []
+            solvent_dependencies_version_list = []
+            for sd in namespace.solvent_dependencies_list:
+                if type(sd) is tuple:
+                    solvent_dependencies_list.append(sd[0])
+                    solvent_dependencies_version_list.append(sd[1])
+                else:
+                    solvent_dependencies_list.append(sd)
+                    solvent_dependencies_version_list.append(None)
+            if solvent_dependencies_version_list.count(None) == len(solvent_dependencies_version_list):
+                solvent_dependencies_version_list = None
+            solventdependencies = get_qsar_list(qsarlist=solvent_dependencies_list, versionlist=solvent_dependencies_version_list)
+            for qsar in solventdependencies:
+                namespace.solventdependencymodels[qsar.model_name] = qsar
+                namespace.solventdependencymodels[qsar.model_name].add_super_model(self)
+            # link component dependencies
+            namespace.componentdependencymodels = {}
+            component_dependencies_list = []
+            component_dependencies_version_list = []
+            for sd in namespace.component_dependencies_list:
+                if type(sd) is tuple:
+                    component_dependencies_list.append(sd[0])
+                    component_dependencies_version_list.append(sd[1])
+                else:
+                    component_dependencies_list.append(sd)
+                    component_dependencies_version_list.append(None)
+            if component_dependencies_version_list.count(None) == len(component_dependencies_version_list):
+                component_dependencies_version_list = None
+            componentdependencies = get_qsar_list(qsarlist=component_dependencies_list, versionlist=component_dependencies_version_list)
+            for qsar in componentdependencies:
+                namespace.componentdependencymodels[qsar.model_name] = qsar
+                namespace.componentdependencymodels[qsar.model_name].add_super_model(self)
+            # backup the stored data for reset and restore
+            self.default_stored = dict(namespace.stored)
+            namespace.stored = PredictionCache(self.default_stored, cache_size, self.model_name, self.version,
+                                               (namespace.citation, namespace.units, namespace.endpoint))
+            # evicted mixture results are removed from the index of their chemicals
+            if self.ismixture:
+                namespace.stored.onevict = self.drop_mixture_key
+            # results are only kept in the persistent store while the dependencies hold their default values
+            namespace.stored.dependencies = self.dependency_caches
+            self.model_namespace = namespace
 
-    def set_stored(self, normsmiles, value, ul='U', error=np.nan, ulnote='user value', citation='user value', units=None, endpoint=None):
-        """Add a stored value with user-entered data"""
+    def dependency_caches(self):
+        """Return the stored results of every model this model depends on, directly or through other models"""
+        return [qsar.model_namespace.stored for qsar in _related_models(self, True, False)]
+
+    def set_stored(self, normsmiles, value, ul='U', error=np.nan, ulnote='user value', citation='user value', units=None, endpoint=None,
+                   pinned=True):
+        """Add a stored value with user-entered data, pinned values are never evicted from the stored predictions"""
         # check if model has been loaded
         if self.model_namespace is None:
             self.load()
         # do not allow user-entered data for mixtures
         if self.model_namespace.chemical_inputs['total max'] > 1:
             return
-        # check that UL is one of the permitted values
-        if type(ul) is not int and type(ul) is not str and not np.isnan(ul):
-            raise ValueError('User-defined UL must be E, U, int 0-6 or combination thereof')
-        elif type(ul) is int and ul not in [0, 1, 2, 3, 4, 5, 6]:
-            raise ValueError('User-defined UL must be E, U, int 0-6 or combination thereof')
-        elif type(ul) is str:
-            counts = []
-            for c in ['E', 'U', '0', '1', '2', '3', '4', '5', '6']:
-                counts.append(ul.count(c))
-                if counts[-1] > 1:
-                    raise ValueError('User-defined UL must be E, U, int 0-6 or combination thereof')
-            if len(ul) - sum(counts) > 0:
-                print(ul, len(ul), counts, sum(counts))
-                raise ValueError('User-defined UL must be E, U, int 0-6 or combination thereof')
+        # check that UL is one of the permitted values, predictions of models without an AD have no UL
+        _check_uls([ul], allownan=True)
         # set units and endpoint from model namespace if not provided with input
         if units is None:
             units = self.model_namespace.units
         if endpoint is None:
             endpoint = self.model_namespace.endpoint
-        # add user value to stored data
-        self.model_namespace.stored[normsmiles] = (value, ul, error, ulnote, citation, units, endpoint)
+        # add user value to stored data, it is never evicted
+        if pinned:
+            self.model_namespace.stored.pin(normsmiles, (value, ul, error, ulnote, citation, units, endpoint))
+        else:
+            self.model_namespace.stored[normsmiles] = (value, ul, error, ulnote, citation, units, endpoint)
+
+    def mixture_key(self, solutes=tuple(), solvents=tuple(), components=tuple(), solutef=tuple(), solventf=tuple(), componentf=tuple()):
+        """Return an order-independent key for a mixture and the canonical order of its solutes, solvents and components"""
+        keyparts = []
+        orders = []
+        for role, chemicals, chemicalf in (('solute', solutes, solutef),
+                                           ('solvent', solvents, solventf),
+                                           ('component', components, componentf)):
+            order = sorted(range(len(chemicals)), key=lambda i: (chemicals[i].normsmiles, chemicalf[i][0], chemicalf[i][1]))
+            orders.append(order)
+            for i in order:
+                keyparts.append(role)
+                keyparts.append(chemicals[i].normsmiles)
+                keyparts.append(chemicalf[i][0])
+                keyparts.append(chemicalf[i][1])
+        return '|'.join(keyparts), orders
+
+    def get_stored_mixture(self, solutes=tuple(), solvents=tuple(), components=tuple(), solutef=tuple(), solventf=tuple(), componentf=tuple()):
+        """Return the stored result for a mixture in the order of the passed chemicals, or None if it is not stored"""
+        key, orders = self.mixture_key(solutes, solvents, components, solutef, solventf, componentf)
+        stored = self.model_namespace.stored.get(key)
+        if stored is None:
+            return None
+        return _permute_mixture_result(stored, orders, restore=True)
+
+    def set_stored_mixture(self, result, solutes=tuple(), solvents=tuple(), components=tuple(), solutef=tuple(), solventf=tuple(), componentf=tuple()):
+        """Store the result for a mixture under its order-independent key"""
+        key, orders = self.mixture_key(solutes, solvents, components, solutef, solventf, componentf)
+        # the key is indexed first, so a result evicted as soon as it is stored is removed from the index
+        with self.mixture_lock:
+            for chemicals in (solutes, solvents, components):
+                for chemical in chemicals:
+                    self.mixture_keys.setdefault(chemical.normsmiles, set()).add(key)
+        self.model_namespace.stored[key] = _permute_mixture_result(result, orders)
+
+    def pop_mixture_keys(self, normsmiles):
+        """Remove and return the keys of the stored mixture results that contain a chemical from the index"""
+        with self.mixture_lock:
+            keys = self.mixture_keys.pop(normsmiles, set())
+        for key in keys:
+            self.drop_mixture_key(key)
+        return keys
+
+    def drop_mixture_key(self, key):
+        """Remove the key of a stored mixture result from the index of each chemical in the mixture"""
+        # the key is the role, normalized SMILES and fraction of each chemical joined by |
+        with self.mixture_lock:
+            for normsmiles in key.split('|')[1::4]:
+                keys = self.mixture_keys.get(normsmiles)
+                if keys is not None:
+                    keys.discard(key)
+                    if len(keys) == 0:
+                        self.mixture_keys.pop(normsmiles)
+
+    def set_stored_list(self, normsmileslist, values, uls='U', errors=np.nan, ulnotes='user value', citations='user value', units=None,
+                        endpoint=None, propagateup=False):
+        """Add a list of stored values with user-entered data, single values are used for every chemical"""
+        # check if model has been loaded
+        if self.model_namespace is None:
+            self.load()
+        # do not allow user-entered data for mixtures
+        if self.model_namespace.chemical_inputs['total max'] > 1:
+            raise ValueError(''.join(['Stored values cannot be added to the mixture QSAR ', self.model_name]))
+        # set units and endpoint from model namespace if not provided with input
+        if units is None:
+            units = self.model_namespace.units
+        if endpoint is None:
+            endpoint = self.model_namespace.endpoint
+        records = _stored_records(len(normsmileslist), values, uls, errors, ulnotes, citations, units, endpoint)
+        _check_uls([record[1] for record in records], allownan=True)
+        # add user values to stored data, they are never evicted
+        self.model_namespace.stored.pin_many(zip(normsmileslist, records))
+        # predictions of models that depend on this one are out of date
+        if propagateup:
+            _discard_super_predictions(self, normsmileslist)
 
     def load_stored(self, normsmiles, propagatedown=False, propagateup=False):
         """Remove a specific stored value"""
         # check if model has been loaded
         if self.model_namespace is None:
             self.load()
-        if normsmiles in self.default_stored:
-            self.model_namespace.stored[normsmiles] = self.default_stored[normsmiles]
-        if propagatedown:
-            for qsar in self.model_namespace.solutedependencymodels.values():
-                qsar.load_stored(normsmiles, propagatedown=propagatedown)
-            for qsar in self.model_namespace.componentdependencymodels.values():
-                qsar.load_stored(normsmiles, propagatedown=propagatedown)
-            for qsar in self.model_namespace.solventdependencymodels.values():
-                qsar.load_stored(normsmiles, propagatedown=propagatedown)
-        if propagateup:
-            for qsar in self.super_models:
-                qsar.load_stored(normsmiles, propagateup=propagateup)
+        self.model_namespace.stored.load_default(normsmiles)
+        # stored mixture results containing this chemical are out of date
+        for key in self.pop_mixture_keys(normsmiles):
+            self.model_namespace.stored.pop(key, None)
+        # apply to each related model once, a model can be reached through several dependencies
+        for qsar in _related_models(self, propagatedown, propagateup):
+            qsar.load_stored(normsmiles)
 
     def remove_stored(self, normsmiles, propagatedown=False, propagateup=False):
         """Remove a specific stored value"""
         # check if model has been loaded
         if self.model_namespace is None:
             self.load()
-        if normsmiles in self.model_namespace.stored:
-            self.model_namespace.stored.pop(normsmiles)
-        if propagatedown:
-            for qsar in self.model_namespace.solutedependencymodels.values():
-                qsar.remove_stored(normsmiles, propagatedown=propagatedown)
-            for qsar in self.model_namespace.componentdependencymodels.values():
-                qsar.remove_stored(normsmiles, propagatedown=propagatedown)
-            for qsar in self.model_namespace.solventdependencymodels.values():
-                qsar.remove_stored(normsmiles, propagatedown=propagatedown)
-        if propagateup:
-            for qsar in self.super_models:
-                qsar.remove_stored(normsmiles, propagateup=propagateup)
+        self.model_namespace.stored.pop(normsmiles, None)
+        for key in self.pop_mixture_keys(normsmiles):
+            self.model_namespace.stored.pop(key, None)
+        # apply to each related model once, a model can be reached through several dependencies
+        for qsar in _related_models(self, propagatedown, propagateup):
+            qsar.remove_stored(normsmiles)
 
     def reset_stored(self, propagatedown=False, propagateup=False):
         """Reset the stored data to default, erasing all predicted and user data"""
         # check if model has been loaded
         if self.model_namespace is None:
             self.load()
-        self.model_namespace.stored = self.default_stored.copy()
-        if propagatedown:
-            for qsar in self.model_namespace.solutedependencymodels.values():
-                qsar.reset_stored(propagatedown=propagatedown)
-            for qsar in self.model_namespace.componentdependencymodels.values():
-                qsar.reset_stored(propagatedown=propagatedown)
-            for qsar in self.model_namespace.solventdependencymodels.values():
-                qsar.reset_stored(propagatedown=propagatedown)
-        if propagateup:
-            for qsar in self.super_models:
-                qsar.reset_stored(propagateup=propagateup)
+        self.model_namespace.stored.reset()
+        with self.mixture_lock:
+            self.mixture_keys = {}
+        # apply to each related model once, a model can be reached through several dependencies
+        for qsar in _related_models(self, propagatedown, propagateup):
+            qsar.reset_stored()
 
     def restore_stored(self, propagatedown=False, propagateup=False):
         """Reset the stored data to default, preserving predicted and user data not in the default data"""
         # check if model has been loaded
         if self.model_namespace is None:
             self.load()
-        self.model_namespace.stored.update(self.default_stored)
-        if propagatedown:
-            for qsar in self.model_namespace.solutedependencymodels.values():
-                qsar.restore_stored(propagatedown=propagatedown)
-            for qsar in self.model_namespace.componentdependencymodels.values():
-                qsar.restore_stored(propagatedown=propagatedown)
-            for qsar in self.model_namespace.solventdependencymodels.values():
-                qsar.restore_stored(propagatedown=propagatedown)
-        if propagateup:
-            for qsar in self.super_models:
-                qsar.restore_stored(propagateup=propagateup)
+        self.model_namespace.stored.restore()
+        # apply to each related model once, a model can be reached through several dependencies
+        for qsar in _related_models(self, propagatedown, propagateup):
+            qsar.restore_stored()
 
     def erase_user_stored(self, propagatedown=False, propagateup=False):
         """Erase all stored data flagged as user ('U')"""
         # check if model has been loaded
         if self.model_namespace is None:
             self.load()
-        for key in list(self.model_namespace.stored.keys()):
-            if self.model_namespace.stored[key][1] == 'U':
-                self.model_namespace.stored.pop(key)
-        if propagatedown:
-            for qsar in self.model_namespace.solutedependencymodels.values():
-                qsar.erase_user_stored(propagatedown=propagatedown)
-            for qsar in self.model_namespace.componentdependencymodels.values():
-                qsar.erase_user_stored(propagatedown=propagatedown)
-            for qsar in self.model_namespace.solventdependencymodels.values():
-                qsar.erase_user_stored(propagatedown=propagatedown)
-        if propagateup:
-            for qsar in self.super_models:
-                qsar.erase_user_stored(propagateup=propagateup)
+        self.model_namespace.stored.erase('U')
+        # apply to each related model once, a model can be reached through several dependencies
+        for qsar in _related_models(self, propagatedown, propagateup):
+            qsar.erase_user_stored()
 
     def erase_experimental_stored(self, propagatedown=False, propagateup=False):
         """Erase all stored data flagged as experimental ('E')"""
         # check if model has been loaded
         if self.model_namespace is None:
             self.load()
-        for key in list(self.model_namespace.stored.keys()):
-            if self.model_namespace.stored[key][1] == 'E':
-                self.model_namespace.stored.pop(key)
-        if propagatedown:
-            for qsar in self.model_namespace.solutedependencymodels.values():
-                qsar.erase_experimental_stored(propagatedown=propagatedown)
-            for qsar in self.model_namespace.componentdependencymodels.values():
-                qsar.erase_experimental_stored(propagatedown=propagatedown)
-            for qsar in self.model_namespace.solventdependencymodels.values():
-                qsar.erase_experimental_stored(propagatedown=propagatedown)
-        if propagateup:
-            for qsar in self.super_models:
-                qsar.erase_experimental_stored(propagateup=propagateup)
+        self.model_namespace.stored.erase('E')
+        # apply to each related model once, a model can be reached through several dependencies
+        for qsar in _related_models(self, propagatedown, propagateup):
+            qsar.erase_experimental_stored()
 
     def erase_all_stored(self, propagatedown=False, propagateup=False):
         """Erase all stored data, so only predicted values are returned"""
         # check if model has been loaded
         if self.model_namespace is None:
             self.load()
-        self.model_namespace.stored = {}
-        if propagatedown:
-            for qsar in self.model_namespace.solutedependencymodels.values():
-                qsar.erase_all_stored(propagatedown=propagatedown)
-            for qsar in self.model_namespace.componentdependencymodels.values():
-                qsar.erase_all_stored(propagatedown=propagatedown)
-            for qsar in self.model_namespace.solventdependencymodels.values():
-                qsar.erase_all_stored(propagatedown=propagatedown)
-        if propagateup:
-            for qsar in self.super_models:
-                qsar.erase_all_stored(propagateup=propagateup)
+        self.model_namespace.stored.clear()
+        with self.mixture_lock:
+            self.mixture_keys = {}
+        # apply to each related model once, a model can be reached through several dependencies
+        for qsar in _related_models(self, propagatedown, propagateup):
+            qsar.erase_all_stored()
 
-    def apply_model(self, solutes=tuple(), solvents=tuple(), components=tuple(), solutef=tuple(), solventf=tuple(), componentf=tuple()):
-        """Take openbabel mol(s) in lists of solutes and solvents, apply the Meta QSAR and return the results"""
+    def check_inputs(self, solutes=tuple(), solvents=tuple(), components=tuple()):
+        """Return an error result if the number of solutes, solvents and components is not allowed, otherwise None"""
         # check if model has been loaded and dependencies linked
         if self.model_namespace is None:
             self.load()
@@ -661,37 +1644,26 @@ class METAQSARModel:
                 return np.nan, np.nan, np.nan, 'chemical input error: mixture specification with at least two components/solvents required', '', '', ''
             else:
                 return np.nan, np.nan, np.nan, 'chemical input error: mixture specification required', '', '', ''
+        return None
+
+    def apply_model(self, solutes=tuple(), solvents=tuple(), components=tuple(), solutef=tuple(), solventf=tuple(), componentf=tuple()):
+        """Take openbabel mol(s) in lists of solutes and solvents, apply the Meta QSAR and return the results"""
+        # check if model has been loaded and dependencies linked
+        if self.model_namespace is None:
+            self.load()
+        inputerror = self.check_inputs(solutes, solvents, components)
+        if inputerror is not None:
+            return inputerror
         # check if a value is stored for this solute
-        if self.model_namespace.chemical_inputs['total max'] == 1 and solutes[0].normsmiles in self.model_namespace.stored:
-            return self.model_namespace.stored[solutes[0].normsmiles]
-        # # check if a value is stored for this solute/solvent pair
-        # elif self.model_namespace.chemical_inputs['total max'] == 2 and \
-        #         self.model_namespace.chemical_inputs['solute min'] == 1 and \
-        #         self.model_namespace.chemical_inputs['solvent min'] == 1:
-        #     key = '|'.join([solutes[0].normsmiles, solvents[0].normsmiles])
-        #     if key in self.model_namespace.stored:
-        #         return self.model_namespace.stored[key]
-        # # check if this exact mixture has a stored value
-        # elif self.model_namespace.chemical_inputs['total min'] >= 2:
-        #     keyparts = []
-        #     for i in range(len(solutes)):
-        #         keyparts.append('solute')
-        #         keyparts.append(solutes[i].normsmiles)
-        #         keyparts.append(solutef[i][0])
-        #         keyparts.append(solutef[i][1])
-        #     for i in range(len(solvents)):
-        #         keyparts.append('solvent')
-        #         keyparts.append(solvents[i].normsmiles)
-        #         keyparts.append(solventf[i][0])
-        #         keyparts.append(solventf[i][1])
-        #     for i in range(len(components)):
-        #         keyparts.append('component')
-        #         keyparts.append(components[i].normsmiles)
-        #         keyparts.append(componentf[i][0])
-        #         keyparts.append(componentf[i][1])
-        #     key = '|'.join(keyparts)
-        #     if key in self.model_namespace.stored:
-        #         return self.model_namespace.stored[key]
+        if self.model_namespace.chemical_inputs['total max'] == 1:
+            stored = self.model_namespace.stored.get_stored(solutes[0].normsmiles)
+            if stored is not None:
+                return stored
+        # check if this mixture has a stored value, regardless of the order of the chemicals
+        elif self.model_namespace.chemical_inputs['total max'] > 1:
+            stored = self.get_stored_mixture(solutes, solvents, components, solutef, solventf, componentf)
+            if stored is not None:
+                return stored
         # pass solute to solute dependency qsar models to calculate values
         solutedependencies = []
         for s in range(len(solutes)):
@@ -710,70 +1682,294 @@ class METAQSARModel:
             componentdependencies.append({})
             for d, m in self.model_namespace.componentdependencymodels.items():
                 componentdependencies[-1][d] = tuple(m.apply_model(solutes=(components[c],), solutef=(componentf[c],)))
-        # generate propagated domain notes for solutes
-        propagated_domain_notes = []
-        for s in range(len(solutes)):
+        return self.apply_calculate(solutedependencies, solventdependencies, componentdependencies,
+                                    solutes, solvents, components, solutef, solventf, componentf)
+
+    def calculate_batch(self, values, uls, errors):
+        """Apply the Meta QSAR to arrays of solute dependency results, returns arrays with one element per chemical.
+
+        Single chemical Meta QSARs with a calculate_batch function in their module are evaluated as arrays, currently
+        the version 2 logKow, logKowdry, logKoa, logKaw and logKoo models, the others are evaluated one chemical at a
+        time. Results are identical to applying the Meta QSAR to each chemical, but are not stored.
+
+        Required Arguments:
+            values -- dict of numpy arrays of predicted or stored values keyed by solute dependency name
+            uls -- dict of arrays of ULs keyed by solute dependency name, int 0-6, E, U or nan
+            errors -- dict of numpy arrays of errors keyed by solute dependency name
+        """
+        # check if model has been loaded and dependencies linked
+        if self.model_namespace is None:
+            self.load()
+        if self.model_namespace.chemical_inputs['total max'] > 1:
+            raise ValueError(''.join(['Meta QSAR ', self.model_name, ' has mixture input and cannot be evaluated in a batch']))
+        values = {d: np.asarray(values[d], dtype=float) for d in self.model_namespace.solutedependencymodels}
+        errors = {d: np.asarray(errors[d], dtype=float) for d in self.model_namespace.solutedependencymodels}
+        # generate propagated domain notes for the solute in the same order as apply_model,
+        # once for each unique combination of dependency ULs
+        ulcodes = {d: _encode_uls(uls[d]) for d in self.model_namespace.solutedependencymodels}
+        ulkeys = np.zeros(len(values[next(iter(values))]), dtype=np.int64)
+        for d in self.model_namespace.solutedependencymodels:
+            ulkeys = ulkeys * len(_batch_ul_codes) + ulcodes[d]
+        uniquekeys, inverse = np.unique(ulkeys, return_inverse=True)
+        notetable = []
+        for key in uniquekeys:
+            codes = []
+            for i in range(len(self.model_namespace.solutedependencymodels)):
+                codes.insert(0, key % len(_batch_ul_codes))
+                key //= len(_batch_ul_codes)
             domainnotes = []
-            for k, v in solutedependencies[s].items():
-                if not type(solutedependencies[s][k][1]) is str and np.isnan(solutedependencies[s][k][1]):
+            for d, code in zip(self.model_namespace.solutedependencymodels, codes):
+                if code == 9:
                     continue
-                domainnotes.append(''.join([k, '=', str(solutedependencies[s][k][1])]))
+                domainnotes.append(''.join([d, '=', str(_batch_ul_codes[code])]))
             if len(domainnotes):
-                propagated_domain_notes.append(''.join(['solute {} dependency ULs: '.format(s+1), ', '.join(domainnotes)]))
-        # generate propagated domain notes for components
+                notetable.append(''.join(['solute 1 dependency ULs: ', ', '.join(domainnotes)]))
+            else:
+                notetable.append('')
+        propagated_notes = np.array(notetable, dtype=object)[inverse.reshape(-1)]
+        if hasattr(self.model_namespace, 'calculate_batch'):
+            return self.model_namespace.calculate_batch(values, ulcodes, errors, propagated_notes)
+        # models without a batch form of calculate are applied to one chemical at a time
+        count = len(propagated_notes)
+        prediction = np.full(count, np.nan)
+        UL = np.full(count, np.nan, dtype=object)
+        error = np.full(count, np.nan)
+        ULnote = np.full(count, '', dtype=object)
+        for i in range(count):
+            solutedependencies = [dict([(d, (values[d][i], _batch_ul_codes[ulcodes[d][i]], errors[d][i], '', '', '', ''))
+                                        for d in self.model_namespace.solutedependencymodels])]
+            prediction[i], UL[i], error[i], ULnote[i], citation, units, endpoint = \
+                self.model_namespace.calculate(solutedependencies, [], [], tuple(), tuple(), tuple(),
+                                               propagated_domain_notes=propagated_notes[i])
+        return prediction, UL, error, ULnote, self.model_namespace.citation, self.model_namespace.units, self.model_namespace.endpoint
+
+    def calculate_matrix(self, solutedependencies, solventdependencies):
+        """Apply a solute-solvent Meta QSAR to every pair of solutes and solvents, returns 2D arrays with solutes in rows.
+
+        Meta QSARs with a calculate_matrix function in their module are evaluated as outer products, currently logKsa,
+        other Meta QSARs of one solute and one solvent are evaluated one pair at a time. Results are identical to
+        applying the Meta QSAR to each pair, but are not stored.
+
+        Required Arguments:
+            solutedependencies -- list of dicts of solute dependency results, one for each solute
+            solventdependencies -- list of dicts of solvent dependency results, one for each solvent
+        """
+        # check if model has been loaded and dependencies linked
+        if self.model_namespace is None:
+            self.load()
+        if self.check_inputs((None,), (None,)) is not None:
+            raise ValueError(''.join(['Meta QSAR ', self.model_name, ' does not take one solute and one solvent']))
+        solutenotes = [_dependency_ul_note('solute 1', sd) for sd in solutedependencies]
+        solventnotes = [_dependency_ul_note('solvent 1', sd) for sd in solventdependencies]
+        if hasattr(self.model_namespace, 'calculate_matrix'):
+            return self.model_namespace.calculate_matrix(solutedependencies, solventdependencies, solutenotes, solventnotes)
+        # models without a matrix form of calculate are applied to one pair at a time
+        shape = (len(solutedependencies), len(solventdependencies))
+        prediction = np.full(shape, np.nan)
+        UL = np.full(shape, np.nan, dtype=object)
+        error = np.full(shape, np.nan)
+        ULnote = np.full(shape, '', dtype=object)
+        for i in range(shape[0]):
+            for j in range(shape[1]):
+                propagated_domain_notes = '; '.join([note for note in (solutenotes[i], solventnotes[j]) if note != ''])
+                result = self.model_namespace.calculate([solutedependencies[i]], [solventdependencies[j]], [],
+                                                        tuple(), tuple(), tuple(),
+                                                        propagated_domain_notes=propagated_domain_notes)
+                # mixture outputs are lists with one value for the solute
+                prediction[i, j], UL[i, j], error[i, j] = [r[0] if type(r) is list else r for r in result[:3]]
+                ULnote[i, j] = result[3]
+        return prediction, UL, error, ULnote, self.model_namespace.citation, self.model_namespace.units, self.model_namespace.endpoint
+
+    def apply_calculate(self, solutedependencies, solventdependencies, componentdependencies,
+                        solutes=tuple(), solvents=tuple(), components=tuple(), solutef=tuple(), solventf=tuple(), componentf=tuple()):
+        """Apply the Meta QSAR to results already calculated by its dependencies, store and return the results"""
+        # generate propagated domain notes for solutes, components and solvents
+        propagated_domain_notes = []
+        for s in range(len(solutes)):
+            propagated_domain_notes.append(_dependency_ul_note('solute {}'.format(s+1), solutedependencies[s]))
         for c in range(len(componentdependencies)):
-            domainnotes = []
-            for k, v in componentdependencies[c].items():
-                if not type(componentdependencies[c][k][1]) is str and np.isnan(componentdependencies[c][k][1]):
-                    continue
-                domainnotes.append(''.join([k, '=', str(componentdependencies[c][k][1])]))
-            if len(domainnotes):
-                propagated_domain_notes.append(''.join(['component {} dependency ULs: '.format(c+1), ', '.join(domainnotes)]))
-        # generate propagated domain notes for solvents
+            propagated_domain_notes.append(_dependency_ul_note('component {}'.format(c+1), componentdependencies[c]))
         for s in range(len(solvents)):
-            domainnotes = []
-            for k, v in solventdependencies[s].items():
-                if not type(solventdependencies[s][k][1]) is str and np.isnan(solventdependencies[s][k][1]):
-                    continue
-                domainnotes.append(''.join([k, '=', str(solventdependencies[s][k][1])]))
-            if len(domainnotes):
-                propagated_domain_notes.append(''.join(['solvent {} dependency ULs: '.format(s+1), ', '.join(domainnotes)]))
-        self.model_namespace.propagated_domain_notes = '; '.join(propagated_domain_notes)
-        # call the metamodel with the dependency outputs to calculate meta result
-        prediction, UL, error, ULnote, citation, units, endpoint = self.model_namespace.calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf)
+            propagated_domain_notes.append(_dependency_ul_note('solvent {}'.format(s+1), solventdependencies[s]))
+        while '' in propagated_domain_notes:
+            propagated_domain_notes.remove('')
+        # call the metamodel with the dependency outputs to calculate meta result, the notes are passed with
+        # the call rather than set in the model module so that models can be applied from several threads
+        prediction, UL, error, ULnote, citation, units, endpoint = self.model_namespace.calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf,
+                                                                                                  propagated_domain_notes='; '.join(propagated_domain_notes))
         # store result for this solute
         if self.model_namespace.chemical_inputs['total max'] == 1:
-            self.set_stored(solutes[0].normsmiles, prediction, UL, error, ULnote, citation, units, endpoint)
-        # # store result for this solute/solvent pair
-        # elif self.model_namespace.chemical_inputs['total max'] == 2 and \
-        #         self.model_namespace.chemical_inputs['solute min'] == 1 and \
-        #         self.model_namespace.chemical_inputs['solvent min'] == 1:
-        #     key = '|'.join([solutes[0].normsmiles, solvents[0].normsmiles])
-        #     self.model_namespace.stored[key] = (prediction, UL, error, ULnote, citation, units, endpoint)
-        # # store result for this exact mixture
-        # elif self.model_namespace.chemical_inputs['total min'] >= 2:
-        #     keyparts = []
-        #     for i in range(len(solutes)):
-        #         keyparts.append('solute')
-        #         keyparts.append(solutes[i].normsmiles)
-        #         keyparts.append(solutef[i][0])
-        #         keyparts.append(solutef[i][1])
-        #     for i in range(len(solvents)):
-        #         keyparts.append('solvent')
-        #         keyparts.append(solvents[i].normsmiles)
-        #         keyparts.append(solventf[i][0])
-        #         keyparts.append(solventf[i][1])
-        #     for i in range(len(components)):
-        #         keyparts.append('component')
-        #         keyparts.append(components[i].normsmiles)
-        #         keyparts.append(componentf[i][0])
-        #         keyparts.append(componentf[i][1])
-        #     key = '|'.join(keyparts)
-        #     self.model_namespace.stored[key] = (prediction, UL, error, ULnote, citation, units, endpoint)
+            self.set_stored(solutes[0].normsmiles, prediction, UL, error, ULnote, citation, units, endpoint, pinned=False)
+        # store result for this mixture
+        else:
+            self.set_stored_mixture((prediction, UL, error, ULnote, citation, units, endpoint),
+                                    solutes, solvents, components, solutef, solventf, componentf)
         # return result
         return prediction, UL, error, ULnote, citation, units, endpoint
 
 
+class QSARExecutionPlan:
+    """Dependency graph of a list of QSARs and Meta QSARs sorted so that dependencies come before the
+    models that use them, each model is then applied exactly once per chemical"""
+
+    def __init__(self, qsarlist, prune=True):
+        """Load the QSARs and sort their dependencies into the order they are applied
+
+        With prune, QSARs whose AD outputs are not read by any Meta QSAR in the plan and which are
+        not in the qsarlist are applied in prediction only mode
+        """
+        self.qsarlist = list(qsarlist)
+        # single chemical models in dependency order, applied to pure chemical input
+        puremodels = []
+        # single chemical models in dependency order for each role of each mixture model
+        self.mixtureorders = {}
+        for qsar in self.qsarlist:
+            qsar.load()
+            if qsar.model_namespace.chemical_inputs['total max'] == 1:
+                puremodels.append(qsar)
+            else:
+                self.mixtureorders[id(qsar)] = (_dependency_order(qsar.model_namespace.solutedependencymodels.values()),
+                                                _dependency_order(qsar.model_namespace.solventdependencymodels.values()),
+                                                _dependency_order(qsar.model_namespace.componentdependencymodels.values()))
+        self.pureorder = _dependency_order(puremodels)
+        # fields of each model output that are read by the models in the plan
+        self.fields = {}
+        for qsar in self.qsarlist:
+            self.fields[id(qsar)] = set(_all_fields)
+        graph = _dependency_order(self.qsarlist)
+        for qsar in graph:
+            if type(qsar) is not METAQSARModel:
+                continue
+            reads = qsar.get_dependency_reads()
+            for dependencymodels in (qsar.model_namespace.solutedependencymodels,
+                                     qsar.model_namespace.solventdependencymodels,
+                                     qsar.model_namespace.componentdependencymodels):
+                for d, m in dependencymodels.items():
+                    if id(m) not in self.fields:
+                        self.fields[id(m)] = set()
+                    self.fields[id(m)].update(reads.get(d, set()))
+                    self.fields[id(m)].update(reads.get('*', set()))
+        self.predictiononly = set()
+        if prune:
+            for qsar in graph:
+                if type(qsar) is QSARModel and self.fields[id(qsar)] <= {0}:
+                    self.predictiononly.add(id(qsar))
+
+    def __str__(self):
+        return ' -> '.join([''.join([qsar.model_name, ' v', str(qsar.version)]) for qsar in self.pureorder])
+
+    def __repr__(self):
+        return self.__str__()
+
+    def prefetch(self, normsmileslist):
+        """Load predictions of the single chemical models in the plan for a batch of normalized SMILES from the
+        persistent store in one query per model, does nothing if no store is open"""
+        store = _prediction_store
+        if store is None:
+            return
+        models = list(self.pureorder)
+        for orders in self.mixtureorders.values():
+            for order in orders:
+                for qsar in order:
+                    if qsar not in models:
+                        models.append(qsar)
+        store.prefetch(models, [normsmiles for normsmiles in normsmileslist if normsmiles != ''])
+
+    def apply(self, solutes=tuple(), solvents=tuple(), components=tuple(), solutef=tuple(), solventf=tuple(), componentf=tuple()):
+        """Apply all QSARs in the plan to the chemical(s) and return a list of results in the order of the qsarlist"""
+        results = []
+        # pure chemical input, every single chemical model in the graph is applied once in dependency order
+        if len(solutes) == 1 and len(solvents) == 0 and len(components) == 0:
+            chemicalresults = {}
+            _apply_in_order(self.pureorder, solutes[0], solutef[0], chemicalresults, self.predictiononly)
+            for qsar in self.qsarlist:
+                if id(qsar) in chemicalresults:
+                    results.append(chemicalresults[id(qsar)])
+                else:
+                    results.append(qsar.apply_model(solutes=solutes, solvents=solvents, components=components,
+                                                    solutef=solutef, solventf=solventf, componentf=componentf))
+            return results
+        # mixture input, dependencies are applied once per chemical and shared between the mixture models
+        chemicalresults = {}
+        for qsar in self.qsarlist:
+            if id(qsar) not in self.mixtureorders:
+                results.append(qsar.apply_model(solutes=solutes, solvents=solvents, components=components,
+                                                solutef=solutef, solventf=solventf, componentf=componentf))
+                continue
+            inputerror = qsar.check_inputs(solutes, solvents, components)
+            if inputerror is not None:
+                results.append(inputerror)
+                continue
+            # repeated mixtures are returned from the stored results without applying the dependencies
+            stored = qsar.get_stored_mixture(solutes, solvents, components, solutef, solventf, componentf)
+            if stored is not None:
+                results.append(stored)
+                continue
+            soluteorder, solventorder, componentorder = self.mixtureorders[id(qsar)]
+            dependencies = []
+            for chemicals, chemicalf, order, dependencymodels in \
+                    ((solutes, solutef, soluteorder, qsar.model_namespace.solutedependencymodels),
+                     (solvents, solventf, solventorder, qsar.model_namespace.solventdependencymodels),
+                     (components, componentf, componentorder, qsar.model_namespace.componentdependencymodels)):
+                dependencies.append([])
+                for c in range(len(chemicals)):
+                    if id(chemicals[c]) not in chemicalresults:
+                        chemicalresults[id(chemicals[c])] = {}
+                    _apply_in_order(order, chemicals[c], chemicalf[c], chemicalresults[id(chemicals[c])],
+                                    self.predictiononly)
+                    dependencies[-1].append({})
+                    for d, m in dependencymodels.items():
+                        dependencies[-1][-1][d] = chemicalresults[id(chemicals[c])][id(m)]
+            results.append(qsar.apply_calculate(dependencies[0], dependencies[1], dependencies[2],
+                                                solutes, solvents, components, solutef, solventf, componentf))
+        return results
+
+
+def _dependency_order(qsars):
+    """Sort QSARs and all of their dependencies so that every model comes after its dependencies"""
+    order = []
+    visited = set()
+    for qsar in qsars:
+        _visit_dependencies(qsar, order, visited)
+    return order
+
+
+def _visit_dependencies(qsar, order, visited):
+    """Depth first search of the dependency graph, appending each model once after its dependencies"""
+    if id(qsar) in visited:
+        return
+    visited.add(id(qsar))
+    qsar.load()
+    if type(qsar) is METAQSARModel:
+        for dependencymodels in (qsar.model_namespace.solutedependencymodels,
+                                 qsar.model_namespace.solventdependencymodels,
+                                 qsar.model_namespace.componentdependencymodels):
+            for m in dependencymodels.values():
+                _visit_dependencies(m, order, visited)
+    order.append(qsar)
+
+
+def _apply_in_order(order, chemical, chemicalf, chemicalresults, predictiononly=frozenset()):
+    """Apply single chemical QSARs in dependency order, results are collected in chemicalresults by model"""
+    for qsar in order:
+        if id(qsar) in chemicalresults:
+            continue
+        if type(qsar) is QSARModel:
+            chemicalresults[id(qsar)] = tuple(qsar.apply_model(solutes=(chemical,), solutef=(chemicalf,),
+                                                               prediction_only=id(qsar) in predictiononly))
+            continue
+        # experimental and user values still take precedence over predictions from the dependencies
+        stored = qsar.model_namespace.stored.get_stored(chemical.normsmiles)
+        if stored is not None:
+            chemicalresults[id(qsar)] = tuple(stored)
+        else:
+            solutedependencies = [{}]
+            for d, m in qsar.model_namespace.solutedependencymodels.items():
+                solutedependencies[0][d] = chemicalresults[id(m)]
+            chemicalresults[id(qsar)] = tuple(qsar.apply_calculate(solutedependencies, [], [],
+                                                                    solutes=(chemical,), solutef=(chemicalf,)))
+
+
 # instantiate qsar models
 fhlb = QSARModel('ifsqsar.models.ifs_qsar_fhlb_linr', 'fhlb', 1)
 hhlb = QSARModel('ifsqsar.models.ifs_qsar_hhlb_linr', 'hhlb', 1)
@@ -845,6 +2041,21 @@ densityliquid = METAQSARModel('ifsqsar.models.meta_qsar_density_liquid', 'densit
 MW = QSARModel('ifsqsar.models.other_qsar_MW', 'MW', 1)
 state = METAQSARModel('ifsqsar.models.meta_qsar_state', 'state', 1)
 
+# current and old versions of all QSARs, used by get_qsar_list and write_manifest
+_current_qsar_versions = [fhlb, hhlb, hhlt, biowin3usmmlrx, biowin3usmmlra, biowin4psmmlrx, biowin4psmmlra, HLbiodeg,
+                          dsm, tm, tmpplfer, tbpplfer, tmconsensus, state,
+                          Ev3, Sv3, Av3, Bv3, Lv3, Vtd, Vf, ssp, asp, bsp, vsp, lsp, csp,
+                          logKowv2, logKawv2, logKoav2, logKowdryv2, logKoov2,
+                          logVPliquidpplferv3, logSwliquidpplferv3, logSoliquidv2, logSowetliquidv2,
+                          MVsolidV, MVliquidV, densitysolid, densityliquid, MW,
+                          logKsa]
+_old_qsar_versions = [Ev1, Sv1, Av1, Bv1, Lv1,
+                      Ev2, Sv2, Av2, Bv2, Lv2,
+                      logKow, logKaw, logKoa, logKowdry, logKoo,
+                      logVPliquid, logSwliquid,
+                      logVPliquidpplfer, logSwliquidpplfer, logSoliquid, logSowetliquid,
+                      MVmlrx, MVmlr, MVmlrRings, MVliqcorr, MVsolid, MVliquid]
+
 
 def get_qsar_list(qsarlist=None, versionlist=None):
     """Main interface for getting lists of QSARs which can be filtered by optional selection criteria.
@@ -899,22 +2110,11 @@ def get_qsar_list(qsarlist=None, versionlist=None):
                     'logKsa']
     returnlist = []
     # decide if old versions are included in parse list
-    currentqsarversions = [fhlb, hhlb, hhlt, biowin3usmmlrx, biowin3usmmlra, biowin4psmmlrx, biowin4psmmlra, HLbiodeg,
-                           dsm, tm, tmpplfer, tbpplfer, tmconsensus, state,
-                           Ev3, Sv3, Av3, Bv3, Lv3, Vtd, Vf, ssp, asp, bsp, vsp, lsp, csp,
-                           logKowv2, logKawv2, logKoav2, logKowdryv2, logKoov2,
-                           logVPliquidpplferv3, logSwliquidpplferv3, logSoliquidv2, logSowetliquidv2,
-                           MVsolidV, MVliquidV, densitysolid, densityliquid, MW,
-                           logKsa]
+    currentqsarversions = _current_qsar_versions
     if versionlist is None:
         oldqsarversions = []
     else:
-        oldqsarversions = [Ev1, Sv1, Av1, Bv1, Lv1,
-                           Ev2, Sv2, Av2, Bv2, Lv2,
-                           logKow, logKaw, logKoa, logKowdry, logKoo,
-                           logVPliquid, logSwliquid,
-                           logVPliquidpplfer, logSwliquidpplfer, logSoliquid, logSowetliquid,
-                           MVmlrx, MVmlr, MVmlrRings, MVliqcorr, MVsolid, MVliquid]
+        oldqsarversions = _old_qsar_versions
     # parse through all the loaded QSARs and check if they should be added to returnlist
     for i in currentqsarversions + oldqsarversions:
         # first check if QSAR is in passed list of names
@@ -932,3 +2132,39 @@ def get_qsar_list(qsarlist=None, versionlist=None):
 
     return returnlist
 
+
+def get_qsar_metadata(qsarlist=None, versionlist=None):
+    """Return a list of metadata dicts for the QSARs selected as in get_qsar_list, without loading the models.
+
+    Arguments are the same as get_qsar_list. Each dict holds the model name, version, endpoint, units, citation,
+    chemical inputs and, for Meta QSARs, the solute, solvent and component dependency lists as read from the
+    manifest module. QSARs missing from the manifest are loaded to read their metadata.
+    """
+    return [qsar.get_metadata() for qsar in get_qsar_list(qsarlist=qsarlist, versionlist=versionlist)]
+
+
+def write_manifest(filename=None):
+    """Import every QSAR module and write their metadata to the manifest module read by get_qsar_metadata.
+
+    Must be rerun whenever a QSAR module is added or its metadata changes. Modules that cannot be imported
+    are skipped with a warning, their metadata is then read by loading the model when it is requested.
+
+    Optional Arguments:
+        filename -- path of the module to write, default is manifest.py in the models subpackage
+    """
+    import os
+    import pprint
+    if filename is None:
+        filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'manifest.py')
+    manifest = {}
+    for qsar in _current_qsar_versions + _old_qsar_versions:
+        try:
+            manifest[qsar.model_module] = _collect_metadata(qsar)
+        except ImportError as e:
+            print('Model', qsar.model_name, 'version', qsar.version, 'not written to manifest:', e)
+    with open(filename, 'w') as manifestfile:
+        manifestfile.write('"""Metadata and dependencies of all QSAR modules, generated by models.write_manifest"""\n')
+        manifestfile.write(''.join(['manifest = ', pprint.pformat(manifest, width=120), '\n']))
+    # the cached manifest is stale now
+    global _manifest
+    _manifest = None
@@ -0,0 +1,1674 @@
+"""Metadata and dependencies of all QSAR modules, generated by models.write_manifest"""
+manifest = {'ifsqsar.models.ifs_qsar_ADB_UFZ__A_linr': {'chemical_inputs': {'component max': 0,
+                                                                 'component min': 0,
+                                                                 'solute max': 1,
+                                                                 'solute min': 1,
+                                                                 'solvent max': 0,
+                                                                 'solvent min': 0,
+                                                                 'total max': 1,
+                                                                 'total min': 1},
+                                             'citation': 'Approximately as implemented in : Ulrich, N.;  Endo, S.;  '
+                                                         'Brown, T. N.;  Watanabe, N.;  Bronner, G.;  Abraham, M. H.; '
+                                                         'Goss, K. U., UFZ-LSER database v 3.2 [Internet]. 2017. '
+                                                         '(http://www.ufz.de/index.php?en=31698)',
+                                             'endpoint': 'Abraham PPLFER solute descriptor A - hydrogen bond acidity',
+                                             'ismixture': False,
+                                             'model_class': 'QSARModel',
+                                             'model_name': 'A',
+                                             'model_type': 'MLR',
+                                             'units': 'unitless',
+                                             'value_names': ('A',),
+                                             'version': 1},
+ 'ifsqsar.models.ifs_qsar_ADB_UFZ__L_linr': {'chemical_inputs': {'component max': 0,
+                                                                 'component min': 0,
+                                                                 'solute max': 1,
+                                                                 'solute min': 1,
+                                                                 'solvent max': 0,
+                                                                 'solvent min': 0,
+                                                                 'total max': 1,
+                                                                 'total min': 1},
+                                             'citation': 'Approximately as implemented in : Ulrich, N.;  Endo, S.;  '
+                                                         'Brown, T. N.;  Watanabe, N.;  Bronner, G.;  Abraham, M. H.; '
+                                                         'Goss, K. U., UFZ-LSER database v 3.2 [Internet]. 2017. '
+                                                         '(http://www.ufz.de/index.php?en=31698)',
+                                             'endpoint': 'Abraham PPLFER solute descriptor L - log of hexadecane/air '
+                                                         'partition coefficient',
+                                             'ismixture': False,
+                                             'model_class': 'QSARModel',
+                                             'model_name': 'L',
+                                             'model_type': 'MLR',
+                                             'units': 'unitless',
+                                             'value_names': ('L',),
+                                             'version': 1},
+ 'ifsqsar.models.ifs_qsar_ADB_UFZ__S_linr': {'chemical_inputs': {'component max': 0,
+                                                                 'component min': 0,
+                                                                 'solute max': 1,
+                                                                 'solute min': 1,
+                                                                 'solvent max': 0,
+                                                                 'solvent min': 0,
+                                                                 'total max': 1,
+                                                                 'total min': 1},
+                                             'citation': 'Approximately as implemented in : Ulrich, N.;  Endo, S.;  '
+                                                         'Brown, T. N.;  Watanabe, N.;  Bronner, G.;  Abraham, M. H.; '
+                                                         'Goss, K. U., UFZ-LSER database v 3.2 [Internet]. 2017. '
+                                                         '(http://www.ufz.de/index.php?en=31698)',
+                                             'endpoint': 'Abraham PPLFER solute descriptor S - '
+                                                         'dipolarity/polarizability',
+                                             'ismixture': False,
+                                             'model_class': 'QSARModel',
+                                             'model_name': 'S',
+                                             'model_type': 'MLR',
+                                             'units': 'unitless',
+                                             'value_names': ('S',),
+                                             'version': 1},
+ 'ifsqsar.models.ifs_qsar_dsm_linr': {'chemical_inputs': {'component max': 0,
+                                                          'component min': 0,
+                                                          'solute max': 1,
+                                                          'solute min': 1,
+                                                          'solvent max': 0,
+                                                          'solvent min': 0,
+                                                          'total max': 1,
+                                                          'total min': 1},
+                                      'citation': 'Brown, T. N.;  Armitage, J. M.; Arnot, J. A., Application of an '
+                                                  'Iterative Fragment Selection (IFS) Method to Estimate Entropies of '
+                                                  'Fusion and Melting Points of Organic Chemicals. Mol Inform 2019, 38 '
+                                                  '(8-9), 1800160 (https://doi.org/10.1002/minf.201800160).',
+                                      'endpoint': 'Entropy of fusion',
+                                      'ismixture': False,
+                                      'model_class': 'QSARModel',
+                                      'model_name': 'dsm',
+                                      'model_type': 'MLR',
+                                      'units': 'J/mol.K',
+                                      'value_names': ('dsm',),
+                                      'version': 1},
+ 'ifsqsar.models.ifs_qsar_fhlb_linr': {'chemical_inputs': {'component max': 0,
+                                                           'component min': 0,
+                                                           'solute max': 1,
+                                                           'solute min': 1,
+                                                           'solvent max': 0,
+                                                           'solvent min': 0,
+                                                           'total max': 1,
+                                                           'total min': 1},
+                                       'citation': 'Brown, T. N.;  Arnot, J. A.; Wania, F., Iterative fragment '
+                                                   'selection: a group contribution approach to predicting fish '
+                                                   'biotransformation half-lives. Environ Sci Technol 2012, 46 (15), '
+                                                   '8253-60 (https://doi.org/10.1021/es301182a).',
+                                       'endpoint': 'Whole body biotransformation half-life in reference fish (0.01kg, '
+                                                   '15degC)',
+                                       'ismixture': False,
+                                       'model_class': 'QSARModel',
+                                       'model_name': 'fhlb',
+                                       'model_type': 'MLR',
+                                       'units': 'hours',
+                                       'value_names': ('fhlb',),
+                                       'version': 1},
+ 'ifsqsar.models.ifs_qsar_hhlb_linr': {'chemical_inputs': {'component max': 0,
+                                                           'component min': 0,
+                                                           'solute max': 1,
+                                                           'solute min': 1,
+                                                           'solvent max': 0,
+                                                           'solvent min': 0,
+                                                           'total max': 1,
+                                                           'total min': 1},
+                                       'citation': 'Arnot, J. A.;  Brown, T. N.; Wania, F., Estimating screening-level '
+                                                   'organic chemical half-lives in humans. Environ Sci Technol 2014, '
+                                                   '48 (1), 723-30 (https://doi.org/10.1021/es4029414).',
+                                       'endpoint': 'Whole body biotransformation half-life in reference human (70kg)',
+                                       'ismixture': False,
+                                       'model_class': 'QSARModel',
+                                       'model_name': 'hhlb',
+                                       'model_type': 'MLR',
+                                       'units': 'hours',
+                                       'value_names': ('hhlb',),
+                                       'version': 1},
+ 'ifsqsar.models.ifs_qsar_hhlt_linr': {'chemical_inputs': {'component max': 0,
+                                                           'component min': 0,
+                                                           'solute max': 1,
+                                                           'solute min': 1,
+                                                           'solvent max': 0,
+                                                           'solvent min': 0,
+                                                           'total max': 1,
+                                                           'total min': 1},
+                                       'citation': 'Arnot, J. A.;  Brown, T. N.; Wania, F., Estimating screening-level '
+                                                   'organic chemical half-lives in humans. Environ Sci Technol 2014, '
+                                                   '48 (1), 723-30 (https://doi.org/10.1021/es4029414).',
+                                       'endpoint': 'Whole body total elimination (terminal) half-life in reference '
+                                                   'human (70kg)',
+                                       'ismixture': False,
+                                       'model_class': 'QSARModel',
+                                       'model_name': 'hhlt',
+                                       'model_type': 'MLR',
+                                       'units': 'hours',
+                                       'value_names': ('hhlt',),
+                                       'version': 1},
+ 'ifsqsar.models.ifs_qsar_pplfer_solutes_A_linr': {'chemical_inputs': {'component max': 0,
+                                                                       'component min': 0,
+                                                                       'solute max': 1,
+                                                                       'solute min': 1,
+                                                                       'solvent max': 0,
+                                                                       'solvent min': 0,
+                                                                       'total max': 1,
+                                                                       'total min': 1},
+                                                   'citation': 'Brown, T. N.; QSPRs for Predicting Equilibrium '
+                                                               'Partitioning in Solvent-Air Systems from the Chemical '
+                                                               'Structures of Solutes and Solvents. J Solution Chem '
+                                                               '2022, 51, 1101 '
+                                                               '(https://doi.org/10.1007/s10953-022-01162-2).',
+                                                   'endpoint': 'Abraham PPLFER solute descriptor A - hydrogen bond '
+                                                               'acidity',
+                                                   'ismixture': False,
+                                                   'model_class': 'QSARModel',
+                                                   'model_name': 'A',
+                                                   'model_type': 'MLR',
+                                                   'units': 'unitless',
+                                                   'value_names': ('A',),
+                                                   'version': 2},
+ 'ifsqsar.models.ifs_qsar_pplfer_solutes_A_v3_linr': {'chemical_inputs': {'component max': 0,
+                                                                          'component min': 0,
+                                                                          'solute max': 1,
+                                                                          'solute min': 1,
+                                                                          'solvent max': 0,
+                                                                          'solvent min': 0,
+                                                                          'total max': 1,
+                                                                          'total min': 1},
+                                                      'citation': 'Brown, T. N.; Armitage, J. M.; Sangion, A.; Arnot, '
+                                                                  'J. A.; Improved prediction of PFAS partitioning '
+                                                                  'with PPLFERs and QSPRs. Environ. Sci.: Process. '
+                                                                  'Impacts, 2024, Accepted.',
+                                                      'endpoint': 'Abraham PPLFER solute descriptor A - hydrogen bond '
+                                                                  'acidity - updated for PFAS',
+                                                      'ismixture': False,
+                                                      'model_class': 'QSARModel',
+                                                      'model_name': 'A',
+                                                      'model_type': 'MLR',
+                                                      'units': '',
+                                                      'value_names': ('A',),
+                                                      'version': 3},
+ 'ifsqsar.models.ifs_qsar_pplfer_system_2_a_linr': {'chemical_inputs': {'component max': 0,
+                                                                        'component min': 0,
+                                                                        'solute max': 1,
+                                                                        'solute min': 1,
+                                                                        'solvent max': 0,
+                                                                        'solvent min': 0,
+                                                                        'total max': 1,
+                                                                        'total min': 1},
+                                                    'citation': 'Brown, T. N.; QSPRs for Predicting Equilibrium '
+                                                                'Partitioning in Solvent-Air Systems from the Chemical '
+                                                                'Structures of Solutes and Solvents. J Solution Chem '
+                                                                '2022, 51, 1101 '
+                                                                '(https://doi.org/10.1007/s10953-022-01162-2).',
+                                                    'endpoint': 'Abraham/Goss PPLFER system parameter a for '
+                                                                'solvent-air partitioning as log Ksa',
+                                                    'ismixture': False,
+                                                    'model_class': 'QSARModel',
+                                                    'model_name': 'a',
+                                                    'model_type': 'MLR',
+                                                    'units': 'unitless',
+                                                    'value_names': ('a',),
+                                                    'version': 1},
+ 'ifsqsar.models.ifs_qsar_pplfer_system_2_b_linr': {'chemical_inputs': {'component max': 0,
+                                                                        'component min': 0,
+                                                                        'solute max': 1,
+                                                                        'solute min': 1,
+                                                                        'solvent max': 0,
+                                                                        'solvent min': 0,
+                                                                        'total max': 1,
+                                                                        'total min': 1},
+                                                    'citation': 'Brown, T. N.; QSPRs for Predicting Equilibrium '
+                                                                'Partitioning in Solvent-Air Systems from the Chemical '
+                                                                'Structures of Solutes and Solvents. J Solution Chem '
+                                                                '2022, 51, 1101 '
+                                                                '(https://doi.org/10.1007/s10953-022-01162-2).',
+                                                    'endpoint': 'Abraham/Goss PPLFER system parameter b for '
+                                                                'solvent-air partitioning as log Ksa',
+                                                    'ismixture': False,
+                                                    'model_class': 'QSARModel',
+                                                    'model_name': 'b',
+                                                    'model_type': 'MLR',
+                                                    'units': 'unitless',
+                                                    'value_names': ('b',),
+                                                    'version': 1},
+ 'ifsqsar.models.ifs_qsar_pplfer_system_2_c_linr': {'chemical_inputs': {'component max': 0,
+                                                                        'component min': 0,
+                                                                        'solute max': 1,
+                                                                        'solute min': 1,
+                                                                        'solvent max': 0,
+                                                                        'solvent min': 0,
+                                                                        'total max': 1,
+                                                                        'total min': 1},
+                                                    'citation': 'Brown, T. N.; QSPRs for Predicting Equilibrium '
+                                                                'Partitioning in Solvent-Air Systems from the Chemical '
+                                                                'Structures of Solutes and Solvents. J Solution Chem '
+                                                                '2022, 51, 1101 '
+                                                                '(https://doi.org/10.1007/s10953-022-01162-2).',
+                                                    'endpoint': 'Abraham/Goss PPLFER system parameter c for '
+                                                                'solvent-air partitioning as log Ksa',
+                                                    'ismixture': False,
+                                                    'model_class': 'QSARModel',
+                                                    'model_name': 'c',
+                                                    'model_type': 'MLR',
+                                                    'units': 'unitless',
+                                                    'value_names': ('c',),
+                                                    'version': 1},
+ 'ifsqsar.models.ifs_qsar_pplfer_system_2_l_linr': {'chemical_inputs': {'component max': 0,
+                                                                        'component min': 0,
+                                                                        'solute max': 1,
+                                                                        'solute min': 1,
+                                                                        'solvent max': 0,
+                                                                        'solvent min': 0,
+                                                                        'total max': 1,
+                                                                        'total min': 1},
+                                                    'citation': 'Brown, T. N.; QSPRs for Predicting Equilibrium '
+                                                                'Partitioning in Solvent-Air Systems from the Chemical '
+                                                                'Structures of Solutes and Solvents. J Solution Chem '
+                                                                '2022, 51, 1101 '
+                                                                '(https://doi.org/10.1007/s10953-022-01162-2).',
+                                                    'endpoint': 'Abraham/Goss PPLFER system parameter l for '
+                                                                'solvent-air partitioning as log Ksa',
+                                                    'ismixture': False,
+                                                    'model_class': 'QSARModel',
+                                                    'model_name': 'l',
+                                                    'model_type': 'MLR',
+                                                    'units': 'unitless',
+                                                    'value_names': ('l',),
+                                                    'version': 1},
+ 'ifsqsar.models.ifs_qsar_pplfer_system_2_s_linr': {'chemical_inputs': {'component max': 0,
+                                                                        'component min': 0,
+                                                                        'solute max': 1,
+                                                                        'solute min': 1,
+                                                                        'solvent max': 0,
+                                                                        'solvent min': 0,
+                                                                        'total max': 1,
+                                                                        'total min': 1},
+                                                    'citation': 'Brown, T. N.; QSPRs for Predicting Equilibrium '
+                                                                'Partitioning in Solvent-Air Systems from the Chemical '
+                                                                'Structures of Solutes and Solvents. J Solution Chem '
+                                                                '2022, 51, 1101 '
+                                                                '(https://doi.org/10.1007/s10953-022-01162-2).',
+                                                    'endpoint': 'Abraham/Goss PPLFER system parameter s for '
+                                                                'solvent-air partitioning as log Ksa',
+                                                    'ismixture': False,
+                                                    'model_class': 'QSARModel',
+                                                    'model_name': 's',
+                                                    'model_type': 'MLR',
+                                                    'units': 'unitless',
+                                                    'value_names': ('s',),
+                                                    'version': 1},
+ 'ifsqsar.models.ifs_qsar_pplfer_system_2_v_linr': {'chemical_inputs': {'component max': 0,
+                                                                        'component min': 0,
+                                                                        'solute max': 1,
+                                                                        'solute min': 1,
+                                                                        'solvent max': 0,
+                                                                        'solvent min': 0,
+                                                                        'total max': 1,
+                                                                        'total min': 1},
+                                                    'citation': 'Brown, T. N.; QSPRs for Predicting Equilibrium '
+                                                                'Partitioning in Solvent-Air Systems from the Chemical '
+                                                                'Structures of Solutes and Solvents. J Solution Chem '
+                                                                '2022, 51, 1101 '
+                                                                '(https://doi.org/10.1007/s10953-022-01162-2).',
+                                                    'endpoint': 'Abraham/Goss PPLFER system parameter v for '
+                                                                'solvent-air partitioning as log Ksa',
+                                                    'ismixture': False,
+                                                    'model_class': 'QSARModel',
+                                                    'model_name': 'v',
+                                                    'model_type': 'MLR',
+                                                    'units': 'unitless',
+                                                    'value_names': ('v',),
+                                                    'version': 1},
+ 'ifsqsar.models.ifs_qsar_tm_linr': {'chemical_inputs': {'component max': 0,
+                                                         'component min': 0,
+                                                         'solute max': 1,
+                                                         'solute min': 1,
+                                                         'solvent max': 0,
+                                                         'solvent min': 0,
+                                                         'total max': 1,
+                                                         'total min': 1},
+                                     'citation': 'Brown, T. N.;  Armitage, J. M.; Arnot, J. A., Application of an '
+                                                 'Iterative Fragment Selection (IFS) Method to Estimate Entropies of '
+                                                 'Fusion and Melting Points of Organic Chemicals. Mol Inform 2019, 38 '
+                                                 '(8-9), 1800160 (https://doi.org/10.1002/minf.201800160).',
+                                     'endpoint': 'Melting point - predicted by QSPR',
+                                     'ismixture': False,
+                                     'model_class': 'QSARModel',
+                                     'model_name': 'tm',
+                                     'model_type': 'MLR',
+                                     'units': 'K',
+                                     'value_names': ('Tm',),
+                                     'version': 1},
+ 'ifsqsar.models.meta_qsar_MV_liquid': {'chemical_inputs': {'component max': 0,
+                                                            'component min': 0,
+                                                            'solute max': 1,
+                                                            'solute min': 1,
+                                                            'solvent max': 0,
+                                                            'solvent min': 0,
+                                                            'total max': 1,
+                                                            'total min': 1},
+                                        'citation': 'Kotomin, A. A.; Kozlov, A. S., Calculation of densities of '
+                                                    'organic compounds from contributions of molecular fragments. Russ '
+                                                    'J Appl Chem 2006, 79 (6), 957-966.',
+                                        'component_dependencies_list': [],
+                                        'dependency_reads': {'*': (1,), 'MVliqcorr': (0,), 'MVsolid': (0,)},
+                                        'endpoint': 'Molar volume of liquid',
+                                        'ismixture': False,
+                                        'model_class': 'METAQSARModel',
+                                        'model_name': 'MVliquid',
+                                        'solute_dependencies_list': [('MVsolid', 1), ('MVliqcorr', 1)],
+                                        'solvent_dependencies_list': [],
+                                        'units': 'cm^3/mol',
+                                        'value_names': ('MVliquid',),
+                                        'version': 1},
+ 'ifsqsar.models.meta_qsar_MV_solid': {'chemical_inputs': {'component max': 0,
+                                                           'component min': 0,
+                                                           'solute max': 1,
+                                                           'solute min': 1,
+                                                           'solvent max': 0,
+                                                           'solvent min': 0,
+                                                           'total max': 1,
+                                                           'total min': 1},
+                                       'citation': 'Kotomin, A. A.; Kozlov, A. S., Calculation of densities of organic '
+                                                   'compounds from contributions of molecular fragments. Russ J Appl '
+                                                   'Chem 2006, 79 (6), 957-966.',
+                                       'component_dependencies_list': [],
+                                       'dependency_reads': {'*': (1,),
+                                                            'MVmlr': (0,),
+                                                            'MVmlrRings': (0,),
+                                                            'MVmlrx': (0,),
+                                                            'MW': (0,)},
+                                       'endpoint': 'Molar volume of solid',
+                                       'ismixture': False,
+                                       'model_class': 'METAQSARModel',
+                                       'model_name': 'MVsolid',
+                                       'solute_dependencies_list': ['MVmlrx', 'MVmlr', 'MVmlrRings', 'MW'],
+                                       'solvent_dependencies_list': [],
+                                       'units': 'cm^3/mol',
+                                       'value_names': ('MVsolid',),
+                                       'version': 1},
+ 'ifsqsar.models.meta_qsar_MV_solid_V': {'chemical_inputs': {'component max': 0,
+                                                             'component min': 0,
+                                                             'solute max': 1,
+                                                             'solute min': 1,
+                                                             'solvent max': 0,
+                                                             'solvent min': 0,
+                                                             'total max': 1,
+                                                             'total min': 1},
+                                         'citation': 'Brown T.N., Sangion A., Arnot J.A.; Identifying Uncertainty in '
+                                                     'Physical-Chemical Property Estimation with IFSQSAR. J '
+                                                     'Cheminform, 2024. 16(1): p65 '
+                                                     '(https://doi.org/10.1186/s13321-024-00853-w).',
+                                         'component_dependencies_list': [],
+                                         'dependency_reads': {'*': (1,), 'MVliquid': (0,)},
+                                         'endpoint': 'Molar volume of solid',
+                                         'ismixture': False,
+                                         'model_class': 'METAQSARModel',
+                                         'model_name': 'MVsolid',
+                                         'solute_dependencies_list': [('MVliquid', 2)],
+                                         'solvent_dependencies_list': [],
+                                         'units': 'cm^3/mol',
+                                         'value_names': ('MVsolid',),
+                                         'version': 2},
+ 'ifsqsar.models.meta_qsar_density_liquid': {'chemical_inputs': {'component max': 0,
+                                                                 'component min': 0,
+                                                                 'solute max': 1,
+                                                                 'solute min': 1,
+                                                                 'solvent max': 0,
+                                                                 'solvent min': 0,
+                                                                 'total max': 1,
+                                                                 'total min': 1},
+                                             'citation': 'Brown T.N., Sangion A., Arnot J.A.; Identifying Uncertainty '
+                                                         'in Physical-Chemical Property Estimation with IFSQSAR. J '
+                                                         'Cheminform, 2024. 16(1): p65 '
+                                                         '(https://doi.org/10.1186/s13321-024-00853-w).',
+                                             'component_dependencies_list': [],
+                                             'dependency_reads': {'*': (1,), 'MVliquid': (0,), 'MW': (0,)},
+                                             'endpoint': 'Density of pure liquid',
+                                             'ismixture': False,
+                                             'model_class': 'METAQSARModel',
+                                             'model_name': 'densityliquid',
+                                             'solute_dependencies_list': ['MVliquid', 'MW'],
+                                             'solvent_dependencies_list': [],
+                                             'units': 'g/cm^3',
+                                             'value_names': ('densityliquid',),
+                                             'version': 1},
+ 'ifsqsar.models.meta_qsar_density_solid': {'chemical_inputs': {'component max': 0,
+                                                                'component min': 0,
+                                                                'solute max': 1,
+                                                                'solute min': 1,
+                                                                'solvent max': 0,
+                                                                'solvent min': 0,
+                                                                'total max': 1,
+                                                                'total min': 1},
+                                            'citation': 'Brown T.N., Sangion A., Arnot J.A.; Identifying Uncertainty '
+                                                        'in Physical-Chemical Property Estimation with IFSQSAR. J '
+                                                        'Cheminform, 2024. 16(1): p65 '
+                                                        '(https://doi.org/10.1186/s13321-024-00853-w).',
+                                            'component_dependencies_list': [],
+                                            'dependency_reads': {'*': (1,), 'MVsolid': (0,), 'MW': (0,)},
+                                            'endpoint': 'Density of pure solid',
+                                            'ismixture': False,
+                                            'model_class': 'METAQSARModel',
+                                            'model_name': 'densitysolid',
+                                            'solute_dependencies_list': ['MVsolid', 'MW'],
+                                            'solvent_dependencies_list': [],
+                                            'units': 'g/cm^3',
+                                            'value_names': ('densitysolid',),
+                                            'version': 1},
+ 'ifsqsar.models.meta_qsar_hlbiodeg': {'chemical_inputs': {'component max': 0,
+                                                           'component min': 0,
+                                                           'solute max': 1,
+                                                           'solute min': 1,
+                                                           'solvent max': 0,
+                                                           'solvent min': 0,
+                                                           'total max': 1,
+                                                           'total min': 1},
+                                       'citation': 'BIOWIN3 and BIOWIN4: Boethling, R. S.;  Howard, P. H.;  Meylan, '
+                                                   'W.;  Stiteler, W.;  Beauman, J.; Tirado, N., Group contribution '
+                                                   'method for predicting probability and rate of aerobic '
+                                                   'biodegradation. Environ Sci Technol 1994, 28 (3), 459-65. '
+                                                   'Extrapolation to HLbiodeg: Arnot, J. A.;  Gouin, T.; Mackay, D. '
+                                                   'Development and Application of Models of Chemical Fate in Canada - '
+                                                   'Practical methods for estimating environmental biodegradation '
+                                                   'rates; CEMN Report No. 200503, 2005.',
+                                       'component_dependencies_list': [],
+                                       'dependency_reads': {'biowin3usmmlra': (0,),
+                                                            'biowin3usmmlrx': (0,),
+                                                            'biowin4psmmlra': (0,),
+                                                            'biowin4psmmlrx': (0,)},
+                                       'endpoint': 'Biodegradation half-life in water (20-25degC)',
+                                       'ismixture': False,
+                                       'model_class': 'METAQSARModel',
+                                       'model_name': 'HLbiodeg',
+                                       'solute_dependencies_list': ['biowin3usmmlrx',
+                                                                    'biowin3usmmlra',
+                                                                    'biowin4psmmlrx',
+                                                                    'biowin4psmmlra'],
+                                       'solvent_dependencies_list': [],
+                                       'units': 'hours',
+                                       'value_names': ('HLbiodeg',),
+                                       'version': 1},
+ 'ifsqsar.models.meta_qsar_logSo_liquid': {'chemical_inputs': {'component max': 0,
+                                                               'component min': 0,
+                                                               'solute max': 1,
+                                                               'solute min': 1,
+                                                               'solvent max': 0,
+                                                               'solvent min': 0,
+                                                               'total max': 1,
+                                                               'total min': 1},
+                                           'citation': 'Solute descriptors: Brown, T. N.; QSPRs for Predicting '
+                                                       'Equilibrium Partitioning in Solvent-Air Systems from the '
+                                                       'Chemical Structures of Solutes and Solvents. J Solution Chem '
+                                                       '2022, 51, 1101 (https://doi.org/10.1007/s10953-022-01162-2). '
+                                                       'PPLFER Equation: Brown T.N., Sangion A., Arnot J.A.; '
+                                                       'Identifying Uncertainty in Physical-Chemical Property '
+                                                       'Estimation with IFSQSAR. J Cheminform, 2024. 16(1): p65 '
+                                                       '(https://doi.org/10.1186/s13321-024-00853-w).',
+                                           'component_dependencies_list': [],
+                                           'dependency_reads': {'*': (1,),
+                                                                'A': (0, 1, 2),
+                                                                'B': (0, 1, 2),
+                                                                'L': (0, 1, 2),
+                                                                'MVliquid': (0,),
+                                                                'S': (0, 1, 2),
+                                                                'V': (0,)},
+                                           'endpoint': 'Log of solubility in dry octanol for liquid or super-cooled '
+                                                       'liquid solute',
+                                           'ismixture': False,
+                                           'model_class': 'METAQSARModel',
+                                           'model_name': 'logSoliquid',
+                                           'solute_dependencies_list': [('S', 2),
+                                                                        ('A', 2),
+                                                                        ('B', 2),
+                                                                        ('V', 1),
+                                                                        ('L', 2),
+                                                                        ('MVliquid', 2)],
+                                           'solvent_dependencies_list': [],
+                                           'units': 'log mol/L',
+                                           'value_names': ('logSoliquid',),
+                                           'version': 1},
+ 'ifsqsar.models.meta_qsar_logSo_liquid_v2': {'chemical_inputs': {'component max': 0,
+                                                                  'component min': 0,
+                                                                  'solute max': 1,
+                                                                  'solute min': 1,
+                                                                  'solvent max': 0,
+                                                                  'solvent min': 0,
+                                                                  'total max': 1,
+                                                                  'total min': 1},
+                                              'citation': 'Brown, T. N.; Armitage, J. M.; Sangion, A.; Arnot, J. A.; '
+                                                          'Improved prediction of PFAS partitioning with PPLFERs and '
+                                                          'QSPRs. Environ. Sci.: Process. Impacts, 2024, Accepted.',
+                                              'component_dependencies_list': [],
+                                              'dependency_reads': {'*': (1,),
+                                                                   'A': (0, 1, 2),
+                                                                   'B': (0, 1, 2),
+                                                                   'L': (0, 1, 2),
+                                                                   'MVliquid': (0,),
+                                                                   'S': (0, 1, 2),
+                                                                   'Vf': (0,)},
+                                              'endpoint': 'Log of solubility in dry octanol for liquid or super-cooled '
+                                                          'liquid solute - updated for PFAS',
+                                              'ismixture': False,
+                                              'model_class': 'METAQSARModel',
+                                              'model_name': 'logSoliquid',
+                                              'solute_dependencies_list': [('S', 3),
+                                                                           ('A', 3),
+                                                                           ('B', 3),
+                                                                           ('Vf', 1),
+                                                                           ('L', 3),
+                                                                           ('MVliquid', 2)],
+                                              'solvent_dependencies_list': [],
+                                              'units': 'log mol/L',
+                                              'value_names': ('logSoliquid',),
+                                              'version': 2},
+ 'ifsqsar.models.meta_qsar_logSowet_liquid': {'chemical_inputs': {'component max': 0,
+                                                                  'component min': 0,
+                                                                  'solute max': 1,
+                                                                  'solute min': 1,
+                                                                  'solvent max': 0,
+                                                                  'solvent min': 0,
+                                                                  'total max': 1,
+                                                                  'total min': 1},
+                                              'citation': 'Solute descriptors: Brown, T. N.; QSPRs for Predicting '
+                                                          'Equilibrium Partitioning in Solvent-Air Systems from the '
+                                                          'Chemical Structures of Solutes and Solvents. J Solution '
+                                                          'Chem 2022, 51, 1101 '
+                                                          '(https://doi.org/10.1007/s10953-022-01162-2). PPLFER '
+                                                          'Equation: Brown T.N., Sangion A., Arnot J.A.; Identifying '
+                                                          'Uncertainty in Physical-Chemical Property Estimation with '
+                                                          'IFSQSAR. J Cheminform, 2024. 16(1): p65 '
+                                                          '(https://doi.org/10.1186/s13321-024-00853-w).',
+                                              'component_dependencies_list': [],
+                                              'dependency_reads': {'*': (1,),
+                                                                   'A': (0, 1, 2),
+                                                                   'B': (0, 1, 2),
+                                                                   'L': (0, 1, 2),
+                                                                   'MVliquid': (0,),
+                                                                   'S': (0, 1, 2),
+                                                                   'V': (0,)},
+                                              'endpoint': 'Log of solubility in wet octanol for liquid or super-cooled '
+                                                          'liquid solute',
+                                              'ismixture': False,
+                                              'model_class': 'METAQSARModel',
+                                              'model_name': 'logSowetliquid',
+                                              'solute_dependencies_list': [('S', 2),
+                                                                           ('A', 2),
+                                                                           ('B', 2),
+                                                                           ('V', 1),
+                                                                           ('L', 2),
+                                                                           ('MVliquid', 2)],
+                                              'solvent_dependencies_list': [],
+                                              'units': 'log mol/L',
+                                              'value_names': ('logSowetliquid',),
+                                              'version': 1},
+ 'ifsqsar.models.meta_qsar_logSowet_liquid_v2': {'chemical_inputs': {'component max': 0,
+                                                                     'component min': 0,
+                                                                     'solute max': 1,
+                                                                     'solute min': 1,
+                                                                     'solvent max': 0,
+                                                                     'solvent min': 0,
+                                                                     'total max': 1,
+                                                                     'total min': 1},
+                                                 'citation': 'Brown, T. N.; Armitage, J. M.; Sangion, A.; Arnot, J. '
+                                                             'A.; Improved prediction of PFAS partitioning with '
+                                                             'PPLFERs and QSPRs. Environ. Sci.: Process. Impacts, '
+                                                             '2024, Accepted.',
+                                                 'component_dependencies_list': [],
+                                                 'dependency_reads': {'*': (1,),
+                                                                      'A': (0, 1, 2),
+                                                                      'B': (0, 1, 2),
+                                                                      'L': (0, 1, 2),
+                                                                      'MVliquid': (0,),
+                                                                      'S': (0, 1, 2),
+                                                                      'Vf': (0,)},
+                                                 'endpoint': 'Log of solubility in wet octanol for liquid or '
+                                                             'super-cooled liquid solute - updated for PFAS',
+                                                 'ismixture': False,
+                                                 'model_class': 'METAQSARModel',
+                                                 'model_name': 'logSowetliquid',
+                                                 'solute_dependencies_list': [('S', 3),
+                                                                              ('A', 3),
+                                                                              ('B', 3),
+                                                                              ('Vf', 1),
+                                                                              ('L', 3),
+                                                                              ('MVliquid', 2)],
+                                                 'solvent_dependencies_list': [],
+                                                 'units': 'log mol/L',
+                                                 'value_names': ('logSowetliquid',),
+                                                 'version': 2},
+ 'ifsqsar.models.meta_qsar_logSw_liquid': {'chemical_inputs': {'component max': 0,
+                                                               'component min': 0,
+                                                               'solute max': 1,
+                                                               'solute min': 1,
+                                                               'solvent max': 0,
+                                                               'solvent min': 0,
+                                                               'total max': 1,
+                                                               'total min': 1},
+                                           'citation': 'Solute descriptors and VP: Brown, T. N.; QSPRs for Predicting '
+                                                       'Equilibrium Partitioning in Solvent-Air Systems from the '
+                                                       'Chemical Structures of Solutes and Solvents. J Solution Chem '
+                                                       '2022, 51, 1101 (https://doi.org/10.1007/s10953-022-01162-2). '
+                                                       'PPLFER Equation for thermodynamic cycle: Brown, T. N., '
+                                                       'Empirical Regressions between System Parameters and Solute '
+                                                       'Descriptors of Polyparameter Linear Free Energy Relationships '
+                                                       '(PPLFERs) for Predicting Solvent-Air Partitioning. Fluid Phase '
+                                                       'Equilibria 2021, 113035.',
+                                           'component_dependencies_list': [],
+                                           'dependency_reads': {'*': (1,),
+                                                                'A': (0, 1, 2),
+                                                                'B': (0, 1, 2),
+                                                                'E': (0, 1, 2),
+                                                                'L': (0, 1, 2),
+                                                                'MVliquid': (0, 2),
+                                                                'S': (0, 1, 2),
+                                                                'V': (0,),
+                                                                'a': (0, 2),
+                                                                'b': (0, 2),
+                                                                'c': (0, 2),
+                                                                'l': (0, 2),
+                                                                'logKaw': (0, 1, 2),
+                                                                's': (0, 2),
+                                                                'state': (3,),
+                                                                'v': (0, 2)},
+                                           'endpoint': 'Log of solubility in water for liquid solute',
+                                           'ismixture': False,
+                                           'model_class': 'METAQSARModel',
+                                           'model_name': 'logSwliquid',
+                                           'solute_dependencies_list': [('E', 2),
+                                                                        ('S', 2),
+                                                                        ('A', 2),
+                                                                        ('B', 2),
+                                                                        ('V', 1),
+                                                                        ('L', 2),
+                                                                        ('s', 1),
+                                                                        ('a', 1),
+                                                                        ('b', 1),
+                                                                        ('v', 1),
+                                                                        ('l', 1),
+                                                                        ('c', 1),
+                                                                        ('state', 1),
+                                                                        ('MVliquid', 2),
+                                                                        ('logKaw', 1)],
+                                           'solvent_dependencies_list': [],
+                                           'units': 'log mol/L[w]',
+                                           'value_names': ('logSwliquid',),
+                                           'version': 1},
+ 'ifsqsar.models.meta_qsar_logSw_liquid_pplfer': {'chemical_inputs': {'component max': 0,
+                                                                      'component min': 0,
+                                                                      'solute max': 1,
+                                                                      'solute min': 1,
+                                                                      'solvent max': 0,
+                                                                      'solvent min': 0,
+                                                                      'total max': 1,
+                                                                      'total min': 1},
+                                                  'citation': 'Solute descriptors: Brown, T. N.; QSPRs for Predicting '
+                                                              'Equilibrium Partitioning in Solvent-Air Systems from '
+                                                              'the Chemical Structures of Solutes and Solvents. J '
+                                                              'Solution Chem 2022, 51, 1101 '
+                                                              '(https://doi.org/10.1007/s10953-022-01162-2). PPLFER '
+                                                              'Equation: Brown T.N., Sangion A., Arnot J.A.; '
+                                                              'Identifying Uncertainty in Physical-Chemical Property '
+                                                              'Estimation with IFSQSAR. J Cheminform, 2024. 16(1): p65 '
+                                                              '(https://doi.org/10.1186/s13321-024-00853-w).',
+                                                  'component_dependencies_list': [],
+                                                  'dependency_reads': {'*': (1,),
+                                                                       'A': (0, 1, 2),
+                                                                       'B': (0, 1, 2),
+                                                                       'L': (0, 1, 2),
+                                                                       'MVliquid': (0,),
+                                                                       'S': (0, 1, 2),
+                                                                       'V': (0,),
+                                                                       'state': (3,)},
+                                                  'endpoint': 'Log of solubility for liquids or super-cooled liquid '
+                                                              'solutes in water predicted by PPLFER at 298K',
+                                                  'ismixture': False,
+                                                  'model_class': 'METAQSARModel',
+                                                  'model_name': 'logSwliquid',
+                                                  'solute_dependencies_list': [('S', 2),
+                                                                               ('A', 2),
+                                                                               ('B', 2),
+                                                                               ('V', 1),
+                                                                               ('L', 2),
+                                                                               ('state', 1),
+                                                                               ('MVliquid', 2)],
+                                                  'solvent_dependencies_list': [],
+                                                  'units': 'log mol/L[w]',
+                                                  'value_names': ('logSwliquid',),
+                                                  'version': 2},
+ 'ifsqsar.models.meta_qsar_logSw_liquid_pplfer_v3': {'chemical_inputs': {'component max': 0,
+                                                                         'component min': 0,
+                                                                         'solute max': 1,
+                                                                         'solute min': 1,
+                                                                         'solvent max': 0,
+                                                                         'solvent min': 0,
+                                                                         'total max': 1,
+                                                                         'total min': 1},
+                                                     'citation': 'Brown, T. N.; Armitage, J. M.; Sangion, A.; Arnot, '
+                                                                 'J. A.; Improved prediction of PFAS partitioning with '
+                                                                 'PPLFERs and QSPRs. Environ. Sci.: Process. Impacts, '
+                                                                 '2024, Accepted.',
+                                                     'component_dependencies_list': [],
+                                                     'dependency_reads': {'*': (1,),
+                                                                          'A': (0, 1, 2),
+                                                                          'B': (0, 1, 2),
+                                                                          'L': (0, 1, 2),
+                                                                          'MVliquid': (0,),
+                                                                          'S': (0, 1, 2),
+                                                                          'Vf': (0,),
+                                                                          'state': (3,)},
+                                                     'endpoint': 'Log of solubility for liquids or super-cooled liquid '
+                                                                 'solutes in water predicted by PPLFER at 298K - '
+                                                                 'updated for PFAS',
+                                                     'ismixture': False,
+                                                     'model_class': 'METAQSARModel',
+                                                     'model_name': 'logSwliquid',
+                                                     'solute_dependencies_list': [('S', 3),
+                                                                                  ('A', 3),
+                                                                                  ('B', 3),
+                                                                                  ('Vf', 1),
+                                                                                  ('L', 3),
+                                                                                  ('state', 1),
+                                                                                  ('MVliquid', 2)],
+                                                     'solvent_dependencies_list': [],
+                                                     'units': 'log mol/L[w]',
+                                                     'value_names': ('logSwliquid',),
+                                                     'version': 3},
+ 'ifsqsar.models.meta_qsar_logVP_liquid': {'chemical_inputs': {'component max': 0,
+                                                               'component min': 0,
+                                                               'solute max': 1,
+                                                               'solute min': 1,
+                                                               'solvent max': 0,
+                                                               'solvent min': 0,
+                                                               'total max': 1,
+                                                               'total min': 1},
+                                           'citation': 'Brown, T. N.; QSPRs for Predicting Equilibrium Partitioning in '
+                                                       'Solvent-Air Systems from the Chemical Structures of Solutes '
+                                                       'and Solvents. J Solution Chem 2022, 51, 1101 '
+                                                       '(https://doi.org/10.1007/s10953-022-01162-2).',
+                                           'component_dependencies_list': [],
+                                           'dependency_reads': {'*': (1,),
+                                                                'A': (0, 1, 2),
+                                                                'B': (0, 1, 2),
+                                                                'E': (0, 1, 2),
+                                                                'L': (0, 1, 2),
+                                                                'MVliquid': (0, 2),
+                                                                'S': (0, 1, 2),
+                                                                'V': (0,),
+                                                                'a': (0, 2),
+                                                                'b': (0, 2),
+                                                                'c': (0, 2),
+                                                                'l': (0, 2),
+                                                                's': (0, 2),
+                                                                'state': (3,),
+                                                                'v': (0, 2)},
+                                           'endpoint': 'Log of vapor pressure of liquid',
+                                           'ismixture': False,
+                                           'model_class': 'METAQSARModel',
+                                           'model_name': 'logVPliquid',
+                                           'solute_dependencies_list': [('E', 2),
+                                                                        ('S', 2),
+                                                                        ('A', 2),
+                                                                        ('B', 2),
+                                                                        ('V', 1),
+                                                                        ('L', 2),
+                                                                        ('s', 1),
+                                                                        ('a', 1),
+                                                                        ('b', 1),
+                                                                        ('v', 1),
+                                                                        ('l', 1),
+                                                                        ('c', 1),
+                                                                        ('state', 1),
+                                                                        ('MVliquid', 2)],
+                                           'solvent_dependencies_list': [],
+                                           'units': 'log Pa',
+                                           'value_names': ('logVPliquid',),
+                                           'version': 1},
+ 'ifsqsar.models.meta_qsar_logVP_liquid_pplfer': {'chemical_inputs': {'component max': 0,
+                                                                      'component min': 0,
+                                                                      'solute max': 1,
+                                                                      'solute min': 1,
+                                                                      'solvent max': 0,
+                                                                      'solvent min': 0,
+                                                                      'total max': 1,
+                                                                      'total min': 1},
+                                                  'citation': 'Solute descriptors: Brown, T. N.; QSPRs for Predicting '
+                                                              'Equilibrium Partitioning in Solvent-Air Systems from '
+                                                              'the Chemical Structures of Solutes and Solvents. J '
+                                                              'Solution Chem 2022, 51, 1101 '
+                                                              '(https://doi.org/10.1007/s10953-022-01162-2). PPLFER '
+                                                              'Equation: Brown T.N., Sangion A., Arnot J.A.; '
+                                                              'Identifying Uncertainty in Physical-Chemical Property '
+                                                              'Estimation with IFSQSAR. J Cheminform, 2024. 16(1): p65 '
+                                                              '(https://doi.org/10.1186/s13321-024-00853-w).',
+                                                  'component_dependencies_list': [],
+                                                  'dependency_reads': {'*': (1,),
+                                                                       'A': (0, 1, 2),
+                                                                       'B': (0, 1, 2),
+                                                                       'L': (0, 1, 2),
+                                                                       'S': (0, 1, 2),
+                                                                       'V': (0,),
+                                                                       'state': (3,)},
+                                                  'endpoint': 'Log of vapor pressure of liquid or super-cooled liquid '
+                                                              'predicted by PPLFER at 298K',
+                                                  'ismixture': False,
+                                                  'model_class': 'METAQSARModel',
+                                                  'model_name': 'logVPliquid',
+                                                  'solute_dependencies_list': [('S', 2),
+                                                                               ('A', 2),
+                                                                               ('B', 2),
+                                                                               ('V', 1),
+                                                                               ('L', 2),
+                                                                               ('state', 1),
+                                                                               ('MVliquid', 2)],
+                                                  'solvent_dependencies_list': [],
+                                                  'units': 'log Pa',
+                                                  'value_names': ('logVPliquid',),
+                                                  'version': 2},
+ 'ifsqsar.models.meta_qsar_logVP_liquid_pplfer_v3': {'chemical_inputs': {'component max': 0,
+                                                                         'component min': 0,
+                                                                         'solute max': 1,
+                                                                         'solute min': 1,
+                                                                         'solvent max': 0,
+                                                                         'solvent min': 0,
+                                                                         'total max': 1,
+                                                                         'total min': 1},
+                                                     'citation': 'Brown, T. N.; Armitage, J. M.; Sangion, A.; Arnot, '
+                                                                 'J. A.; Improved prediction of PFAS partitioning with '
+                                                                 'PPLFERs and QSPRs. Environ. Sci.: Process. Impacts, '
+                                                                 '2024, Accepted.',
+                                                     'component_dependencies_list': [],
+                                                     'dependency_reads': {'*': (1,),
+                                                                          'A': (0, 1, 2),
+                                                                          'B': (0, 1, 2),
+                                                                          'L': (0, 1, 2),
+                                                                          'S': (0, 1, 2),
+                                                                          'Vf': (0,),
+                                                                          'state': (3,)},
+                                                     'endpoint': 'Log of vapor pressure of liquid or super-cooled '
+                                                                 'liquid predicted by PPLFER at 298K - updated for '
+                                                                 'PFAS',
+                                                     'ismixture': False,
+                                                     'model_class': 'METAQSARModel',
+                                                     'model_name': 'logVPliquid',
+                                                     'solute_dependencies_list': [('S', 3),
+                                                                                  ('A', 3),
+                                                                                  ('B', 3),
+                                                                                  ('Vf', 1),
+                                                                                  ('L', 3),
+                                                                                  ('state', 1),
+                                                                                  ('MVliquid', 2)],
+                                                     'solvent_dependencies_list': [],
+                                                     'units': 'log Pa',
+                                                     'value_names': ('logVPliquid',),
+                                                     'version': 3},
+ 'ifsqsar.models.meta_qsar_logkaw_pplfer': {'chemical_inputs': {'component max': 0,
+                                                                'component min': 0,
+                                                                'solute max': 1,
+                                                                'solute min': 1,
+                                                                'solvent max': 0,
+                                                                'solvent min': 0,
+                                                                'total max': 1,
+                                                                'total min': 1},
+                                            'citation': 'Solute descriptors: Brown, T. N.; QSPRs for Predicting '
+                                                        'Equilibrium Partitioning in Solvent-Air Systems from the '
+                                                        'Chemical Structures of Solutes and Solvents. J Solution Chem '
+                                                        '2022, 51, 1101 (https://doi.org/10.1007/s10953-022-01162-2). '
+                                                        'PPLFER Equation: Brown, T. N., Empirical Regressions between '
+                                                        'System Parameters and Solute Descriptors of Polyparameter '
+                                                        'Linear Free Energy Relationships (PPLFERs) for Predicting '
+                                                        'Solvent-Air Partitioning. Fluid Phase Equilibria 2021, '
+                                                        '113035.',
+                                            'component_dependencies_list': [],
+                                            'dependency_reads': {'*': (1,),
+                                                                 'A': (0, 1, 2),
+                                                                 'B': (0, 1, 2),
+                                                                 'L': (0, 1, 2),
+                                                                 'S': (0, 1, 2),
+                                                                 'V': (0,)},
+                                            'endpoint': "Log of air-water partition coefficient (Henry's Law Constant)",
+                                            'ismixture': False,
+                                            'model_class': 'METAQSARModel',
+                                            'model_name': 'logKaw',
+                                            'solute_dependencies_list': [('S', 2),
+                                                                         ('A', 2),
+                                                                         ('B', 2),
+                                                                         ('V', 1),
+                                                                         ('L', 2)],
+                                            'solvent_dependencies_list': [],
+                                            'units': 'log L[w]/L[a]',
+                                            'value_names': ('logKaw',),
+                                            'version': 1},
+ 'ifsqsar.models.meta_qsar_logkaw_pplfer_v2': {'chemical_inputs': {'component max': 0,
+                                                                   'component min': 0,
+                                                                   'solute max': 1,
+                                                                   'solute min': 1,
+                                                                   'solvent max': 0,
+                                                                   'solvent min': 0,
+                                                                   'total max': 1,
+                                                                   'total min': 1},
+                                               'citation': 'Brown, T. N.; Armitage, J. M.; Sangion, A.; Arnot, J. A.; '
+                                                           'Improved prediction of PFAS partitioning with PPLFERs and '
+                                                           'QSPRs. Environ. Sci.: Process. Impacts, 2024, Accepted.',
+                                               'component_dependencies_list': [],
+                                               'dependency_reads': {'*': (1,),
+                                                                    'A': (0, 1, 2),
+                                                                    'B': (0, 1, 2),
+                                                                    'L': (0, 1, 2),
+                                                                    'S': (0, 1, 2),
+                                                                    'Vf': (0,)},
+                                               'endpoint': "Log of air-water partition coefficient (Henry's Law "
+                                                           'Constant) - updated for PFAS',
+                                               'ismixture': False,
+                                               'model_class': 'METAQSARModel',
+                                               'model_name': 'logKaw',
+                                               'solute_dependencies_list': [('S', 3),
+                                                                            ('A', 3),
+                                                                            ('B', 3),
+                                                                            ('Vf', 1),
+                                                                            ('L', 3)],
+                                               'solvent_dependencies_list': [],
+                                               'units': 'log L[w]/L[a]',
+                                               'value_names': ('logKaw',),
+                                               'version': 2},
+ 'ifsqsar.models.meta_qsar_logkoa_pplfer': {'chemical_inputs': {'component max': 0,
+                                                                'component min': 0,
+                                                                'solute max': 1,
+                                                                'solute min': 1,
+                                                                'solvent max': 0,
+                                                                'solvent min': 0,
+                                                                'total max': 1,
+                                                                'total min': 1},
+                                            'citation': 'Solute descriptors: Brown, T. N.; QSPRs for Predicting '
+                                                        'Equilibrium Partitioning in Solvent-Air Systems from the '
+                                                        'Chemical Structures of Solutes and Solvents. J Solution Chem '
+                                                        '2022, 51, 1101 (https://doi.org/10.1007/s10953-022-01162-2). '
+                                                        'PPLFER Equation: Brown, T. N., Empirical Regressions between '
+                                                        'System Parameters and Solute Descriptors of Polyparameter '
+                                                        'Linear Free Energy Relationships (PPLFERs) for Predicting '
+                                                        'Solvent-Air Partitioning. Fluid Phase Equilibria 2021, '
+                                                        '113035.',
+                                            'component_dependencies_list': [],
+                                            'dependency_reads': {'*': (1,),
+                                                                 'A': (0, 1, 2),
+                                                                 'B': (0, 1, 2),
+                                                                 'L': (0, 1, 2),
+                                                                 'S': (0, 1, 2),
+                                                                 'V': (0,)},
+                                            'endpoint': 'Log of octanol-air partition coefficient',
+                                            'ismixture': False,
+                                            'model_class': 'METAQSARModel',
+                                            'model_name': 'logKoa',
+                                            'solute_dependencies_list': [('S', 2),
+                                                                         ('A', 2),
+                                                                         ('B', 2),
+                                                                         ('V', 1),
+                                                                         ('L', 2)],
+                                            'solvent_dependencies_list': [],
+                                            'units': 'log L[a]/L[o]',
+                                            'value_names': ('logKoa',),
+                                            'version': 1},
+ 'ifsqsar.models.meta_qsar_logkoa_pplfer_v2': {'chemical_inputs': {'component max': 0,
+                                                                   'component min': 0,
+                                                                   'solute max': 1,
+                                                                   'solute min': 1,
+                                                                   'solvent max': 0,
+                                                                   'solvent min': 0,
+                                                                   'total max': 1,
+                                                                   'total min': 1},
+                                               'citation': 'Brown, T. N.; Armitage, J. M.; Sangion, A.; Arnot, J. A.; '
+                                                           'Improved prediction of PFAS partitioning with PPLFERs and '
+                                                           'QSPRs. Environ. Sci.: Process. Impacts, 2024, Accepted.',
+                                               'component_dependencies_list': [],
+                                               'dependency_reads': {'*': (1,),
+                                                                    'A': (0, 1, 2),
+                                                                    'B': (0, 1, 2),
+                                                                    'L': (0, 1, 2),
+                                                                    'S': (0, 1, 2),
+                                                                    'Vf': (0,)},
+                                               'endpoint': 'Log of octanol-air partition coefficient - updated for '
+                                                           'PFAS',
+                                               'ismixture': False,
+                                               'model_class': 'METAQSARModel',
+                                               'model_name': 'logKoa',
+                                               'solute_dependencies_list': [('S', 3),
+                                                                            ('A', 3),
+                                                                            ('B', 3),
+                                                                            ('Vf', 1),
+                                                                            ('L', 3)],
+                                               'solvent_dependencies_list': [],
+                                               'units': 'log L[a]/L[o]',
+                                               'value_names': ('logKoa',),
+                                               'version': 2},
+ 'ifsqsar.models.meta_qsar_logkow_pplfer': {'chemical_inputs': {'component max': 0,
+                                                                'component min': 0,
+                                                                'solute max': 1,
+                                                                'solute min': 1,
+                                                                'solvent max': 0,
+                                                                'solvent min': 0,
+                                                                'total max': 1,
+                                                                'total min': 1},
+                                            'citation': 'Solute descriptors: Brown, T. N.; QSPRs for Predicting '
+                                                        'Equilibrium Partitioning in Solvent-Air Systems from the '
+                                                        'Chemical Structures of Solutes and Solvents. J Solution Chem '
+                                                        '2022, (https://doi.org/10.1007/s10953-022-01162-2). PPLFER '
+                                                        'Equation: Brown T.N., Sangion A., Arnot J.A.; Identifying '
+                                                        'Uncertainty in Physical-Chemical Property Estimation with '
+                                                        'IFSQSAR. J Cheminform, 2024. 16(1): p65 '
+                                                        '(https://doi.org/10.1186/s13321-024-00853-w).',
+                                            'component_dependencies_list': [],
+                                            'dependency_reads': {'*': (1,),
+                                                                 'A': (0, 1, 2),
+                                                                 'B': (0, 1, 2),
+                                                                 'L': (0, 1, 2),
+                                                                 'S': (0, 1, 2),
+                                                                 'V': (0,)},
+                                            'endpoint': 'Log of wet (practical) octanol-water partition coefficient '
+                                                        '(log P)',
+                                            'ismixture': False,
+                                            'model_class': 'METAQSARModel',
+                                            'model_name': 'logKow',
+                                            'solute_dependencies_list': [('S', 2),
+                                                                         ('A', 2),
+                                                                         ('B', 2),
+                                                                         ('V', 1),
+                                                                         ('L', 2)],
+                                            'solvent_dependencies_list': [],
+                                            'units': 'log L[w]/L[wet o]',
+                                            'value_names': ('logKow',),
+                                            'version': 1},
+ 'ifsqsar.models.meta_qsar_logkow_pplfer_v2': {'chemical_inputs': {'component max': 0,
+                                                                   'component min': 0,
+                                                                   'solute max': 1,
+                                                                   'solute min': 1,
+                                                                   'solvent max': 0,
+                                                                   'solvent min': 0,
+                                                                   'total max': 1,
+                                                                   'total min': 1},
+                                               'citation': 'Brown, T. N.; Armitage, J. M.; Sangion, A.; Arnot, J. A.; '
+                                                           'Improved prediction of PFAS partitioning with PPLFERs and '
+                                                           'QSPRs. Environ. Sci.: Process. Impacts, 2024, Accepted.',
+                                               'component_dependencies_list': [],
+                                               'dependency_reads': {'*': (1,),
+                                                                    'A': (0, 1, 2),
+                                                                    'B': (0, 1, 2),
+                                                                    'L': (0, 1, 2),
+                                                                    'S': (0, 1, 2),
+                                                                    'Vf': (0,)},
+                                               'endpoint': 'Log of wet (practical) octanol-water partition coefficient '
+                                                           '(log P) - updated for PFAS',
+                                               'ismixture': False,
+                                               'model_class': 'METAQSARModel',
+                                               'model_name': 'logKow',
+                                               'solute_dependencies_list': [('S', 3),
+                                                                            ('A', 3),
+                                                                            ('B', 3),
+                                                                            ('Vf', 1),
+                                                                            ('L', 3)],
+                                               'solvent_dependencies_list': [],
+                                               'units': 'log L[w]/L[wet o]',
+                                               'value_names': ('logKow',),
+                                               'version': 2},
+ 'ifsqsar.models.meta_qsar_logkowdry_pplfer': {'chemical_inputs': {'component max': 0,
+                                                                   'component min': 0,
+                                                                   'solute max': 1,
+                                                                   'solute min': 1,
+                                                                   'solvent max': 0,
+                                                                   'solvent min': 0,
+                                                                   'total max': 1,
+                                                                   'total min': 1},
+                                               'citation': 'Solute descriptors: Brown, T. N.; QSPRs for Predicting '
+                                                           'Equilibrium Partitioning in Solvent-Air Systems from the '
+                                                           'Chemical Structures of Solutes and Solvents. J Solution '
+                                                           'Chem 2022, 51, 1101 '
+                                                           '(https://doi.org/10.1007/s10953-022-01162-2). PPLFER '
+                                                           'Equation: Brown, T. N., Empirical Regressions between '
+                                                           'System Parameters and Solute Descriptors of Polyparameter '
+                                                           'Linear Free Energy Relationships (PPLFERs) for Predicting '
+                                                           'Solvent-Air Partitioning. Fluid Phase Equilibria 2021, '
+                                                           '113035.',
+                                               'component_dependencies_list': [],
+                                               'dependency_reads': {'*': (1,),
+                                                                    'A': (0, 1, 2),
+                                                                    'B': (0, 1, 2),
+                                                                    'L': (0, 1, 2),
+                                                                    'S': (0, 1, 2),
+                                                                    'V': (0,)},
+                                               'endpoint': 'Log of dry (hypothetical) octanol-water partition '
+                                                           'coefficient (log P)',
+                                               'ismixture': False,
+                                               'model_class': 'METAQSARModel',
+                                               'model_name': 'logKowdry',
+                                               'solute_dependencies_list': [('S', 2),
+                                                                            ('A', 2),
+                                                                            ('B', 2),
+                                                                            ('V', 1),
+                                                                            ('L', 2)],
+                                               'solvent_dependencies_list': [],
+                                               'units': 'log L[w]/L[dry o]',
+                                               'value_names': ('logKowdry',),
+                                               'version': 1},
+ 'ifsqsar.models.meta_qsar_logkowdry_pplfer_v2': {'chemical_inputs': {'component max': 0,
+                                                                      'component min': 0,
+                                                                      'solute max': 1,
+                                                                      'solute min': 1,
+                                                                      'solvent max': 0,
+                                                                      'solvent min': 0,
+                                                                      'total max': 1,
+                                                                      'total min': 1},
+                                                  'citation': 'Brown, T. N.; Armitage, J. M.; Sangion, A.; Arnot, J. '
+                                                              'A.; Improved prediction of PFAS partitioning with '
+                                                              'PPLFERs and QSPRs. Environ. Sci.: Process. Impacts, '
+                                                              '2024, Accepted.',
+                                                  'component_dependencies_list': [],
+                                                  'dependency_reads': {'*': (1,),
+                                                                       'A': (0, 1, 2),
+                                                                       'B': (0, 1, 2),
+                                                                       'L': (0, 1, 2),
+                                                                       'S': (0, 1, 2),
+                                                                       'Vf': (0,)},
+                                                  'endpoint': 'Log of dry (hypothetical) octanol-water partition '
+                                                              'coefficient (log P) - updated for PFAS',
+                                                  'ismixture': False,
+                                                  'model_class': 'METAQSARModel',
+                                                  'model_name': 'logKowdry',
+                                                  'solute_dependencies_list': [('S', 3),
+                                                                               ('A', 3),
+                                                                               ('B', 3),
+                                                                               ('Vf', 1),
+                                                                               ('L', 3)],
+                                                  'solvent_dependencies_list': [],
+                                                  'units': 'log L[w]/L[dry o]',
+                                                  'value_names': ('logKowdry',),
+                                                  'version': 2},
+ 'ifsqsar.models.meta_qsar_logkowod_pplfer': {'chemical_inputs': {'component max': 0,
+                                                                  'component min': 0,
+                                                                  'solute max': 1,
+                                                                  'solute min': 1,
+                                                                  'solvent max': 0,
+                                                                  'solvent min': 0,
+                                                                  'total max': 1,
+                                                                  'total min': 1},
+                                              'citation': 'Solute descriptors: Brown, T. N.; QSPRs for Predicting '
+                                                          'Equilibrium Partitioning in Solvent-Air Systems from the '
+                                                          'Chemical Structures of Solutes and Solvents. J Solution '
+                                                          'Chem 2022, '
+                                                          '(https://doi.org/10.1007/s10953-022-01162-2).PPLFER '
+                                                          'Equation: Brown T.N., Sangion A., Arnot J.A.; Identifying '
+                                                          'Uncertainty in Physical-Chemical Property Estimation with '
+                                                          'IFSQSAR. J Cheminform, 2024. 16(1): p65 '
+                                                          '(https://doi.org/10.1186/s13321-024-00853-w).',
+                                              'component_dependencies_list': [],
+                                              'dependency_reads': {'*': (1,),
+                                                                   'A': (0, 1, 2),
+                                                                   'B': (0, 1, 2),
+                                                                   'L': (0, 1),
+                                                                   'S': (0, 1, 2),
+                                                                   'V': (0,)},
+                                              'endpoint': 'Log of wet octanol - dry octanol partition coefficient, '
+                                                          'used as a conversion factor',
+                                              'ismixture': False,
+                                              'model_class': 'METAQSARModel',
+                                              'model_name': 'logKoo',
+                                              'solute_dependencies_list': [('S', 2),
+                                                                           ('A', 2),
+                                                                           ('B', 2),
+                                                                           ('V', 1),
+                                                                           ('L', 2)],
+                                              'solvent_dependencies_list': [],
+                                              'units': 'log L[dry o]/L[wet o]',
+                                              'value_names': ('logKoo',),
+                                              'version': 1},
+ 'ifsqsar.models.meta_qsar_logkowod_pplfer_v2': {'chemical_inputs': {'component max': 0,
+                                                                     'component min': 0,
+                                                                     'solute max': 1,
+                                                                     'solute min': 1,
+                                                                     'solvent max': 0,
+                                                                     'solvent min': 0,
+                                                                     'total max': 1,
+                                                                     'total min': 1},
+                                                 'citation': 'Brown, T. N.; Armitage, J. M.; Sangion, A.; Arnot, J. '
+                                                             'A.; Improved prediction of PFAS partitioning with '
+                                                             'PPLFERs and QSPRs. Environ. Sci.: Process. Impacts, '
+                                                             '2024, Accepted.',
+                                                 'component_dependencies_list': [],
+                                                 'dependency_reads': {'*': (1,),
+                                                                      'A': (0, 1, 2),
+                                                                      'B': (0, 1, 2),
+                                                                      'L': (0, 1, 2),
+                                                                      'S': (0, 1, 2),
+                                                                      'Vf': (0,)},
+                                                 'endpoint': 'Log of wet octanol - dry octanol partition coefficient, '
+                                                             'used as a conversion factor - updated for PFAS',
+                                                 'ismixture': False,
+                                                 'model_class': 'METAQSARModel',
+                                                 'model_name': 'logKoo',
+                                                 'solute_dependencies_list': [('S', 3),
+                                                                              ('A', 3),
+                                                                              ('B', 3),
+                                                                              ('Vf', 1),
+                                                                              ('L', 3)],
+                                                 'solvent_dependencies_list': [],
+                                                 'units': 'log L[dry o]/L[wet o]',
+                                                 'value_names': ('logKoo',),
+                                                 'version': 2},
+ 'ifsqsar.models.meta_qsar_logksa_pplfer': {'chemical_inputs': {'component max': 0,
+                                                                'component min': 0,
+                                                                'solute max': 1,
+                                                                'solute min': 1,
+                                                                'solvent max': 1,
+                                                                'solvent min': 1,
+                                                                'total max': 2,
+                                                                'total min': 2},
+                                            'citation': 'Brown, T. N.; QSPRs for Predicting Equilibrium Partitioning '
+                                                        'in Solvent-Air Systems from the Chemical Structures of '
+                                                        'Solutes and Solvents. J Solution Chem 2022, 51, 1101 '
+                                                        '(https://doi.org/10.1007/s10953-022-01162-2).',
+                                            'component_dependencies_list': [],
+                                            'dependency_reads': {'*': (0, 1, 2),
+                                                                 'A': (0, 1, 2),
+                                                                 'B': (0, 1, 2),
+                                                                 'E': (0, 1, 2),
+                                                                 'L': (0, 1, 2),
+                                                                 'S': (0, 1, 2),
+                                                                 'V': (0,),
+                                                                 'state': (3,)},
+                                            'endpoint': 'Log of solvent-air partition coefficient - user-defined '
+                                                        'solvent',
+                                            'ismixture': True,
+                                            'model_class': 'METAQSARModel',
+                                            'model_name': 'logKsa',
+                                            'solute_dependencies_list': [('E', 2),
+                                                                         ('S', 2),
+                                                                         ('A', 2),
+                                                                         ('B', 2),
+                                                                         ('V', 1),
+                                                                         ('L', 2)],
+                                            'solvent_dependencies_list': [('E', 2),
+                                                                          ('S', 2),
+                                                                          ('A', 2),
+                                                                          ('B', 2),
+                                                                          ('V', 1),
+                                                                          ('L', 2),
+                                                                          ('s', 1),
+                                                                          ('a', 1),
+                                                                          ('b', 1),
+                                                                          ('v', 1),
+                                                                          ('l', 1),
+                                                                          ('c', 1),
+                                                                          ('state', 1)],
+                                            'units': 'log L[a]/L[s]',
+                                            'value_names': ('logKsa',),
+                                            'version': 1},
+ 'ifsqsar.models.meta_qsar_state': {'chemical_inputs': {'component max': 0,
+                                                        'component min': 0,
+                                                        'solute max': 1,
+                                                        'solute min': 1,
+                                                        'solvent max': 0,
+                                                        'solvent min': 0,
+                                                        'total max': 1,
+                                                        'total min': 1},
+                                    'citation': 'tm and tb from PPLFERs: Brown, T. N.; QSPRs for Predicting '
+                                                'Equilibrium Partitioning in Solvent-Air Systems from the Chemical '
+                                                'Structures of Solutes and Solvents. J Solution Chem 2022, 51, 1101 '
+                                                '(https://doi.org/10.1007/s10953-022-01162-2). tm from QSPR: Brown, T. '
+                                                'N.;  Armitage, J. M.; Arnot, J. A., Application of an Iterative '
+                                                'Fragment Selection (IFS) Method to Estimate Entropies of Fusion and '
+                                                'MeltingPoints of Organic Chemicals. Mol Inform 2019, 38 (8-9), '
+                                                '1800160 (https://doi.org/10.1002/minf.201800160). Decision tree '
+                                                'defined in: Brown T.N., Sangion A., Arnot J.A.; Identifying '
+                                                'Uncertainty in Physical-Chemical Property Estimation with IFSQSAR. J '
+                                                'Cheminform, 2024. 16(1): p65 '
+                                                '(https://doi.org/10.1186/s13321-024-00853-w).',
+                                    'component_dependencies_list': [],
+                                    'dependency_reads': {'*': (1,),
+                                                         'A': (0,),
+                                                         'B': (0,),
+                                                         'E': (0,),
+                                                         'L': (0,),
+                                                         'S': (0,),
+                                                         'V': (0,),
+                                                         'tbpplfer': (0, 2),
+                                                         'tmconsensus': (0, 2)},
+                                    'endpoint': 'Chemical state at room temperature (25degC)',
+                                    'ismixture': False,
+                                    'model_class': 'METAQSARModel',
+                                    'model_name': 'state',
+                                    'solute_dependencies_list': [('E', 2),
+                                                                 ('S', 2),
+                                                                 ('A', 2),
+                                                                 ('B', 2),
+                                                                 ('V', 1),
+                                                                 ('L', 2),
+                                                                 ('tmconsensus', 1),
+                                                                 ('tbpplfer', 1)],
+                                    'solvent_dependencies_list': [],
+                                    'units': '',
+                                    'value_names': ('state',),
+                                    'version': 1},
+ 'ifsqsar.models.meta_qsar_tb_pplfer': {'chemical_inputs': {'component max': 0,
+                                                            'component min': 0,
+                                                            'solute max': 1,
+                                                            'solute min': 1,
+                                                            'solvent max': 0,
+                                                            'solvent min': 0,
+                                                            'total max': 1,
+                                                            'total min': 1},
+                                        'citation': 'Brown, T. N.; QSPRs for Predicting Equilibrium Partitioning in '
+                                                    'Solvent-Air Systems from the Chemical Structures of Solutes and '
+                                                    'Solvents. J Solution Chem 2022, 51, 1101 '
+                                                    '(https://doi.org/10.1007/s10953-022-01162-2).',
+                                        'component_dependencies_list': [],
+                                        'dependency_reads': {'*': (1,),
+                                                             'A': (0, 1),
+                                                             'B': (0, 1),
+                                                             'E': (0, 1),
+                                                             'L': (0, 1),
+                                                             'S': (0, 1),
+                                                             'V': (0,)},
+                                        'endpoint': 'Boiling point - predicted by PPLFER',
+                                        'ismixture': False,
+                                        'model_class': 'METAQSARModel',
+                                        'model_name': 'tbpplfer',
+                                        'solute_dependencies_list': [('E', 2),
+                                                                     ('S', 2),
+                                                                     ('A', 2),
+                                                                     ('B', 2),
+                                                                     ('V', 1),
+                                                                     ('L', 2)],
+                                        'solvent_dependencies_list': [],
+                                        'units': 'K',
+                                        'value_names': ('tbpplfer',),
+                                        'version': 1},
+ 'ifsqsar.models.meta_qsar_tm_consensus': {'chemical_inputs': {'component max': 0,
+                                                               'component min': 0,
+                                                               'solute max': 1,
+                                                               'solute min': 1,
+                                                               'solvent max': 0,
+                                                               'solvent min': 0,
+                                                               'total max': 1,
+                                                               'total min': 1},
+                                           'citation': 'tm from PPLFER: Brown, T. N.; QSPRs for Predicting Equilibrium '
+                                                       'Partitioning in Solvent-Air Systems from the Chemical '
+                                                       'Structures of Solutes and Solvents. J Solution Chem 2022, 51, '
+                                                       '1101 (https://doi.org/10.1007/s10953-022-01162-2). tm from '
+                                                       'QSPR: Brown, T. N.;  Armitage, J. M.; Arnot, J. A., '
+                                                       'Application of an Iterative Fragment Selection (IFS) Method to '
+                                                       'Estimate Entropies of Fusion and Melting Points of Organic '
+                                                       'Chemicals. Mol Inform 2019, 38 (8-9), 1800160 '
+                                                       '(https://doi.org/10.1002/minf.201800160).',
+                                           'component_dependencies_list': [],
+                                           'dependency_reads': {'*': (1,), 'tm': (0, 1, 2), 'tmpplfer': (0, 1, 2)},
+                                           'endpoint': 'Melting point - mean of QSPR and PPLFER predictions',
+                                           'ismixture': False,
+                                           'model_class': 'METAQSARModel',
+                                           'model_name': 'tmconsensus',
+                                           'solute_dependencies_list': ['tm', 'tmpplfer'],
+                                           'solvent_dependencies_list': [],
+                                           'units': 'K',
+                                           'value_names': ('tmconsensus',),
+                                           'version': 1},
+ 'ifsqsar.models.meta_qsar_tm_pplfer': {'chemical_inputs': {'component max': 0,
+                                                            'component min': 0,
+                                                            'solute max': 1,
+                                                            'solute min': 1,
+                                                            'solvent max': 0,
+                                                            'solvent min': 0,
+                                                            'total max': 1,
+                                                            'total min': 1},
+                                        'citation': 'Brown, T. N.; QSPRs for Predicting Equilibrium Partitioning in '
+                                                    'Solvent-Air Systems from the Chemical Structures of Solutes and '
+                                                    'Solvents. J Solution Chem 2022, 51, 1101 '
+                                                    '(https://doi.org/10.1007/s10953-022-01162-2).',
+                                        'component_dependencies_list': [],
+                                        'dependency_reads': {'*': (1,),
+                                                             'A': (0, 1),
+                                                             'B': (0, 1),
+                                                             'E': (0, 1),
+                                                             'L': (0, 1),
+                                                             'S': (0, 1),
+                                                             'V': (0,)},
+                                        'endpoint': 'Melting point - predicted by PPLFER',
+                                        'ismixture': False,
+                                        'model_class': 'METAQSARModel',
+                                        'model_name': 'tmpplfer',
+                                        'solute_dependencies_list': [('E', 2),
+                                                                     ('S', 2),
+                                                                     ('A', 2),
+                                                                     ('B', 2),
+                                                                     ('V', 1),
+                                                                     ('L', 2)],
+                                        'solvent_dependencies_list': [],
+                                        'units': 'K',
+                                        'value_names': ('tmpplfer',),
+                                        'version': 1},
+ 'ifsqsar.models.other_qsar_MV_liq_corr': {'chemical_inputs': {'component max': 0,
+                                                               'component min': 0,
+                                                               'solute max': 1,
+                                                               'solute min': 1,
+                                                               'solvent max': 0,
+                                                               'solvent min': 0,
+                                                               'total max': 1,
+                                                               'total min': 1},
+                                           'citation': 'Kotomin, A. A.; Kozlov, A. S., Calculation of densities of '
+                                                       'organic compounds from contributions of molecular fragments. '
+                                                       'Russ J Appl Chem 2006, 79 (6), 957-966.',
+                                           'endpoint': 'Molar volume - fraction of model for internal use',
+                                           'ismixture': False,
+                                           'model_class': 'QSARModel',
+                                           'model_name': 'MVliqcorr',
+                                           'model_type': 'MLRA',
+                                           'units': 'unitless',
+                                           'value_names': ('MVliqcorr',),
+                                           'version': 1},
+ 'ifsqsar.models.other_qsar_MV_liquid_V': {'chemical_inputs': {'component max': 0,
+                                                               'component min': 0,
+                                                               'solute max': 1,
+                                                               'solute min': 1,
+                                                               'solvent max': 0,
+                                                               'solvent min': 0,
+                                                               'total max': 1,
+                                                               'total min': 1},
+                                           'citation': 'Brown T.N., Sangion A., Arnot J.A.; Identifying Uncertainty in '
+                                                       'Physical-Chemical Property Estimation with IFSQSAR. J '
+                                                       'Cheminform, 2024. 16(1): p65 '
+                                                       '(https://doi.org/10.1186/s13321-024-00853-w).',
+                                           'endpoint': 'Molar volume of liquid',
+                                           'ismixture': False,
+                                           'model_class': 'QSARModel',
+                                           'model_name': 'MVliquid',
+                                           'model_type': 'MLR',
+                                           'units': 'cm^3/mol',
+                                           'value_names': ('MVliquid',),
+                                           'version': 2},
+ 'ifsqsar.models.other_qsar_MV_mlr': {'chemical_inputs': {'component max': 0,
+                                                          'component min': 0,
+                                                          'solute max': 1,
+                                                          'solute min': 1,
+                                                          'solvent max': 0,
+                                                          'solvent min': 0,
+                                                          'total max': 1,
+                                                          'total min': 1},
+                                      'citation': 'Kotomin, A. A.; Kozlov, A. S., Calculation of densities of organic '
+                                                  'compounds from contributions of molecular fragments. Russ J Appl '
+                                                  'Chem 2006, 79 (6), 957-966.',
+                                      'endpoint': 'Molar volume - fraction of model for internal use',
+                                      'ismixture': False,
+                                      'model_class': 'QSARModel',
+                                      'model_name': 'MVmlr',
+                                      'model_type': 'MLR',
+                                      'units': 'cm^3/mol',
+                                      'value_names': ('MVmlr',),
+                                      'version': 1},
+ 'ifsqsar.models.other_qsar_MV_mlrRings': {'chemical_inputs': {'component max': 0,
+                                                               'component min': 0,
+                                                               'solute max': 1,
+                                                               'solute min': 1,
+                                                               'solvent max': 0,
+                                                               'solvent min': 0,
+                                                               'total max': 1,
+                                                               'total min': 1},
+                                           'citation': 'Kotomin, A. A.; Kozlov, A. S., Calculation of densities of '
+                                                       'organic compounds from contributions of molecular fragments. '
+                                                       'Russ J Appl Chem 2006, 79 (6), 957-966.',
+                                           'endpoint': 'Molar volume - fraction of model for internal use',
+                                           'ismixture': False,
+                                           'model_class': 'QSARModel',
+                                           'model_name': 'MVmlrRings',
+                                           'model_type': 'MLR',
+                                           'units': 'cm^3/mol',
+                                           'value_names': ('MVmlrRings',),
+                                           'version': 1},
+ 'ifsqsar.models.other_qsar_MV_mlrx': {'chemical_inputs': {'component max': 0,
+                                                           'component min': 0,
+                                                           'solute max': 1,
+                                                           'solute min': 1,
+                                                           'solvent max': 0,
+                                                           'solvent min': 0,
+                                                           'total max': 1,
+                                                           'total min': 1},
+                                       'citation': 'Kotomin, A. A.; Kozlov, A. S., Calculation of densities of organic '
+                                                   'compounds from contributions of molecular fragments. Russ J Appl '
+                                                   'Chem 2006, 79 (6), 957-966.',
+                                       'endpoint': 'Molar volume - fraction of model for internal use',
+                                       'ismixture': False,
+                                       'model_class': 'QSARModel',
+                                       'model_name': 'MVmlrx',
+                                       'model_type': 'MLRX',
+                                       'units': 'cm^3/mol',
+                                       'value_names': ('MVmlrx',),
+                                       'version': 1},
+ 'ifsqsar.models.other_qsar_MW': {'chemical_inputs': {'component max': 0,
+                                                      'component min': 0,
+                                                      'solute max': 1,
+                                                      'solute min': 1,
+                                                      'solvent max': 0,
+                                                      'solvent min': 0,
+                                                      'total max': 1,
+                                                      'total min': 1},
+                                  'citation': 'MW',
+                                  'endpoint': 'Molecular weight',
+                                  'ismixture': False,
+                                  'model_class': 'QSARModel',
+                                  'model_name': 'MW',
+                                  'model_type': 'MLR',
+                                  'units': 'g/mol',
+                                  'value_names': ('MW',),
+                                  'version': 1},
+ 'ifsqsar.models.other_qsar_V': {'chemical_inputs': {'component max': 0,
+                                                     'component min': 0,
+                                                     'solute max': 1,
+                                                     'solute min': 1,
+                                                     'solvent max': 0,
+                                                     'solvent min': 0,
+                                                     'total max': 1,
+                                                     'total min': 1},
+                                 'citation': 'Mcgowan, J. C., The Estimation of Solubility Parameters and Related '
+                                             'Properties of Liquids. J Chem Tech Biot A 1984, 34 (1), 38-42.',
+                                 'endpoint': 'Abraham PPLFER solute descriptor V - McGowan Volume',
+                                 'ismixture': False,
+                                 'model_class': 'QSARModel',
+                                 'model_name': 'V',
+                                 'model_type': 'MLR',
+                                 'units': '0.01 cm^3/mol',
+                                 'value_names': ('V',),
+                                 'version': 1},
+ 'ifsqsar.models.other_qsar_Vf': {'chemical_inputs': {'component max': 0,
+                                                      'component min': 0,
+                                                      'solute max': 1,
+                                                      'solute min': 1,
+                                                      'solvent max': 0,
+                                                      'solvent min': 0,
+                                                      'total max': 1,
+                                                      'total min': 1},
+                                  'citation': 'Mcgowan, J. C., The Estimation of Solubility Parameters and Related '
+                                              'Properties of Liquids. J Chem Tech Biot A 1984, 34 (1), 38-42. '
+                                              'Adjustment for F: Goss K-U, Bronner G, Harner T, Hertel M, Schmidt TC, '
+                                              'The Partition Behavior of Fluorotelomer Alcohols and Olefins. Environ '
+                                              'Sci Technol 40 (11):3572-3577.',
+                                  'endpoint': 'Abraham PPLFER solute descriptor V - McGowan Volume - adjusted by Goss '
+                                              'et al.',
+                                  'ismixture': False,
+                                  'model_class': 'QSARModel',
+                                  'model_name': 'Vf',
+                                  'model_type': 'MLR',
+                                  'units': '0.01 cm^3/mol',
+                                  'value_names': ('Vf',),
+                                  'version': 1},
+ 'ifsqsar.models.other_qsar_biowin3_usm_mlra': {'chemical_inputs': {'component max': 0,
+                                                                    'component min': 0,
+                                                                    'solute max': 1,
+                                                                    'solute min': 1,
+                                                                    'solvent max': 0,
+                                                                    'solvent min': 0,
+                                                                    'total max': 1,
+                                                                    'total min': 1},
+                                                'citation': 'Boethling, R. S.;  Howard, P. H.;  Meylan, W.;  Stiteler, '
+                                                            'W.;  Beauman, J.; Tirado, N., Group contribution method '
+                                                            'for predicting probability and rate of aerobic '
+                                                            'biodegradation. Environ Sci Technol 1994, 28 (3), 459-65.',
+                                                'endpoint': 'BIOWIN 3 - fraction of model for internal use',
+                                                'ismixture': False,
+                                                'model_class': 'QSARModel',
+                                                'model_name': 'biowin3usmmlra',
+                                                'model_type': 'MLRA',
+                                                'units': 'rank',
+                                                'value_names': ('biowin3usmmlra',),
+                                                'version': 1},
+ 'ifsqsar.models.other_qsar_biowin3_usm_mlrx': {'chemical_inputs': {'component max': 0,
+                                                                    'component min': 0,
+                                                                    'solute max': 1,
+                                                                    'solute min': 1,
+                                                                    'solvent max': 0,
+                                                                    'solvent min': 0,
+                                                                    'total max': 1,
+                                                                    'total min': 1},
+                                                'citation': 'Boethling, R. S.;  Howard, P. H.;  Meylan, W.;  Stiteler, '
+                                                            'W.;  Beauman, J.; Tirado, N., Group contribution method '
+                                                            'for predicting probability and rate of aerobic '
+                                                            'biodegradation. Environ Sci Technol 1994, 28 (3), 459-65.',
+                                                'endpoint': 'BIOWIN 3 - fraction of model for internal use',
+                                                'ismixture': False,
+                                                'model_class': 'QSARModel',
+                                                'model_name': 'biowin3usmmlrx',
+                                                'model_type': 'MLRX',
+                                                'units': 'rank',
+                                                'value_names': ('biowin3usmmlrx',),
+                                                'version': 1},
+ 'ifsqsar.models.other_qsar_biowin4_psm_mlra': {'chemical_inputs': {'component max': 0,
+                                                                    'component min': 0,
+                                                                    'solute max': 1,
+                                                                    'solute min': 1,
+                                                                    'solvent max': 0,
+                                                                    'solvent min': 0,
+                                                                    'total max': 1,
+                                                                    'total min': 1},
+                                                'citation': 'Boethling, R. S.;  Howard, P. H.;  Meylan, W.;  Stiteler, '
+                                                            'W.;  Beauman, J.; Tirado, N., Group contribution method '
+                                                            'for predicting probability and rate of aerobic '
+                                                            'biodegradation. Environ Sci Technol 1994, 28 (3), 459-65.',
+                                                'endpoint': 'BIOWIN 4 - fraction of model for internal use',
+                                                'ismixture': False,
+                                                'model_class': 'QSARModel',
+                                                'model_name': 'biowin4psmmlra',
+                                                'model_type': 'MLRA',
+                                                'units': 'rank',
+                                                'value_names': ('biowin4psmmlra',),
+                                                'version': 1},
+ 'ifsqsar.models.other_qsar_biowin4_psm_mlrx': {'chemical_inputs': {'component max': 0,
+                                                                    'component min': 0,
+                                                                    'solute max': 1,
+                                                                    'solute min': 1,
+                                                                    'solvent max': 0,
+                                                                    'solvent min': 0,
+                                                                    'total max': 1,
+                                                                    'total min': 1},
+                                                'citation': 'Boethling, R. S.;  Howard, P. H.;  Meylan, W.;  Stiteler, '
+                                                            'W.;  Beauman, J.; Tirado, N., Group contribution method '
+                                                            'for predicting probability and rate of aerobic '
+                                                            'biodegradation. Environ Sci Technol 1994, 28 (3), 459-65.',
+                                                'endpoint': 'BIOWIN 4 - fraction of model for internal use',
+                                                'ismixture': False,
+                                                'model_class': 'QSARModel',
+                                                'model_name': 'biowin4psmmlrx',
+                                                'model_type': 'MLRX',
+                                                'units': 'rank',
+                                                'value_names': ('biowin4psmmlrx',),
+                                                'version': 1}}
@@ -15,12 +15,12 @@ chemical_inputs = {'solute min': 1, 'solute max': 1,
 solute_dependencies_list = [('MVsolid', 1), ('MVliqcorr', 1)]
 solvent_dependencies_list = []
 component_dependencies_list = []
-propagated_domain_notes = ''
+dependency_reads = {'*': (1,), 'MVsolid': (0,), 'MVliqcorr': (0,)}
 smiles_flag = 'neutrals'
 
 stored = {'O': (round(18.01528, round_digits), 'E', np.nan, 'experimental value used', 'well known value', units, endpoint)}
 
-def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf):
+def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf, propagated_domain_notes=''):
     # Apply solid -> liquid correction defined in Kotomin and Kozolov 2006
     MV = solutedependencies[0]['MVsolid'][0] * solutedependencies[0]['MVliqcorr'][0]
 
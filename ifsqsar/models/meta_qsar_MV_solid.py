@@ -15,12 +15,12 @@ chemical_inputs = {'solute min': 1, 'solute max': 1,
 solute_dependencies_list = ['MVmlrx', 'MVmlr', 'MVmlrRings', 'MW']
 solvent_dependencies_list = []
 component_dependencies_list = []
-propagated_domain_notes = ''
+dependency_reads = {'*': (1,), 'MVmlrx': (0,), 'MVmlr': (0,), 'MVmlrRings': (0,), 'MW': (0,)}
 smiles_flag = 'neutrals'
 
 stored = {}
 
-def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf):
+def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf, propagated_domain_notes=''):
     # Sum the different fragment types defined in Kotomin and Kozolov 2006
     MV = solutedependencies[0]['MVmlrx'][0] + solutedependencies[0]['MVmlr'][0] + solutedependencies[0]['MVmlrRings'][0]
     # if there are no fragments output MV corrected to get liquid density of methane
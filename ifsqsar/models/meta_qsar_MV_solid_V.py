@@ -15,12 +15,12 @@ chemical_inputs = {'solute min': 1, 'solute max': 1,
 solute_dependencies_list = [('MVliquid', 2)]
 solvent_dependencies_list = []
 component_dependencies_list = []
-propagated_domain_notes = ''
+dependency_reads = {'*': (1,), 'MVliquid': (0,)}
 smiles_flag = 'neutrals'
 
 stored = {}
 
-def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf):
+def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf, propagated_domain_notes=''):
     # Apply solid -> liquid correction defined in Kotomin and Kozolov 2006
     MV = solutedependencies[0]['MVliquid'][0] * 0.962
 
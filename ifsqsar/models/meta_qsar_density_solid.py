@@ -15,12 +15,12 @@ chemical_inputs = {'solute min': 1, 'solute max': 1,
 solute_dependencies_list = ['MVsolid', 'MW']
 solvent_dependencies_list = []
 component_dependencies_list = []
-propagated_domain_notes = ''
+dependency_reads = {'*': (1,), 'MVsolid': (0,), 'MW': (0,)}
 smiles_flag = 'neutrals'
 
 stored = {}
 
-def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf):
+def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf, propagated_domain_notes=''):
     density = solutedependencies[0]['MW'][0] / solutedependencies[0]['MVsolid'][0]
 
     return round(density, round_digits), np.nan, round(0, round_digits), propagated_domain_notes, citation, units, endpoint
@@ -20,12 +20,12 @@ chemical_inputs = {'solute min': 1, 'solute max': 1,
 solute_dependencies_list = ['biowin3usmmlrx', 'biowin3usmmlra', 'biowin4psmmlrx', 'biowin4psmmlra']
 solvent_dependencies_list = []
 component_dependencies_list = []
-propagated_domain_notes = ''
+dependency_reads = {'biowin3usmmlrx': (0,), 'biowin3usmmlra': (0,), 'biowin4psmmlrx': (0,), 'biowin4psmmlra': (0,)}
 smiles_flag = 'neutrals'
 
 stored = {}
 
-def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf):
+def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf, propagated_domain_notes=''):
     domainnotes = 'generic error estimated from uncertainties of model fits'
     # estimate HLbiodeg from both biowin survey models and take the average
     biowin3 = solutedependencies[0]['biowin3usmmlrx'][0] + solutedependencies[0]['biowin3usmmlra'][0]
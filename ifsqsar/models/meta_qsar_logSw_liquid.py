@@ -1,5 +1,6 @@
 """Meta QSAR for logSwliquid"""
 import numpy as np
+from ifsqsar.models import empirical_leverage
 value_names = ('logSwliquid',)
 version = 1
 endpoint = 'Log of solubility in water for liquid solute'
@@ -22,7 +23,9 @@ chemical_inputs = {'solute min': 1, 'solute max': 1,
 solute_dependencies_list = [('E', 2), ('S', 2), ('A', 2), ('B', 2), ('V', 1), ('L', 2), ('s', 1), ('a', 1), ('b', 1), ('v', 1), ('l', 1), ('c', 1), ('state', 1), ('MVliquid', 2), ('logKaw', 1)]
 solvent_dependencies_list = []
 component_dependencies_list = []
-propagated_domain_notes = ''
+dependency_reads = {'*': (1,), 'E': (0, 1, 2), 'S': (0, 1, 2), 'A': (0, 1, 2), 'B': (0, 1, 2), 'V': (0,),
+                    'L': (0, 1, 2), 's': (0, 2), 'a': (0, 2), 'b': (0, 2), 'v': (0, 2), 'l': (0, 2), 'c': (0, 2),
+                    'state': (3,), 'MVliquid': (0, 2), 'logKaw': (0, 1, 2)}
 smiles_flag = 'neutrals'
 
 emptrainset = np.array([[0, 0, 0, 0, 2.363, 7.714],
@@ -92,7 +95,6 @@ emptrainset = np.array([[0, 0, 0, 0, 2.363, 7.714],
                         [0.47, 1.31, 0.64, 0.57, 0.365, 2.447],
                         [0.4, 0.9, 0.58, 0.78, 0.5078, 2.661]
                         ], dtype=float)
-xtxi = np.linalg.inv(np.matmul(emptrainset.T, emptrainset))
 
 stored = {}
 
@@ -154,7 +156,7 @@ def aggregateUL(ULlist, roundup=False):
     return ULtot
 
 
-def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf):
+def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf, propagated_domain_notes=''):
     # determine if the solvent is a liquid
     domainnotes = [propagated_domain_notes]
     # calculate leverage of the solvent vs. the empirical correlations training dataset
@@ -164,7 +166,7 @@ def calculate(solutedependencies, solventdependencies, componentdependencies, so
                   solutedependencies[0]['B'][0],
                   solutedependencies[0]['V'][0],
                   solutedependencies[0]['L'][0]])
-    leverage = np.matmul(np.matmul(x, xtxi), x.T)
+    leverage = empirical_leverage(x, emptrainset)
     if leverage < 1.5 * 6 / 66:
         ULemptra = 0
     elif leverage < 3 * 6 / 66:
@@ -15,12 +15,13 @@ chemical_inputs = {'solute min': 1, 'solute max': 1,
 solute_dependencies_list = [('S', 3), ('A', 3), ('B', 3), ('Vf', 1), ('L', 3), ('state', 1), ('MVliquid', 2)]
 solvent_dependencies_list = []
 component_dependencies_list = []
-propagated_domain_notes = ''
+dependency_reads = {'*': (1,), 'S': (0, 1, 2), 'A': (0, 1, 2), 'B': (0, 1, 2), 'Vf': (0,), 'L': (0, 1, 2),
+                    'state': (3,), 'MVliquid': (0,)}
 smiles_flag = 'neutrals'
 
 stored = {}
 
-def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf):
+def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf, propagated_domain_notes=''):
     domainnotes = [propagated_domain_notes]
     # calculate AB and ABerr
     AB = (solutedependencies[0]['A'][0] * solutedependencies[0]['B'][0])**0.5
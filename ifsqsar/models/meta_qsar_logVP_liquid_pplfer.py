@@ -21,12 +21,12 @@ chemical_inputs = {'solute min': 1, 'solute max': 1,
 solute_dependencies_list = [('S', 2), ('A', 2), ('B', 2), ('V', 1), ('L', 2), ('state', 1), ('MVliquid', 2)]
 solvent_dependencies_list = []
 component_dependencies_list = []
-propagated_domain_notes = ''
+dependency_reads = {'*': (1,), 'S': (0, 1, 2), 'A': (0, 1, 2), 'B': (0, 1, 2), 'V': (0,), 'L': (0, 1, 2), 'state': (3,)}
 smiles_flag = 'neutrals'
 
 stored = {'O': (round(np.log10(3169.0), round_digits), 0, np.nan, 'experimental value used', 'well known value', units, endpoint)}
 
-def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf):
+def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf, propagated_domain_notes=''):
     domainnotes = [propagated_domain_notes]
     # calculate AB and ABerr
     AB = (solutedependencies[0]['A'][0] * solutedependencies[0]['B'][0])**0.5
@@ -15,12 +15,12 @@ chemical_inputs = {'solute min': 1, 'solute max': 1,
 solute_dependencies_list = [('S', 3), ('A', 3), ('B', 3), ('Vf', 1), ('L', 3)]
 solvent_dependencies_list = []
 component_dependencies_list = []
-propagated_domain_notes = ''
+dependency_reads = {'*': (1,), 'S': (0, 1, 2), 'A': (0, 1, 2), 'B': (0, 1, 2), 'Vf': (0,), 'L': (0, 1, 2)}
 smiles_flag = 'neutrals'
 
 stored = {}
 
-def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf):
+def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf, propagated_domain_notes=''):
     logKaw = -2.127 * solutedependencies[0]['S'][0] \
              -3.690 * solutedependencies[0]['A'][0] \
              -4.783 * solutedependencies[0]['B'][0] \
@@ -96,3 +96,75 @@ def calculate(solutedependencies, solventdependencies, componentdependencies, so
 
     return round(logKaw, round_digits), logKawUL, round(logKawerr, round_digits), '; '.join(domainnotes), citation, units, endpoint
 
+
+def calculate_batch(values, uls, errors, propagated_notes):
+    """Vectorized form of calculate, takes dicts of numpy arrays of the solute dependency values, UL codes and errors
+    and an array of propagated domain notes, returns arrays of predictions, ULs, errors and domain notes.
+    UL codes are the integer ULs 0-6, 7 for E, 8 for U and 9 for no UL"""
+    logKaw = -2.127 * values['S'] \
+             -3.690 * values['A'] \
+             -4.783 * values['B'] \
+             +2.505 * values['Vf'] \
+             -0.445 * values['L'] \
+             +0.504
+    # count experimental and user values and aggregate the numeric ULs of the solute descriptors
+    ecount = np.zeros(logKaw.shape, dtype=int)
+    ucount = np.zeros(logKaw.shape, dtype=int)
+    logKawUL = np.zeros(logKaw.shape)
+    ulfive = np.zeros(logKaw.shape, dtype=bool)
+    for sltdes in ['S', 'A', 'B', 'L']:
+        ule = uls[sltdes] == 7
+        ulu = uls[sltdes] == 8
+        ulnum = np.where(uls[sltdes] <= 6, uls[sltdes], np.nan)
+        ecount += ule
+        ucount += ulu
+        logKawUL += np.where(ulnum < 4, ulnum**2, 0)
+        if sltdes != 'L':
+            logKawUL += np.where(ulnum == 4, 1**2, 0)
+        else:
+            logKawUL += np.where(ulnum == 4, 2**2, 0)
+        logKawUL += np.where(ulnum == 6, 3**2, 0)
+        ulfive |= ulnum == 5
+    predicted = ecount+ucount < 4
+    with np.errstate(divide='ignore', invalid='ignore'):
+        logKawUL = np.where(predicted, np.ceil((logKawUL/(4-ecount-ucount))**0.5), 0)
+        logKawUL = np.where(ulfive, 5, logKawUL).astype(int)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        logKawerr = (values['Vf'] * 0.047)**2 + \
+                    (values['L'] * -0.445)**2 * ((errors['L'] / values['L'])**2 + (0.013 / -0.445)**2) + \
+                    0.027**2
+        logKawerr += np.where(values['S'] != 0, (values['S'] * -2.127)**2 * ((errors['S'] / values['S'])**2 + (0.038 / -2.127)**2), 0)
+        logKawerr += np.where(values['A'] != 0, (values['A'] * -3.690)**2 * ((errors['A'] / values['A'])**2 + (0.038 / -3.690)**2), 0)
+        logKawerr += np.where(values['B'] != 0, (values['B'] * -4.783)**2 * ((errors['B'] / values['B'])**2 + (0.037 / -4.783)**2), 0)
+        logKawerr = logKawerr ** 0.5
+    # build the UL and domain note, with its separator, for each aggregate UL with and without
+    # experimental and user values, then look them up for each chemical
+    ultable = []
+    notetable = []
+    for allflagged in (False, True):
+        for ulint in range(7):
+            for eflag in (False, True):
+                for uflag in (False, True):
+                    ulconcat = ''.join([['', 'E'][eflag], ['', 'U'][uflag]])
+                    if allflagged:
+                        ultable.append(ulconcat)
+                        notetable.append('; experimental or user values, aggregate solute descriptor UL is in the AD')
+                        continue
+                    if ulint <= 1:
+                        adnote = 'aggregate solute descriptor UL is in the AD'
+                    else:
+                        adnote = 'aggregate solute descriptor UL is out of the AD'
+                    if eflag or uflag:
+                        ultable.append(''.join([ulconcat, str(ulint)]))
+                        noteconcat = ['experimental'] * eflag + ['user'] * uflag + ['predicted values', adnote]
+                        notetable.append(''.join(['; ', ', '.join(noteconcat)]))
+                    else:
+                        ultable.append(ulint)
+                        notetable.append(''.join(['; ', adnote]))
+    category = ~predicted * 28 + logKawUL * 4 + (ecount > 0) * 2 + (ucount > 0)
+    logKawUL = np.array(ultable, dtype=object)[category]
+    domainnotes = np.asarray(propagated_notes, dtype=object) + np.array(notetable, dtype=object)[category]
+    errorscale = np.where(~predicted & (ecount > 0) & (ucount == 0), 1, 1.25)
+    logKawerr *= errorscale
+
+    return np.round(logKaw, round_digits), logKawUL, np.round(logKawerr, round_digits), domainnotes, citation, units, endpoint
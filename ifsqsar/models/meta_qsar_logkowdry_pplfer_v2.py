@@ -15,12 +15,12 @@ chemical_inputs = {'solute min': 1, 'solute max': 1,
 solute_dependencies_list = [('S', 3), ('A', 3), ('B', 3), ('Vf', 1), ('L', 3)]
 solvent_dependencies_list = []
 component_dependencies_list = []
-propagated_domain_notes = ''
+dependency_reads = {'*': (1,), 'S': (0, 1, 2), 'A': (0, 1, 2), 'B': (0, 1, 2), 'Vf': (0,), 'L': (0, 1, 2)}
 smiles_flag = 'neutrals'
 
 stored = {}
 
-def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf):
+def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf, propagated_domain_notes=''):
     # calculate log Kow with pplfer equation from Brown 2021
     logKow = -1.652 * solutedependencies[0]['S'][0] \
              -0.124 * solutedependencies[0]['A'][0] \
@@ -97,3 +97,75 @@ def calculate(solutedependencies, solventdependencies, componentdependencies, so
 
     return round(logKow, round_digits), logKowUL, round(logKowerr, round_digits), ', '.join(domainnotes), citation, units, endpoint
 
+
+def calculate_batch(values, uls, errors, propagated_notes):
+    """Vectorized form of calculate, takes dicts of numpy arrays of the solute dependency values, UL codes and errors
+    and an array of propagated domain notes, returns arrays of predictions, ULs, errors and domain notes.
+    UL codes are the integer ULs 0-6, 7 for E, 8 for U and 9 for no UL"""
+    logKow = -1.652 * values['S'] \
+             -0.124 * values['A'] \
+             -3.898 * values['B'] \
+             +2.614 * values['Vf'] \
+             +0.447 * values['L'] \
+             +0.339
+    # count experimental and user values and aggregate the numeric ULs of the solute descriptors
+    ecount = np.zeros(logKow.shape, dtype=int)
+    ucount = np.zeros(logKow.shape, dtype=int)
+    logKowUL = np.zeros(logKow.shape)
+    ulfive = np.zeros(logKow.shape, dtype=bool)
+    for sltdes in ['S', 'A', 'B', 'L']:
+        ule = uls[sltdes] == 7
+        ulu = uls[sltdes] == 8
+        ulnum = np.where(uls[sltdes] <= 6, uls[sltdes], np.nan)
+        ecount += ule
+        ucount += ulu
+        logKowUL += np.where(ulnum < 4, ulnum**2, 0)
+        if sltdes != 'L':
+            logKowUL += np.where(ulnum == 4, 1**2, 0)
+        else:
+            logKowUL += np.where(ulnum == 4, 2**2, 0)
+        logKowUL += np.where(ulnum == 6, 3**2, 0)
+        ulfive |= ulnum == 5
+    predicted = ecount+ucount < 4
+    with np.errstate(divide='ignore', invalid='ignore'):
+        logKowUL = np.where(predicted, np.ceil((logKowUL/(4-ecount-ucount))**0.5), 0)
+        logKowUL = np.where(ulfive, 5, logKowUL).astype(int)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        logKowerr = values['Vf']**2 * (0.076**2) + \
+                    (values['L'] * 0.447)**2 * ((errors['L'] / values['L'])**2 + (0.021**2) / 0.447**2) + \
+                    (0.039**2)
+        logKowerr += np.where(values['S'] != 0, (values['S'] * -1.652)**2 * ((errors['S'] / values['S'])**2 + (0.063**2) / (-1.652)**2), 0)
+        logKowerr += np.where(values['A'] != 0, (values['A'] * -0.124)**2 * ((errors['A'] / values['A'])**2 + (0.064**2) / (-0.124)**2), 0)
+        logKowerr += np.where(values['B'] != 0, (values['B'] * -3.898)**2 * ((errors['B'] / values['B'])**2 + (0.062**2) / (-3.898)**2), 0)
+        logKowerr = logKowerr ** 0.5
+    # build the UL and domain note, with its separator, for each aggregate UL with and without
+    # experimental and user values, then look them up for each chemical
+    ultable = []
+    notetable = []
+    for allflagged in (False, True):
+        for ulint in range(7):
+            for eflag in (False, True):
+                for uflag in (False, True):
+                    ulconcat = ''.join([['', 'E'][eflag], ['', 'U'][uflag]])
+                    if allflagged:
+                        ultable.append(ulconcat)
+                        notetable.append(', experimental or user values, aggregate solute descriptor UL is in the AD')
+                        continue
+                    if ulint <= 1:
+                        adnote = 'aggregate solute descriptor UL is in the AD'
+                    else:
+                        adnote = 'aggregate solute descriptor UL is out of the AD'
+                    if eflag or uflag:
+                        ultable.append(''.join([ulconcat, str(ulint)]))
+                        noteconcat = ['experimental'] * eflag + ['user'] * uflag + ['predicted values', adnote]
+                        notetable.append(''.join([', ', ', '.join(noteconcat)]))
+                    else:
+                        ultable.append(ulint)
+                        notetable.append(''.join([', ', adnote]))
+    category = ~predicted * 28 + logKowUL * 4 + (ecount > 0) * 2 + (ucount > 0)
+    logKowUL = np.array(ultable, dtype=object)[category]
+    domainnotes = np.asarray(propagated_notes, dtype=object) + np.array(notetable, dtype=object)[category]
+    errorscale = np.where(~predicted & (ecount > 0) & (ucount == 0), 1, 1.25)
+    logKowerr *= errorscale
+
+    return np.round(logKow, round_digits), logKowUL, np.round(logKowerr, round_digits), domainnotes, citation, units, endpoint
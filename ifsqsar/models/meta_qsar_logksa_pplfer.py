@@ -1,5 +1,6 @@
 """Meta QSAR for logKsa"""
 import numpy as np
+from ifsqsar.models import empirical_leverage
 value_names = ('logKsa',)
 version = 1
 endpoint = 'Log of solvent-air partition coefficient - user-defined solvent'
@@ -16,7 +17,8 @@ chemical_inputs = {'solute min': 1, 'solute max': 1,
 solute_dependencies_list = [('E', 2), ('S', 2), ('A', 2), ('B', 2), ('V', 1), ('L', 2)]
 solvent_dependencies_list = [('E', 2), ('S', 2), ('A', 2), ('B', 2), ('V', 1), ('L', 2), ('s', 1), ('a', 1), ('b', 1), ('v', 1), ('l', 1), ('c', 1), ('state', 1)]
 component_dependencies_list = []
-propagated_domain_notes = ''
+dependency_reads = {'*': (0, 1, 2), 'E': (0, 1, 2), 'S': (0, 1, 2), 'A': (0, 1, 2), 'B': (0, 1, 2), 'V': (0,),
+                    'L': (0, 1, 2), 'state': (3,)}
 smiles_flag = 'neutrals'
 
 emptrainset = np.array([[0, 0, 0, 0, 2.363, 7.714],
@@ -86,7 +88,6 @@ emptrainset = np.array([[0, 0, 0, 0, 2.363, 7.714],
                         [0.47, 1.31, 0.64, 0.57, 0.365, 2.447],
                         [0.4, 0.9, 0.58, 0.78, 0.5078, 2.661]
                         ], dtype=float)
-xtxi = np.linalg.inv(np.matmul(emptrainset.T, emptrainset))
 
 stored = {}
 
@@ -148,9 +149,32 @@ def aggregateUL(ULlist, roundup=False):
     return ULtot
 
 
-def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf):
-    # determine if the solvent is a liquid
-    domainnotes = [propagated_domain_notes]
+def solute_ul(solutedependencies):
+    """Calculate the aggregate UL of the solute descriptors"""
+    # calculate aggregate UL of solute descriptors
+    ULlist = []
+    for sltdes in ['S', 'A', 'B', 'L']:
+        if solutedependencies[0][sltdes][1] in ['E', 'U']:
+            ULlist.append(solutedependencies[0][sltdes][1])
+        elif solutedependencies[0][sltdes][1] < 4:
+            ULlist.append(solutedependencies[0][sltdes][1])
+        elif solutedependencies[0][sltdes][1] == 4 and sltdes != 'L':
+            ULlist.append(1)
+        elif solutedependencies[0][sltdes][1] == 4 and sltdes == 'L':
+            ULlist.append(2)
+        elif solutedependencies[0][sltdes][1] == 5:
+            ULlist.append(5)
+        elif solutedependencies[0][sltdes][1] == 6:
+            ULlist.append(3)
+    ULslt = aggregateUL(ULlist)
+    return ULslt
+
+
+def solvent_parameters(solventdependencies):
+    """Calculate the system parameters of a solvent from its dependencies, returns the values and errors of
+    s, a, b, v, l and c, the aggregate UL of the system parameters, the error scaling for the solvent phase
+    and the solvent domain notes"""
+    domainnotes = []
     # calculate leverage of the solvent vs. the empirical correlations training dataset
     x = np.array([solventdependencies[0]['E'][0],
                   solventdependencies[0]['S'][0],
@@ -158,7 +182,7 @@ def calculate(solutedependencies, solventdependencies, componentdependencies, so
                   solventdependencies[0]['B'][0],
                   solventdependencies[0]['V'][0],
                   solventdependencies[0]['L'][0]])
-    leverage = np.matmul(np.matmul(x, xtxi), x.T)
+    leverage = empirical_leverage(x, emptrainset)
     if leverage < 1.5 * 6 / 66:
         ULemptra = 0
     elif leverage < 3 * 6 / 66:
@@ -189,22 +213,6 @@ def calculate(solutedependencies, solventdependencies, componentdependencies, so
     else:
         domainnotes.append('solvent phase: unclassified, prediction error scaling = 2')
         phaseerrorscaling = 2
-    # calculate aggregate UL of solute descriptors
-    ULlist = []
-    for sltdes in ['S', 'A', 'B', 'L']:
-        if solutedependencies[0][sltdes][1] in ['E', 'U']:
-            ULlist.append(solutedependencies[0][sltdes][1])
-        elif solutedependencies[0][sltdes][1] < 4:
-            ULlist.append(solutedependencies[0][sltdes][1])
-        elif solutedependencies[0][sltdes][1] == 4 and sltdes != 'L':
-            ULlist.append(1)
-        elif solutedependencies[0][sltdes][1] == 4 and sltdes == 'L':
-            ULlist.append(2)
-        elif solutedependencies[0][sltdes][1] == 5:
-            ULlist.append(5)
-        elif solutedependencies[0][sltdes][1] == 6:
-            ULlist.append(3)
-    ULslt = aggregateUL(ULlist)
     # calculate aggregate UL of system parameters from QSPRs
     ULlist = []
     for slvpar in ['s', 'a', 'b', 'v', 'l', 'c']:
@@ -402,29 +410,18 @@ def calculate(solutedependencies, solventdependencies, componentdependencies, so
     cemperr = cemperr**0.5
     # calculate aggregate UL of empirical system parameters
     ULslvemp = aggregateUL([sempul, aempul, bempul, vempul, lempul, cempul])
-    # choose which method to use for system parameters and calculate logKsa, aggregate UL and error
+    # choose which method to use for system parameters
     if type(ULslvqspr) is str or (type(ULslvqspr) is not str and type(ULslvemp) is not str and ULslvqspr < aggregateUL([ULslvemp, ULemptra])):
         if type(ULslvqspr) is str:
             domainnotes.append('system parameters: experimental or user values')
         else:
             domainnotes.append('system parameters: QSPRs applied')
-        logKsa = solutedependencies[0]['S'][0] * solventdependencies[0]['s'][0] + \
-                 solutedependencies[0]['A'][0] * solventdependencies[0]['a'][0] + \
-                 solutedependencies[0]['B'][0] * solventdependencies[0]['b'][0] + \
-                 solutedependencies[0]['V'][0] * solventdependencies[0]['v'][0] + \
-                 solutedependencies[0]['L'][0] * solventdependencies[0]['l'][0] + \
-                 solventdependencies[0]['c'][0]
-        logKsaUL = aggregateUL([ULslt, ULslvqspr], roundup=True)
-        logKsaerr = (solutedependencies[0]['V'][0]*solventdependencies[0]['v'][2])**2 + \
-                    (solutedependencies[0]['L'][0]*solventdependencies[0]['l'][0])**2 * ((solutedependencies[0]['L'][2]/solutedependencies[0]['L'][0])**2 + (solventdependencies[0]['l'][2]/solventdependencies[0]['l'][0])**2) + \
-                    solventdependencies[0]['c'][2]**2
-        if solutedependencies[0]['S'][0] != 0 and solventdependencies[0]['s'][0] != 0:
-            logKsaerr += (solutedependencies[0]['S'][0]*solventdependencies[0]['s'][0])**2 * ((solutedependencies[0]['S'][2]/solutedependencies[0]['S'][0])**2 + (solventdependencies[0]['s'][2]/solventdependencies[0]['s'][0])**2)
-        if solutedependencies[0]['A'][0] != 0 and solventdependencies[0]['a'][0] != 0:
-            logKsaerr += (solutedependencies[0]['A'][0]*solventdependencies[0]['a'][0])**2 * ((solutedependencies[0]['A'][2]/solutedependencies[0]['A'][0])**2 + (solventdependencies[0]['a'][2]/solventdependencies[0]['a'][0])**2)
-        if solutedependencies[0]['B'][0] != 0 and solventdependencies[0]['b'][0] != 0:
-            logKsaerr += (solutedependencies[0]['B'][0]*solventdependencies[0]['b'][0])**2 * ((solutedependencies[0]['B'][2]/solutedependencies[0]['B'][0])**2 + (solventdependencies[0]['b'][2]/solventdependencies[0]['b'][0])**2)
-        logKsaerr = logKsaerr**0.5
+        systemvalues = []
+        systemerrors = []
+        for slvpar in ['s', 'a', 'b', 'v', 'l', 'c']:
+            systemvalues.append(solventdependencies[0][slvpar][0])
+            systemerrors.append(solventdependencies[0][slvpar][2])
+        ULslv = ULslvqspr
     else:
         if type(ULslvemp) is str:
             domainnotes.append('system parameters: experimental or user solute descriptors plus empirical correlations applied')
@@ -436,22 +433,103 @@ def calculate(solutedependencies, solventdependencies, componentdependencies, so
             if ULemptra > 1:
                 domainnotes.append('solute descriptors out of AD of empirical correlations')
             ULslvemp = aggregateUL([ULslvemp, ULemptra])
-        logKsa = solutedependencies[0]['S'][0] * semp + \
-                 solutedependencies[0]['A'][0] * aemp + \
-                 solutedependencies[0]['B'][0] * bemp + \
-                 solutedependencies[0]['V'][0] * vemp + \
-                 solutedependencies[0]['L'][0] * lemp + \
-                 cemp
-        logKsaUL = aggregateUL([ULslt, ULslvemp], roundup=True)
-        logKsaerr = (solutedependencies[0]['V'][0]*vemperr)**2 + \
-                    (solutedependencies[0]['L'][0]*lemp)**2 * ((solutedependencies[0]['L'][2]/solutedependencies[0]['L'][0])**2 + (lemperr/lemp)**2) + \
-                    cemperr**2
-        if solutedependencies[0]['S'][0] != 0 and semp != 0:
-            logKsaerr += (solutedependencies[0]['S'][0]*semp)**2 * ((solutedependencies[0]['S'][2]/solutedependencies[0]['S'][0])**2 + (semperr/semp)**2)
-        if solutedependencies[0]['A'][0] != 0 and aemp != 0:
-            logKsaerr += (solutedependencies[0]['A'][0]*aemp)**2 * ((solutedependencies[0]['A'][2]/solutedependencies[0]['A'][0])**2 + (aemperr/aemp)**2)
-        if solutedependencies[0]['B'][0] != 0 and bemp != 0:
-            logKsaerr += (solutedependencies[0]['B'][0]*bemp)**2 * ((solutedependencies[0]['B'][2]/solutedependencies[0]['B'][0])**2 + (bemperr/bemp)**2)
-        logKsaerr = logKsaerr**0.5
+        systemvalues = [semp, aemp, bemp, vemp, lemp, cemp]
+        systemerrors = [semperr, aemperr, bemperr, vemperr, lemperr, cemperr]
+        ULslv = ULslvemp
+    return systemvalues, systemerrors, ULslv, phaseerrorscaling, domainnotes
+
+
+def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf, propagated_domain_notes=''):
+    # calculate the system parameters of the solvent and the aggregate UL of the solute
+    systemvalues, systemerrors, ULslv, phaseerrorscaling, solventnotes = solvent_parameters(solventdependencies)
+    s, a, b, v, l, c = systemvalues
+    serr, aerr, berr, verr, lerr, cerr = systemerrors
+    ULslt = solute_ul(solutedependencies)
+    domainnotes = [propagated_domain_notes] + solventnotes
+    # calculate logKsa, aggregate UL and error
+    logKsa = solutedependencies[0]['S'][0] * s + \
+             solutedependencies[0]['A'][0] * a + \
+             solutedependencies[0]['B'][0] * b + \
+             solutedependencies[0]['V'][0] * v + \
+             solutedependencies[0]['L'][0] * l + \
+             c
+    logKsaUL = aggregateUL([ULslt, ULslv], roundup=True)
+    logKsaerr = (solutedependencies[0]['V'][0]*verr)**2 + \
+                (solutedependencies[0]['L'][0]*l)**2 * ((solutedependencies[0]['L'][2]/solutedependencies[0]['L'][0])**2 + (lerr/l)**2) + \
+                cerr**2
+    if solutedependencies[0]['S'][0] != 0 and s != 0:
+        logKsaerr += (solutedependencies[0]['S'][0]*s)**2 * ((solutedependencies[0]['S'][2]/solutedependencies[0]['S'][0])**2 + (serr/s)**2)
+    if solutedependencies[0]['A'][0] != 0 and a != 0:
+        logKsaerr += (solutedependencies[0]['A'][0]*a)**2 * ((solutedependencies[0]['A'][2]/solutedependencies[0]['A'][0])**2 + (aerr/a)**2)
+    if solutedependencies[0]['B'][0] != 0 and b != 0:
+        logKsaerr += (solutedependencies[0]['B'][0]*b)**2 * ((solutedependencies[0]['B'][2]/solutedependencies[0]['B'][0])**2 + (berr/b)**2)
+    logKsaerr = logKsaerr**0.5
     return [round(logKsa, round_digits)], [logKsaUL], [round(phaseerrorscaling * logKsaerr, round_digits)], '; '.join(domainnotes), citation, units, endpoint
 
+
+def calculate_matrix(solutedependencies, solventdependencies, solutenotes, solventnotes):
+    """Calculate logKsa for every pair of solute and solvent, the system parameters of each solvent are calculated once.
+    Takes lists of dependency dicts and of propagated domain notes for the solutes and the solvents, returns 2D arrays
+    of predictions, ULs, errors and domain notes with the solutes in rows and the solvents in columns"""
+    # solute descriptors as column vectors
+    descriptors = {}
+    descriptorerrors = {}
+    for sltdes in ['S', 'A', 'B', 'V', 'L']:
+        descriptors[sltdes] = np.array([sd[sltdes][0] for sd in solutedependencies], dtype=float)[:, np.newaxis]
+        descriptorerrors[sltdes] = np.array([sd[sltdes][2] for sd in solutedependencies], dtype=float)[:, np.newaxis]
+    # system parameters as row vectors
+    systemvalues = []
+    systemerrors = []
+    ULslv = []
+    phaseerrorscaling = []
+    solventdomainnotes = []
+    for sd in solventdependencies:
+        values, errors, ul, scaling, notes = solvent_parameters([sd])
+        systemvalues.append(values)
+        systemerrors.append(errors)
+        ULslv.append(ul)
+        phaseerrorscaling.append(scaling)
+        solventdomainnotes.append(notes)
+    s, a, b, v, l, c = np.array(systemvalues, dtype=float).reshape(-1, 6).T[:, np.newaxis, :]
+    serr, aerr, berr, verr, lerr, cerr = np.array(systemerrors, dtype=float).reshape(-1, 6).T[:, np.newaxis, :]
+    phaseerrorscaling = np.array(phaseerrorscaling, dtype=float)[np.newaxis, :]
+    # calculate logKsa and error as outer products in the same order as calculate
+    logKsa = descriptors['S'] * s + \
+             descriptors['A'] * a + \
+             descriptors['B'] * b + \
+             descriptors['V'] * v + \
+             descriptors['L'] * l + \
+             c
+    with np.errstate(divide='ignore', invalid='ignore'):
+        logKsaerr = (descriptors['V']*verr)**2 + \
+                    (descriptors['L']*l)**2 * ((descriptorerrors['L']/descriptors['L'])**2 + (lerr/l)**2) + \
+                    cerr**2
+        for sltdes, slvpar, slvparerr in (('S', s, serr), ('A', a, aerr), ('B', b, berr)):
+            logKsaerr += np.where((descriptors[sltdes] != 0) & (slvpar != 0),
+                                  (descriptors[sltdes]*slvpar)**2 * ((descriptorerrors[sltdes]/descriptors[sltdes])**2 + (slvparerr/slvpar)**2),
+                                  0)
+        logKsaerr = logKsaerr**0.5
+    # aggregate ULs once for each unique pair of solute and solvent ULs
+    ULslt = [solute_ul([sd]) for sd in solutedependencies]
+    uniqueslt = []
+    for ul in ULslt:
+        if ul not in uniqueslt:
+            uniqueslt.append(ul)
+    uniqueslv = []
+    for ul in ULslv:
+        if ul not in uniqueslv:
+            uniqueslv.append(ul)
+    ultable = np.empty((len(uniqueslt), len(uniqueslv)), dtype=object)
+    for i in range(len(uniqueslt)):
+        for j in range(len(uniqueslv)):
+            ultable[i, j] = aggregateUL([uniqueslt[i], uniqueslv[j]], roundup=True)
+    sltindex = np.array([uniqueslt.index(ul) for ul in ULslt], dtype=int)[:, np.newaxis]
+    slvindex = np.array([uniqueslv.index(ul) for ul in ULslv], dtype=int)[np.newaxis, :]
+    logKsaUL = ultable[sltindex, slvindex]
+    # join the propagated notes of the solute and the solvent with the solvent domain notes
+    solutenotes = np.array(solutenotes, dtype=object)[:, np.newaxis]
+    solventpropagated = np.array(solventnotes, dtype=object)[np.newaxis, :]
+    solventdomainnotes = np.array([''.join(['; ', '; '.join(notes)]) for notes in solventdomainnotes], dtype=object)[np.newaxis, :]
+    separator = np.where((solutenotes != '') & (solventpropagated != ''), '; ', '').astype(object)
+    domainnotes = solutenotes + separator + solventpropagated + solventdomainnotes
+    return np.round(logKsa, round_digits), logKsaUL, np.round(phaseerrorscaling * logKsaerr, round_digits), domainnotes, citation, units, endpoint
@@ -1,5 +1,6 @@
 """Meta QSAR for state"""
 import numpy as np
+from ifsqsar.models import empirical_leverage
 value_names = ('state',)
 version = 1
 endpoint = 'Chemical state at room temperature (25degC)'
@@ -25,7 +26,8 @@ chemical_inputs = {'solute min': 1, 'solute max': 1,
 solute_dependencies_list = [('E', 2), ('S', 2), ('A', 2), ('B', 2), ('V', 1), ('L', 2), ('tmconsensus', 1), ('tbpplfer', 1)]
 solvent_dependencies_list = []
 component_dependencies_list = []
-propagated_domain_notes = ''
+dependency_reads = {'*': (1,), 'E': (0,), 'S': (0,), 'A': (0,), 'B': (0,), 'V': (0,), 'L': (0,), 'tmconsensus': (0, 2),
+                    'tbpplfer': (0, 2)}
 smiles_flag = 'neutrals'
 
 emptrainset = np.array([[1.01, 0.94, 0, 0.2, 1.0323, 4.68],
@@ -1384,7 +1386,6 @@ emptrainset = np.array([[1.01, 0.94, 0, 0.2, 1.0323, 4.68],
                         [-1.04, 0.17, 0.62, 0.31, 1.7846, 2.96],
                         [-0.3, 0.18, 0.69, 0.11, 0.8548, 1.937],
                         ], dtype=float)
-xtxi = np.linalg.inv(np.matmul(emptrainset.T, emptrainset))
 
 stored = {'O': (np.nan, np.nan, np.nan, 'likely liquid', 'well known value', units, endpoint)}
 
@@ -1446,7 +1447,7 @@ def aggregateUL(ULlist, roundup=False):
     return ULtot
 
 
-def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf):
+def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf, propagated_domain_notes=''):
     # calculate leverage of the solvent vs. the empirical correlations training dataset
     x = np.array([solutedependencies[0]['E'][0],
                   solutedependencies[0]['S'][0],
@@ -1454,7 +1455,7 @@ def calculate(solutedependencies, solventdependencies, componentdependencies, so
                   solutedependencies[0]['B'][0],
                   solutedependencies[0]['V'][0],
                   solutedependencies[0]['L'][0]])
-    leverage = np.matmul(np.matmul(x, xtxi), x.T)
+    leverage = empirical_leverage(x, emptrainset)
     if leverage < 1.5 * 6 / 1355:
         ULliqset = 0
     elif leverage < 3 * 6 / 1355:
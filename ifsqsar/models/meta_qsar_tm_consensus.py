@@ -21,12 +21,12 @@ chemical_inputs = {'solute min': 1, 'solute max': 1,
 solute_dependencies_list = ['tm', 'tmpplfer']
 solvent_dependencies_list = []
 component_dependencies_list = []
-propagated_domain_notes = ''
+dependency_reads = {'*': (1,), 'tm': (0, 1, 2), 'tmpplfer': (0, 1, 2)}
 smiles_flag = 'neutrals'
 
 stored = {}
 
-def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf):
+def calculate(solutedependencies, solventdependencies, componentdependencies, solutef, solventf, componentf, propagated_domain_notes=''):
     tmUL = solutedependencies[0]['tm'][1]
     if tmUL == 4:
         tmUL = 2
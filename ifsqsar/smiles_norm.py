@@ -6,60 +6,317 @@ Implements a function that takes a SMILES and converts it to a standardized form
 
 from openbabel import openbabel as ob
 import re
+import threading
+from collections import OrderedDict
 
 class IFSMol(ob.OBMol):
     """Subclass of openbabel OBMol. Contains additional data fields
     used in the QSARModel and METAQSARModel classes"""
-    def __init__(self):
+    def __init__(self, mol=None):
         self.normsmiles = ''
         self.sminote = ''
         self.neutralize = None
         self.filter = ''
-        super(IFSMol, self).__init__()
-
-
-# initialize smarts for handling silicon implicit hydrogens
-silicon3 = ob.OBSmartsPattern()
-silicon3.Init('[#14v3H0]')
-silicon2 = ob.OBSmartsPattern()
-silicon2.Init('[#14v2H0]')
-silicon1 = ob.OBSmartsPattern()
-silicon1.Init('[#14v1H0]')
-silicon0 = ob.OBSmartsPattern()
-silicon0.Init('[#14v0H0]')
-
-# initialize smarts for handling isocyanides
-isocyanide = ob.OBSmartsPattern()
-isocyanide.Init('[CD1-]#[O,N;+]')
-
-# initialize smarts for handling azides
-azide = ob.OBSmartsPattern()
-azide.Init('[N-]=[N+]=N')
-
-# initialize smarts for finding atoms with any charge
-chargedsmarts = ob.OBSmartsPattern()
-chargedsmarts.Init('[*!+0]')
-
-# initialize smarts for organic structure filters
-anyatom = ob.OBSmartsPattern()
-anyatom.Init('[*]')
-organicatom = ob.OBSmartsPattern()
-organicatom.Init('[#1,#5,#6,#7,#8,#9,#14,#15,#16,#17,#35,#53]')
-carbonatom = ob.OBSmartsPattern()
-carbonatom.Init('[#6]')
-inorganicatom = ob.OBSmartsPattern()
-inorganicatom.Init('[!#1H0]')
-organometallicatom = ob.OBSmartsPattern()
-organometallicatom.Init('[H0!$([#1,#5,#6,#7,#8,#9,#14,#15,#16,#17,#35,#53])$(*~[#6])!$(*~[!#6])]')
+        if mol is None:
+            super(IFSMol, self).__init__()
+        else:
+            # copy the structure and data fields of the passed IFSMol
+            super(IFSMol, self).__init__(mol)
+            self.normsmiles = mol.normsmiles
+            self.sminote = mol.sminote
+            self.neutralize = mol.neutralize
+            self.filtertype = getattr(mol, 'filtertype', '')
+
+
+# smarts are compiled by _init_smarts on the first call to convertsmiles, not at import
+silicon3 = None
+silicon2 = None
+silicon1 = None
+silicon0 = None
+isocyanide = None
+azide = None
+chargedsmarts = None
+anyatom = None
+organicatom = None
+carbonatom = None
+inorganicatom = None
+organometallicatom = None
+
+
+def _init_smarts():
+    """Compile the module-level SMARTS patterns used by convertsmiles, only done once"""
+    global silicon3, silicon2, silicon1, silicon0, isocyanide, azide, chargedsmarts
+    global anyatom, organicatom, carbonatom, inorganicatom, organometallicatom
+    if organometallicatom is not None:
+        return
+
+    # initialize smarts for handling silicon implicit hydrogens
+    silicon3 = ob.OBSmartsPattern()
+    silicon3.Init('[#14v3H0]')
+    silicon2 = ob.OBSmartsPattern()
+    silicon2.Init('[#14v2H0]')
+    silicon1 = ob.OBSmartsPattern()
+    silicon1.Init('[#14v1H0]')
+    silicon0 = ob.OBSmartsPattern()
+    silicon0.Init('[#14v0H0]')
+
+    # initialize smarts for handling isocyanides
+    isocyanide = ob.OBSmartsPattern()
+    isocyanide.Init('[CD1-]#[O,N;+]')
+
+    # initialize smarts for handling azides
+    azide = ob.OBSmartsPattern()
+    azide.Init('[N-]=[N+]=N')
+
+    # initialize smarts for finding atoms with any charge
+    chargedsmarts = ob.OBSmartsPattern()
+    chargedsmarts.Init('[*!+0]')
+
+    # initialize smarts for organic structure filters
+    anyatom = ob.OBSmartsPattern()
+    anyatom.Init('[*]')
+    organicatom = ob.OBSmartsPattern()
+    organicatom.Init('[#1,#5,#6,#7,#8,#9,#14,#15,#16,#17,#35,#53]')
+    carbonatom = ob.OBSmartsPattern()
+    carbonatom.Init('[#6]')
+    inorganicatom = ob.OBSmartsPattern()
+    inorganicatom.Init('[!#1H0]')
+    # assigned last, it is the flag checked above that the patterns are ready
+    organometallicatom = ob.OBSmartsPattern()
+    organometallicatom.Init('[H0!$([#1,#5,#6,#7,#8,#9,#14,#15,#16,#17,#35,#53])$(*~[#6])!$(*~[!#6])]')
 
 
 # initialize re for matching aromatic atoms
 aromatch = re.compile('(?<!\[[A-Z])[cnosp]')
 
+# the module-level smarts keep the results of their last match, so SMILES are converted one at a time
+_smarts_lock = threading.Lock()
+
+# maximum number of input SMILES whose normalized forms are memoized, 0 turns the memo off and None keeps all
+memo_size = 10000
+
+# memo of normalized IFSMols keyed by input SMILES, neutralize and filtertype, least recently used first
+_memo = OrderedDict()
+_memo_stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'storehits': 0}
+
+# optional persistent store of normalized SMILES, see open_normalization_store
+_normalization_store = None
+# seconds a connection to the store waits for the writes of other processes before failing
+store_timeout = 60.0
+
+
+class NormalizationStore:
+    """SQLite file of normalized SMILES and notes that persists between sessions
+
+    Normalizations are keyed by the input SMILES, neutralize, filtertype and the openbabel version, the IFSMol
+    is rebuilt from the normalized SMILES. New normalizations are written in batches of flushsize.
+    """
+
+    def __init__(self, filename, flushsize=1000):
+        """Open or create the SQLite file"""
+        # only needed when a persistent store is used
+        import sqlite3
+        self.filename = filename
+        self.flushsize = flushsize
+        self.fingerprint = ''.join(['openbabel ', ob.OBReleaseVersion()])
+        self.pending = {}
+        self.lock = threading.Lock()
+        # worker processes of iter_apply_qsars write to the same file, wait for their writes instead of failing
+        self.connection = sqlite3.connect(filename, timeout=store_timeout, check_same_thread=False)
+        self.connection.execute('CREATE TABLE IF NOT EXISTS normalizations (smiles TEXT, neutralize INTEGER, filtertype TEXT, '
+                                'fingerprint TEXT, normsmiles TEXT, sminote TEXT, '
+                                'PRIMARY KEY (smiles, neutralize, filtertype, fingerprint))')
+        self.connection.commit()
+
+    def get(self, key):
+        """Return the normalized SMILES and note of a (smiles, neutralize, filtertype) key or None"""
+        with self.lock:
+            if key in self.pending:
+                return self.pending[key]
+            row = self.connection.execute('SELECT normsmiles, sminote FROM normalizations '
+                                          'WHERE smiles=? AND neutralize=? AND filtertype=? AND fingerprint=?',
+                                          (key[0], int(bool(key[1])), key[2], self.fingerprint)).fetchone()
+        if row is None:
+            return None
+        return row[0], row[1]
+
+    def put(self, key, normsmiles, sminote):
+        """Add a normalization, it is written with the next flush"""
+        with self.lock:
+            self.pending[key] = (normsmiles, sminote)
+            if len(self.pending) >= self.flushsize:
+                self._flush()
+
+    def flush(self):
+        """Write all pending normalizations to the file"""
+        with self.lock:
+            self._flush()
+
+    def _flush(self):
+        """Write all pending normalizations, called while holding the lock"""
+        if len(self.pending) == 0:
+            return
+        self.connection.executemany('INSERT OR REPLACE INTO normalizations VALUES (?, ?, ?, ?, ?, ?)',
+                                    [(k[0], int(bool(k[1])), k[2], self.fingerprint, v[0], v[1])
+                                     for k, v in self.pending.items()])
+        self.connection.commit()
+        self.pending = {}
+
+    def close(self):
+        """Flush and close the file"""
+        self.flush()
+        self.connection.close()
+
+
+def open_normalization_store(filename, flushsize=1000):
+    """Open a persistent store of normalized SMILES that convertsmiles reads from and writes to, and return it
+
+    Required Arguments:
+        filename -- name of the SQLite file, created if it does not exist
+
+    Optional Arguments:
+        flushsize -- number of new normalizations written to the file at a time, default=1000
+    """
+    global _normalization_store
+    close_normalization_store()
+    _normalization_store = NormalizationStore(filename, flushsize)
+    return _normalization_store
+
+
+def close_normalization_store():
+    """Write pending normalizations and close the persistent store of normalized SMILES, if one is open"""
+    global _normalization_store
+    if _normalization_store is not None:
+        _normalization_store.close()
+        _normalization_store = None
+
+
+# memo of identity keys by normalized SMILES, limited to memo_size
+_identities = OrderedDict()
+_identity_lock = threading.Lock()
+_identity_conversion = None
+
+
+def identity_key(normsmiles):
+    """Return a non-standard InChIKey that identifies the chemical of a normalized SMILES, or '' if there is none.
+    Fixed hydrogens keep tautomers apart and metals stay connected, the key does not depend on the SMILES writer."""
+    global _identity_conversion
+    if normsmiles == '':
+        return ''
+    with _identity_lock:
+        if normsmiles in _identities:
+            _identities.move_to_end(normsmiles)
+            return _identities[normsmiles]
+        # one OBConversion is kept for the InChIKeys, used by one thread at a time
+        if _identity_conversion is None:
+            _identity_conversion = ob.OBConversion()
+            _identity_conversion.SetInAndOutFormats('smi', 'inchi')
+            _identity_conversion.AddOption('K', _identity_conversion.OUTOPTIONS)
+            _identity_conversion.AddOption('w', _identity_conversion.OUTOPTIONS)
+            _identity_conversion.AddOption('X', _identity_conversion.OUTOPTIONS, 'FixedH RecMet')
+        # warnings were already shown when the SMILES was normalized, they are not repeated for the key
+        level = ob.obErrorLog.GetOutputLevel()
+        ob.obErrorLog.SetOutputLevel(ob.obError)
+        mol = ob.OBMol()
+        if _identity_conversion.ReadString(mol, normsmiles) and mol.NumAtoms() > 0:
+            key = _identity_conversion.WriteString(mol).strip()
+        else:
+            key = ''
+        ob.obErrorLog.SetOutputLevel(level)
+        if memo_size != 0:
+            _identities[normsmiles] = key
+            while memo_size is not None and len(_identities) > memo_size:
+                _identities.popitem(last=False)
+    return key
+
+
+def set_memo_size(maxsize):
+    """Set the maximum number of memoized normalizations, 0 turns the memo off and None keeps all of them"""
+    global memo_size
+    with _smarts_lock:
+        memo_size = maxsize
+        _trim_memo()
+
+
+def get_memo_stats():
+    """Return a dict of the size, maximum size, hits, misses, evictions and persistent store hits of the memo"""
+    with _smarts_lock:
+        stats = {'size': len(_memo), 'maxsize': memo_size}
+        stats.update(_memo_stats)
+    return stats
+
+
+def clear_memo():
+    """Empty the memo of normalized SMILES and reset its counters"""
+    with _smarts_lock:
+        _memo.clear()
+        for stat in _memo_stats:
+            _memo_stats[stat] = 0
+
+
+def _trim_memo():
+    """Evict the least recently used normalizations beyond memo_size, called while holding the lock"""
+    if memo_size is None:
+        return
+    while len(_memo) > memo_size:
+        _memo.popitem(last=False)
+        _memo_stats['evictions'] += 1
+
+
+def _rebuild_mol(normsmiles, sminote, neutralize, filtertype, obconversion):
+    """Rebuild the normalized IFSMol from a normalized SMILES read from the persistent store"""
+    mol = IFSMol()
+    mol.neutralize = neutralize
+    mol.filtertype = filtertype
+    mol.sminote = sminote
+    if normsmiles != '':
+        if obconversion is None:
+            obconversion = ob.OBConversion()
+        obconversion.SetInAndOutFormats('smi', 'can')
+        obconversion.ReadString(mol, normsmiles)
+        mol.normsmiles = normsmiles
+    return mol
+
+
 def convertsmiles(smiles, obconversion=None, neutralize=True, filtertype='not inorganic'):
     """Converts passed SMILES to a normalized form.
     Returns the new OBMol, a normalized SMILES string and notes on changes made.
-    An existing OBConversion instance can be passed so that one does not need to instantiated."""
+    An existing OBConversion instance can be passed so that one does not need to instantiated.
+    Normalizations are memoized, a repeated SMILES returns a copy of the memoized OBMol."""
+    key = (smiles, neutralize, filtertype)
+    with _smarts_lock:
+        # return a copy of a memoized normalization, models add and delete hydrogens on the mol they are passed
+        if memo_size != 0:
+            memomol = _memo.get(key)
+            if memomol is not None:
+                _memo.move_to_end(key)
+                _memo_stats['hits'] += 1
+                mol = IFSMol(memomol)
+                return mol, mol.normsmiles, mol.sminote
+            _memo_stats['misses'] += 1
+        # look in the persistent store before normalizing
+        stored = None
+        if _normalization_store is not None:
+            stored = _normalization_store.get(key)
+        if stored is not None:
+            _memo_stats['storehits'] += 1
+            mol = _rebuild_mol(stored[0], stored[1], neutralize, filtertype, obconversion)
+        else:
+            mol, normsmiles, sminote = _convertsmiles(smiles, obconversion, neutralize, filtertype)
+            if _normalization_store is not None:
+                _normalization_store.put(key, normsmiles, sminote)
+        # memoize a private copy of the normalized mol
+        if memo_size != 0:
+            _memo[key] = IFSMol(mol)
+            _trim_memo()
+    return mol, mol.normsmiles, mol.sminote
+
+
+def _convertsmiles(smiles, obconversion, neutralize, filtertype):
+    """Convert SMILES to a normalized form, called by convertsmiles while holding the lock"""
+
+    # compile smarts patterns if this is the first call
+    _init_smarts()
 
     # instantiate IFSMol
     mol = IFSMol()
@@ -0,0 +1,31 @@
+"""
+tests/test_arrays.py
+ULs in the arrays format of apply_qsars_to_molecule_list
+Run from the repository root:
+python -m pytest tests
+"""
+
+import pytest
+
+from ifsqsar import ifsqsar, models
+
+
+def test_user_ul_any_order():
+    """User-defined ULs with the flags and the number in any order are coded, combined ULs come back as E, U, number"""
+    models.MW.load()
+    models.MW.set_stored('CCO', 1.0, ul='2E')
+    models.MW.set_stored('CCCO', 2.0, ul='UE')
+    try:
+        result = ifsqsar.apply_qsars_to_molecule_list([models.MW], ['CCO', 'CCCO'], values=('qsarpred', 'UL'),
+                                                      outformat='arrays')
+    finally:
+        models.MW.remove_stored('CCO')
+        models.MW.remove_stored('CCCO')
+    assert result.decode('MW UL') == ['E2', 'EU']
+    assert list(result.arrays['MW qsarpred']) == [1.0, 2.0]
+
+
+def test_user_ul_two_numbers():
+    """A UL with two numbers is not a UL"""
+    with pytest.raises(ValueError):
+        models.MW.set_stored('CCO', 1.0, ul='23')
@@ -0,0 +1,42 @@
+"""
+tests/test_input.py
+Reading of delimited input files by apply_qsars_to_molecule_list
+Run from the repository root:
+python -m pytest tests
+"""
+
+import pytest
+
+from ifsqsar import ifsqsar, models
+
+# names with an unbalanced quote and a quoted word, common in inventory files
+quotedrows = ['name\tSMILES\tcas',
+              '"ethanol\tCCO\t64-17-5',
+              'benzene\tc1ccccc1\t71-43-2',
+              '"acetic" acid\tCC(=O)O\t64-19-7',
+              'water\tO\t7732-18-5']
+
+
+def test_stray_quotes_keep_every_row(tmp_path):
+    """Quotes in a name column are kept as they are and every row is applied"""
+    infilename = tmp_path / 'in.tsv'
+    infilename.write_text('\n'.join(quotedrows) + '\n')
+    outfilename = tmp_path / 'out.tsv'
+    result = ifsqsar.apply_qsars_to_molecule_list([models.MW], infilename=str(infilename), values=('insmi',),
+                                                  outformat='dict')
+    assert result['insmi'] == ['CCO', 'c1ccccc1', 'CC(=O)O', 'O']
+    ifsqsar.apply_qsars_to_molecule_list([models.MW], infilename=str(infilename), values=('insmi',),
+                                         outfilename=str(outfilename))
+    # the kept input data of each row is followed by its own result
+    outlines = outfilename.read_text().split('\n')
+    assert outlines[0] == '\t'.join([quotedrows[0], 'insmi'])
+    assert outlines[1:] == ['\t'.join([line, line.split('\t')[1]]) for line in quotedrows[1:]]
+
+
+def test_quoting_error(tmp_path):
+    """Quoting that cannot be parsed is an error when quoted fields are parsed"""
+    infilename = tmp_path / 'in.tsv'
+    infilename.write_text('\n'.join(quotedrows) + '\n')
+    with pytest.raises(ValueError, match='row 2'):
+        ifsqsar.apply_qsars_to_molecule_list([models.MW], infilename=str(infilename), values=('insmi',),
+                                             inquoting=True)
@@ -0,0 +1,47 @@
+"""
+tests/test_parquet.py
+Parquet output of apply_qsars_to_molecule_list, the round trip is skipped if pyarrow is not installed
+Run from the repository root:
+python -m pytest tests
+"""
+
+import numpy as np
+import pytest
+
+from ifsqsar import ifsqsar, models
+
+
+def test_parquet_round_trip(tmp_path):
+    """The Parquet file holds the same values as the dict format, with null for missing values"""
+    pq = pytest.importorskip('pyarrow.parquet')
+    qsarlist = [models.MW, models.fhlb]
+    smileslist = ['CCO', 'CCCO', 'c1ccccc1', 'CCCCCCCCCC', 'not a smiles']
+    values = ('insmi', 'qsarpred', 'UL', 'error', 'ULnote')
+    # combined ULs of stored values must come back the same
+    ifsqsar.import_stored_values(qsarlist, smiles=['CCCO', 'c1ccccc1'], qsars='fhlb', values=[1.5, 2.5],
+                                 uls=['EU3', 'U2'])
+    try:
+        outfilename = str(tmp_path / 'out.parquet')
+        ifsqsar.apply_qsars_to_molecule_list(qsarlist, smileslist, values=values, outformat='parquet',
+                                             outfilename=outfilename)
+        table = pq.read_table(outfilename).to_pydict()
+        expected = ifsqsar.apply_qsars_to_molecule_list(qsarlist, smileslist, values=values, outformat='dict')
+    finally:
+        models.fhlb.remove_stored('CCCO')
+        models.fhlb.remove_stored('c1ccccc1')
+    assert table['insmi'] == smileslist
+    assert table['fhlb UL'][1:3] == ['EU3', 'U2']
+    for qsar in ('MW', 'fhlb'):
+        for val in ('qsarpred', 'error'):
+            column = table[' '.join([qsar, val])]
+            assert [x is None for x in column] == list(np.isnan(expected[qsar][val]))
+            assert [x for x in column if x is not None] == [x for x in expected[qsar][val] if not np.isnan(x)]
+        for val in ('UL', 'ULnote'):
+            column = table[' '.join([qsar, val])]
+            assert column == [None if type(x) != str and np.isnan(x) else str(x) for x in expected[qsar][val]]
+
+
+def test_parquet_needs_outfilename():
+    """Parquet output without an output file name is an error"""
+    with pytest.raises(ValueError):
+        ifsqsar.apply_qsars_to_molecule_list([models.MW], ['CCO'], outformat='parquet')
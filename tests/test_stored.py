@@ -0,0 +1,30 @@
+"""
+tests/test_stored.py
+Bulk import of user-entered stored values
+Run from the repository root:
+python -m pytest tests
+"""
+
+import pytest
+
+from ifsqsar import ifsqsar, models
+
+
+def test_import_bad_ul_adds_nothing():
+    """A bad UL in any row leaves the stored values of every QSAR unchanged"""
+    qsarlist = [models.fhlb, models.hhlb]
+    models.fhlb.load()
+    with pytest.raises(ValueError):
+        ifsqsar.import_stored_values(qsarlist, smiles=['CCCO', 'CCCCO'], qsars=['fhlb', 'hhlb'], values=[1, 2],
+                                     uls=['U', 'X'])
+    assert models.fhlb.model_namespace.stored.get('CCCO') is None
+
+
+def test_import_short_row(tmp_path):
+    """A row of the file with fewer fields than the header is reported by its row number"""
+    infilename = tmp_path / 'stored.tsv'
+    infilename.write_text('smiles\tqsar\tvalue\nCCCO\tfhlb\t1\nCCCCO\thhlb\n')
+    models.fhlb.load()
+    with pytest.raises(ValueError, match='Row 3'):
+        ifsqsar.import_stored_values([models.fhlb, models.hhlb], infilename=str(infilename))
+    assert models.fhlb.model_namespace.stored.get('CCCO') is None